@@ -1,12 +1,15 @@
 import sys
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                              QHBoxLayout, QLabel, QPushButton, QStackedWidget, QTableWidget, QTableWidgetItem,
-                              QHeaderView, QLineEdit, QMessageBox, QCheckBox)
+                              QHBoxLayout, QLabel, QPushButton, QStackedWidget, QTableView,
+                              QHeaderView, QLineEdit, QMessageBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from navigation_sidebar import NavigationSidebar
 from navbar_logic import nav_manager
-from tryDatabase import DatabaseSeeder
+from paged_table import KeysetTableModel
+from search_controller import SearchController
+from search_index import substring_match
+from tryDatabase import DatabaseSeeder, group_by_key, ARCHIVE_KEYS
 
 class ArchiveManager(QMainWindow):
     # Main window for our archive window 
@@ -181,19 +184,35 @@ class ArchiveManager(QMainWindow):
                 background-color: #f5f3ed;
             }
         """)
-        self.books_search.textChanged.connect(self.search_archived_books)
+        # Search as the user types, debounced and queried on a worker thread
+        self.books_search_controller = SearchController(
+            self.books_search, self.search_archived_books,
+            narrow=lambda book, text: substring_match(text, book.get('BookTitle'), book.get('ISBN'),
+                                                      book.get('Publisher'), book.get('BookDescription')))
+        self.books_search_controller.results.connect(lambda text, books: self.books_model.set_rows(books))
+        self.books_search_controller.cleared.connect(self.load_archived_books)
+        self.books_search_controller.failed.connect(lambda text, message: self.load_archived_books())  # Fallback to showing all
         search_layout.addWidget(self.books_search)
         
         
         layout.addLayout(search_layout)
         
-        # Books archive table with description removed
-        self.books_table = QTableWidget()
-        self.books_table.setColumnCount(9)  
-        self.books_table.setHorizontalHeaderLabels([
-            "Date Deleted","Book Code", "Title", "Author", "Genre", "ISBN", 
-            "Copies", "Shelf", "Select"
-        ])
+        # Books archive table with description removed, loaded a page at a time while scrolling
+        self.books_model = KeysetTableModel([
+            {"header": "Date Deleted", "value": lambda book: book.get('isDeleted', 'N/A')},
+            {"header": "Book Code", "value": lambda book: book.get('BookCode', '')},
+            {"header": "Title", "value": lambda book: book.get('BookTitle', 'N/A')},
+            {"header": "Author", "value": lambda book: book.get('Authors') or 'Unknown Author'},
+            {"header": "Genre", "value": lambda book: book.get('Genres') or 'Unknown Genre'},
+            {"header": "ISBN", "value": lambda book: book.get('ISBN', 'N/A')},
+            {"header": "Copies", "value": lambda book: book.get('BookTotalCopies', 'N/A'), "align": Qt.AlignCenter},
+            {"header": "Shelf", "value": lambda book: book.get('BookShelf') or 'No Shelf', "align": Qt.AlignCenter},
+            # Ticking the box restores the book
+            {"header": "Select", "checkable": True},
+        ], parent=self)
+        self.books_model.checked.connect(self.on_book_checked)
+        self.books_table = QTableView()
+        self.books_table.setModel(self.books_model)
 
         header = self.books_table.horizontalHeader()
         for i in range(8):  # First 7 columns stretch
@@ -202,8 +221,9 @@ class ArchiveManager(QMainWindow):
         self.books_table.setColumnWidth(7, 150)  
     
         self.books_table.verticalHeader().setVisible(False)
-        self.books_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.books_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.books_table.verticalHeader().setDefaultSectionSize(40)
+        self.books_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.books_table.setSelectionBehavior(QTableView.SelectRows)
         self.books_table.setAlternatingRowColors(True)
         self.books_table.setShowGrid(True)
         self.setup_table_style(self.books_table)
@@ -247,18 +267,32 @@ class ArchiveManager(QMainWindow):
                 background-color: white;
             }
         """)
-        self.members_search.textChanged.connect(self.search_archived_members)
+        self.members_search_controller = SearchController(
+            self.members_search, self.search_archived_members,
+            narrow=lambda member, text: substring_match(text, member.get('MemberFN'), member.get('MemberLN'),
+                                                        member.get('MemberMI'), member.get('MemberContact')))
+        self.members_search_controller.results.connect(lambda text, members: self.members_model.set_rows(members))
+        self.members_search_controller.cleared.connect(self.load_archived_members)
+        self.members_search_controller.failed.connect(lambda text, message: self.load_archived_members())  # Fallback to showing all
         search_layout.addWidget(self.members_search)
         
         
         layout.addLayout(search_layout)
         
-        # Members archive table with updated columns
-        self.members_table = QTableWidget()
-        self.members_table.setColumnCount(7)
-        self.members_table.setHorizontalHeaderLabels([
-          "Date Deleted",  "Member ID", "First Name", "Middle Name", "Last Name", "Contact Number", "Select"
-        ])
+        # Members archive table with updated columns, loaded a page at a time while scrolling
+        self.members_model = KeysetTableModel([
+            {"header": "Date Deleted", "value": lambda member: member.get('isDeleted', 'N/A')},
+            {"header": "Member ID", "value": lambda member: member.get('MemberID', 'N/A')},
+            {"header": "First Name", "value": lambda member: member.get('MemberFN', 'N/A')},
+            {"header": "Middle Name", "value": lambda member: member.get('MemberMI') or 'N/A'},
+            {"header": "Last Name", "value": lambda member: member.get('MemberLN', 'N/A')},
+            {"header": "Contact Number", "value": lambda member: member.get('MemberContact', 'N/A')},
+            # Ticking the box restores the member
+            {"header": "Select", "checkable": True},
+        ], parent=self)
+        self.members_model.checked.connect(self.on_member_checked)
+        self.members_table = QTableView()
+        self.members_table.setModel(self.members_model)
         
         
         header = self.members_table.horizontalHeader()
@@ -268,8 +302,9 @@ class ArchiveManager(QMainWindow):
         self.members_table.setColumnWidth(5, 150) 
     
         self.members_table.verticalHeader().setVisible(False)
-        self.members_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.members_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.members_table.verticalHeader().setDefaultSectionSize(40)
+        self.members_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.members_table.setSelectionBehavior(QTableView.SelectRows)
         self.members_table.setAlternatingRowColors(True)
         self.members_table.setShowGrid(True)
         self.setup_table_style(self.members_table)
@@ -312,17 +347,29 @@ class ArchiveManager(QMainWindow):
                 background-color: #f5f3ed;
             }
         """)
-        self.shelf_search.textChanged.connect(self.search_archived_shelves)
+        self.shelf_search_controller = SearchController(
+            self.shelf_search, self.search_archived_shelves,
+            narrow=lambda shelf, text: substring_match(text, shelf.get('ShelfName')))
+        self.shelf_search_controller.results.connect(lambda text, shelves: self.shelf_model.set_rows(shelves))
+        self.shelf_search_controller.cleared.connect(self.load_archived_shelves)
+        self.shelf_search_controller.failed.connect(lambda text, message: self.load_archived_shelves())  # Fallback to showing all
         search_layout.addWidget(self.shelf_search)
         
         
         layout.addLayout(search_layout)
        
-        self.shelf_table = QTableWidget()
-        self.shelf_table.setColumnCount(5)  
-        self.shelf_table.setHorizontalHeaderLabels([
-           "Date Deleted", "Shelf ID", "Shelf Name", "Librarian ID", "Select"
-        ])
+        # Shelves archive table, loaded a page at a time while scrolling
+        self.shelf_model = KeysetTableModel([
+            {"header": "Date Deleted", "value": lambda shelf: shelf.get('isDeleted', 'N/A'), "align": Qt.AlignCenter},
+            {"header": "Shelf ID", "value": lambda shelf: shelf.get('ShelfId', 'N/A'), "align": Qt.AlignCenter},
+            {"header": "Shelf Name", "value": lambda shelf: shelf.get('ShelfName', 'N/A'), "align": Qt.AlignCenter},
+            {"header": "Librarian ID", "value": lambda shelf: shelf.get('LibrarianID', 'N/A'), "align": Qt.AlignCenter},
+            # Ticking the box restores the shelf
+            {"header": "Select", "checkable": True},
+        ], parent=self)
+        self.shelf_model.checked.connect(self.on_shelf_checked)
+        self.shelf_table = QTableView()
+        self.shelf_table.setModel(self.shelf_model)
 
         header = self.shelf_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  
@@ -333,8 +380,9 @@ class ArchiveManager(QMainWindow):
         self.shelf_table.setColumnWidth(2, 150) 
 
         self.shelf_table.verticalHeader().setVisible(False)
-        self.shelf_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.shelf_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.shelf_table.verticalHeader().setDefaultSectionSize(40)
+        self.shelf_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.shelf_table.setSelectionBehavior(QTableView.SelectRows)
         self.shelf_table.setAlternatingRowColors(True)
         self.shelf_table.setShowGrid(True)
         self.setup_table_style(self.shelf_table)
@@ -385,16 +433,30 @@ class ArchiveManager(QMainWindow):
         # Then set the active button
         self.members_btn.setStyleSheet(self.button_active_style)
     
+    def archive_pages(self, table_name):
+        # Page function for the table models: next rows after the (isDeleted, key) cursor
+        key = ARCHIVE_KEYS[table_name]
+        fetch_page = lambda after, limit: self.db_seeder.get_archive_page(table_name, self.librarian_id or 1, after, limit)
+        cursor_of = lambda record: (record['isDeleted'], record[key])
+        return fetch_page, cursor_of
+
+    def refresh_page(self, changed_tables):
+        # Reload the archive tables whose rows changed while navigation kept this page hidden
+        for tables, controller, load in (
+                (("Book", "BookAuthor", "Book_Genre"), self.books_search_controller, self.load_archived_books),
+                (("Member",), self.members_search_controller, self.load_archived_members),
+                (("BookShelf",), self.shelf_search_controller, self.load_archived_shelves)):
+            if set(tables) & set(changed_tables):
+                if controller.text():
+                    controller.refresh()
+                else:
+                    load()
+
     def load_archived_books(self):
         # Load archived books from DB
         """Load archived books from database"""
         try:
-            archived_books = self.db_seeder.archiveTable("Book", self.librarian_id or 1)
-            book_authors = self.db_seeder.archiveTable("BookAuthor", self.librarian_id or 1)
-            book_genres = self.db_seeder.archiveTable("Book_Genre", self.librarian_id or 1)
-                    
-            self.display_archived_books(archived_books, book_authors, book_genres)
-        
+            self.books_model.load(*self.archive_pages("Book"))
         except Exception as e:
             print(f"Error loading archived books: {e}")
     
@@ -402,9 +464,7 @@ class ArchiveManager(QMainWindow):
         # Load archived members from DB
         """Load archived members from database"""
         try:
-            archived_members = self.db_seeder.archiveTable("Member", self.librarian_id or 1)
-            
-            self.display_archived_members(archived_members)
+            self.members_model.load(*self.archive_pages("Member"))
         except Exception as e:
             print(f"Error loading archived members: {e}")
     
@@ -412,277 +472,43 @@ class ArchiveManager(QMainWindow):
         # Load archived shelves from DB
         """Load archived shelves from database"""
         try:
-            archived_shelves = self.db_seeder.archiveTable("BookShelf", self.librarian_id or 1)
-            
-            self.display_archived_shelves(archived_shelves)
+            self.shelf_model.load(*self.archive_pages("BookShelf"))
         except Exception as e:
             print(f"Error loading archived shelves: {e}")
     
-    def display_archived_books(self, books, book_authors, book_genres):
-        # Fill table with archived books
-        """Display archived books in the table"""
-        from PySide6.QtWidgets import QCheckBox
-        
-        self.books_table.setRowCount(len(books))
-        
-        for row, book in enumerate(books):
-            book_code = book.get('BookCode', '')
-            
-            # Get all authors for this book
-            authors = [a.get('bookAuthor', '') for a in book_authors if a.get('BookCode') == book_code]
-            author_text = ', '.join(authors) if authors else 'Unknown Author'
-
-            # Get all genres for this book
-            genres = [g.get('Genre', '') for g in book_genres if g.get('BookCode') == book_code]
-            genre_text = ', '.join(genres) if genres else 'Unknown Genre'
-            
-            # Book details columns
-            self.books_table.setItem(row, 0, QTableWidgetItem(str(book.get('isDeleted', 'N/A'))))
-            self.books_table.setItem(row, 1, QTableWidgetItem(str(book_code)))
-            self.books_table.setItem(row, 2, QTableWidgetItem(book.get('BookTitle', 'N/A')))
-            self.books_table.setItem(row, 3, QTableWidgetItem(author_text))
-            self.books_table.setItem(row, 4, QTableWidgetItem(genre_text))
-            self.books_table.setItem(row, 5, QTableWidgetItem(str(book.get('ISBN', 'N/A'))))
-            
-            # Create centered copies item
-            copies_item = QTableWidgetItem(str(book.get('BookTotalCopies', 'N/A')))
-            copies_item.setTextAlignment(Qt.AlignCenter)
-            self.books_table.setItem(row, 6, copies_item)
-            
-            # Create centered shelf item - properly handle BookShelf column
-            shelf_text = book.get('BookShelf', 'No Shelf')
-            if shelf_text is None or shelf_text == '':
-                shelf_text = 'No Shelf'
-            shelf_item = QTableWidgetItem(str(shelf_text))
-            shelf_item.setTextAlignment(Qt.AlignCenter)
-            self.books_table.setItem(row, 7, shelf_item)
-
-            # Checkbox for selection with checkmark icon
-            checkbox = QCheckBox()
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    margin-left: 12px;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: white;
-                    border: 2px solid #5e3e1f;
-                    border-radius: 4px;
-                    image: url('assets/check.png');  
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: white;
-                    border: 2px solid #d0d0d0;
-                    border-radius: 4px;
-                }
-            """)
-
-            checkbox.toggled.connect(lambda checked, r=row: self.on_book_checkbox_toggled(checked, r))
-            
-            # Center the checkbox
-            checkbox_widget = QWidget()
-            checkbox_widget.setStyleSheet("background-color: transparent;")
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            
-            self.books_table.setCellWidget(row, 8, checkbox_widget)
-            self.books_table.setRowHeight(row, 40)
-    
-    def display_archived_members(self, members):
-        # Fill table with archived members
-        """Display archived members in the table"""
-        from PySide6.QtWidgets import QCheckBox
-        
-        self.members_table.setRowCount(len(members))
-        
-        for row, member in enumerate(members):
-            # Map database columns to display columns
-            # Database columns: MemberID, MemberLN, MemberMI, MemberFN, MemberContact, CreatedAt, isDeleted, LibrarianID
-            
-            # Member details with correct column mapping
-            self.members_table.setItem(row, 0, QTableWidgetItem(str(member.get('isDeleted', 'N/A'))))
-            self.members_table.setItem(row, 1, QTableWidgetItem(str(member.get('MemberID', 'N/A'))))
-            self.members_table.setItem(row, 2, QTableWidgetItem(member.get('MemberFN', 'N/A')))
-            self.members_table.setItem(row, 3, QTableWidgetItem(member.get('MemberMI', 'N/A') or 'N/A'))
-            self.members_table.setItem(row, 4, QTableWidgetItem(member.get('MemberLN', 'N/A')))
-            self.members_table.setItem(row, 5, QTableWidgetItem(str(member.get('MemberContact', 'N/A'))))
-            
-            # Checkbox for selection
-            checkbox = QCheckBox()
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    margin-left: 12px;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: white;
-                    border: 2px solid #5e3e1f;
-                    border-radius: 4px;
-                    image: url('assets/check.png');  
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: white;
-                    border: 2px solid #d0d0d0;
-                    border-radius: 4px;
-                }
-            """)
-
-            checkbox.toggled.connect(lambda checked, r=row: self.on_member_checkbox_toggled(checked, r))
-            
-            # Center the checkbox
-            checkbox_widget = QWidget()
-            checkbox_widget.setStyleSheet("background-color: transparent;")
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            
-            self.members_table.setCellWidget(row, 6, checkbox_widget)
-            self.members_table.setRowHeight(row, 40)
-    
-    def display_archived_shelves(self, shelves):
-        # Fill table with archived shelves
-        """Display archived shelves in the table"""
-        from PySide6.QtWidgets import QCheckBox
-        
-        self.shelf_table.setRowCount(len(shelves))
-        
-        for row, shelf in enumerate(shelves):
-            # Map database columns to display columns
-            # Database columns would be: ShelfId, LibrarianID if table had isDeleted column
-           
-            #is Deleted
-            id_item = QTableWidgetItem(str(shelf.get('isDeleted', 'N/A')))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.shelf_table.setItem(row, 0, id_item)
-            # Shelf ID 
-            id_item = QTableWidgetItem(str(shelf.get('ShelfId', 'N/A')))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.shelf_table.setItem(row, 1, id_item)
-            
-            # Shelf Name
-            id_item = QTableWidgetItem(str(shelf.get('ShelfName', 'N/A')))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.shelf_table.setItem(row, 2, id_item)
-            
-            # Librarian ID 
-            librarian_item = QTableWidgetItem(str(shelf.get('LibrarianID', 'N/A')))
-            librarian_item.setTextAlignment(Qt.AlignCenter)
-            self.shelf_table.setItem(row, 3, librarian_item)
-            
-            # Checkbox for selection
-            checkbox = QCheckBox()
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    margin-left: 12px;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: white;
-                    border: 2px solid #5e3e1f;
-                    border-radius: 4px;
-                    image: url('assets/check.png');  
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: white;
-                    border: 2px solid #d0d0d0;
-                    border-radius: 4px;
-                }
-            """)
-
-            checkbox.toggled.connect(lambda checked, r=row: self.on_shelf_checkbox_toggled(checked, r))
-            
-            # Center the checkbox
-            checkbox_widget = QWidget()
-            checkbox_widget.setStyleSheet("background-color: transparent;")
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            
-            self.shelf_table.setCellWidget(row, 4, checkbox_widget)
-            self.shelf_table.setRowHeight(row, 40)
-    
-    def search_archived_books(self):
-        # Search archived books
-        """Search archived books based on input"""
-        search_text = self.books_search.text().strip()
-        if not search_text:
-            self.load_archived_books()
-            return
-            
-        try:
-            # Use database search for archived books
-            print(f"🔍 Searching archived books for: '{search_text}'")
-            archived_books = self.db_seeder.search_archived_records("Book", search_text, self.librarian_id or 1)
-            
-            # Also get authors and genres for the filtered books
-            book_authors = self.db_seeder.archiveTable("BookAuthor", self.librarian_id or 1)
-            book_genres = self.db_seeder.archiveTable("Book_Genre", self.librarian_id or 1)
-            
-            self.display_archived_books(archived_books, book_authors, book_genres)
-            print(f"✓ Displayed {len(archived_books)} filtered archived books")
-            
-        except Exception as e:
-            print(f"Error searching archived books: {e}")
-            self.load_archived_books()  # Fallback to showing all
+    def search_archived_books(self, search_text):
+        # Search archived books (runs on the search controller's worker thread)
+        """Archived books matching the search text, with their authors and genres"""
+        print(f"🔍 Searching archived books for: '{search_text}'")
+        archived_books = self.db_seeder.search_archived_records("Book", search_text, self.librarian_id or 1)
+        
+        # Also get authors and genres for the filtered books
+        book_authors = self.db_seeder.archiveTable("BookAuthor", self.librarian_id or 1)
+        book_genres = self.db_seeder.archiveTable("Book_Genre", self.librarian_id or 1)
+        authors_by_book = group_by_key(book_authors, 'BookCode', 'bookAuthor')
+        genres_by_book = group_by_key(book_genres, 'BookCode', 'Genre')
+        for book in archived_books:
+            book['Authors'] = ', '.join(authors_by_book.get(book.get('BookCode'), []))
+            book['Genres'] = ', '.join(genres_by_book.get(book.get('BookCode'), []))
+        return archived_books
     
-    def search_archived_members(self):
-        # Search archived members
-        """Search archived members based on input"""
-        search_text = self.members_search.text().strip()
-        if not search_text:
-            self.load_archived_members()
-            return
-            
-        try:
-            # Use database search for archived members
-            print(f"🔍 Searching archived members for: '{search_text}'")
-            archived_members = self.db_seeder.search_archived_records("Member", search_text, self.librarian_id or 1)
-            
-            self.display_archived_members(archived_members)
-            print(f"✓ Displayed {len(archived_members)} filtered archived members")
-            
-        except Exception as e:
-            print(f"Error searching archived members: {e}")
-            self.load_archived_members()  # Fallback to showing all
+    def search_archived_members(self, search_text):
+        # Search archived members (runs on the search controller's worker thread)
+        """Archived members matching the search text"""
+        print(f"🔍 Searching archived members for: '{search_text}'")
+        return self.db_seeder.search_archived_records("Member", search_text, self.librarian_id or 1)
     
-    def search_archived_shelves(self):
-        # Search archived shelves
-        """Search archived shelves based on input"""
-        search_text = self.shelf_search.text().strip()
-        if not search_text:
-            self.load_archived_shelves()
-            return
-            
-        try:
-            # Use database search for archived shelves
-            print(f"🔍 Searching archived shelves for: '{search_text}'")
-            archived_shelves = self.db_seeder.search_archived_records("BookShelf", search_text, self.librarian_id or 1)
-            
-            self.display_archived_shelves(archived_shelves)
-            print(f"✓ Displayed {len(archived_shelves)} filtered archived shelves")
-            
-        except Exception as e:
-            print(f"Error searching archived shelves: {e}")
-            self.load_archived_shelves()  # Fallback to showing all
+    def search_archived_shelves(self, search_text):
+        # Search archived shelves (runs on the search controller's worker thread)
+        """Archived shelves matching the search text"""
+        print(f"🔍 Searching archived shelves for: '{search_text}'")
+        return self.db_seeder.search_archived_records("BookShelf", search_text, self.librarian_id or 1)
 
     def setup_table_style(self, table):
         # Style our tables
         """Apply styling to table widget"""
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #e8d8bd;
                 border-radius: 8px;
@@ -690,14 +516,23 @@ class ArchiveManager(QMainWindow):
                 font-family: 'Times New Roman';
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border-bottom: 1px solid #f0f0f0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #f5f3ed;
                 color: #5e3e1f;
             }
+            QTableView::indicator {
+                width: 18px;
+                height: 18px;
+            }
+            QTableView::indicator:unchecked {
+                background-color: white;
+                border: 2px solid #d0d0d0;
+                border-radius: 4px;
+            }
             QHeaderView::section {
                 background-color: #5e3e1f;
                 color: white;
@@ -713,86 +548,68 @@ class ArchiveManager(QMainWindow):
             }
         """)
     
-    def on_book_checkbox_toggled(self, checked, row):
-        # Restore book if checked
-        """Handle book checkbox toggle"""
-        if checked:
-            # Get book details for confirmation
-            book_code = self.books_table.item(row, 1).text()
-            book_title = self.books_table.item(row, 2).text()
-            
-            # Show confirmation dialog
-            confirm = QMessageBox.question(
-                self, 
-                "Confirm Restore",
-                f"Are you sure you want to restore the book:\n\n{book_code} - {book_title}?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if confirm == QMessageBox.Yes:
-                self.db_seeder.restoreArchive("Book", book_code, self.librarian_id or 1)
-                QMessageBox.information(self, "Success", f"Book '{book_title}' restored successfully.")
-                self.load_archived_books()  # Reload the list
-            else:
-                # Uncheck the checkbox if user cancelled
-                checkbox_widget = self.books_table.cellWidget(row, 8)
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                checkbox.setChecked(False)
+    def on_book_checked(self, book):
+        # Restore book when its box is ticked
+        """Handle book checkbox tick"""
+        book_code = book.get('BookCode')
+        book_title = book.get('BookTitle', 'N/A')
+        
+        # Show confirmation dialog
+        confirm = QMessageBox.question(
+            self, 
+            "Confirm Restore",
+            f"Are you sure you want to restore the book:\n\n{book_code} - {book_title}?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        # The box stays unticked if the user cancelled
+        if confirm == QMessageBox.Yes:
+            self.db_seeder.restoreArchive("Book", book_code, self.librarian_id or 1)
+            QMessageBox.information(self, "Success", f"Book '{book_title}' restored successfully.")
+            self.load_archived_books()  # Reload the list
 
-    def on_member_checkbox_toggled(self, checked, row):
-        # Restore member if checked
-        """Handle member checkbox toggle"""
-        if checked:
-            # Get member details for confirmation
-            member_id = self.members_table.item(row, 1).text()
-            first_name = self.members_table.item(row, 2).text()
-            last_name = self.members_table.item(row, 4).text()
-            
-            # Show confirmation dialog
-            confirm = QMessageBox.question(
-                self, 
-                "Confirm Restore",
-                f"Are you sure you want to restore the member:\n\n{member_id} - {first_name} {last_name}?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if confirm == QMessageBox.Yes:
-                self.db_seeder.restoreArchive("Member", member_id, self.librarian_id or 1)
-                QMessageBox.information(self, "Success", f"Member '{first_name} {last_name}' restored successfully.")
-                self.load_archived_members()  # Reload the list
-            else:
-                # Uncheck the checkbox if user cancelled
-                checkbox_widget = self.members_table.cellWidget(row, 6)
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                checkbox.setChecked(False)
+    def on_member_checked(self, member):
+        # Restore member when its box is ticked
+        """Handle member checkbox tick"""
+        member_id = member.get('MemberID')
+        first_name = member.get('MemberFN', '')
+        last_name = member.get('MemberLN', '')
+        
+        # Show confirmation dialog
+        confirm = QMessageBox.question(
+            self, 
+            "Confirm Restore",
+            f"Are you sure you want to restore the member:\n\n{member_id} - {first_name} {last_name}?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        # The box stays unticked if the user cancelled
+        if confirm == QMessageBox.Yes:
+            self.db_seeder.restoreArchive("Member", member_id, self.librarian_id or 1)
+            QMessageBox.information(self, "Success", f"Member '{first_name} {last_name}' restored successfully.")
+            self.load_archived_members()  # Reload the list
 
-    def on_shelf_checkbox_toggled(self, checked, row):
-        # Restore shelf if checked
-        """Handle shelf checkbox toggle"""
-        if checked:
-            # Get shelf details for confirmation
-            shelf_id = self.shelf_table.item(row, 1).text()
-            
-            # Show confirmation dialog
-            confirm = QMessageBox.question(
-                self, 
-                "Confirm Restore",
-                f"Are you sure you want to restore the shelf:\n\nShelf ID: {shelf_id}?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if confirm == QMessageBox.Yes:
-                self.db_seeder.restoreArchive("BookShelf", shelf_id, self.librarian_id or 1)
-                QMessageBox.information(self, "Success", f"Shelf '{shelf_id}' restored successfully.")
-                self.load_archived_shelves()  # Reload the list
-            else:
-                # Uncheck the checkbox if user cancelled
-                checkbox_widget = self.shelf_table.cellWidget(row, 4)
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                checkbox.setChecked(False)
+    def on_shelf_checked(self, shelf):
+        # Restore shelf when its box is ticked
+        """Handle shelf checkbox tick"""
+        shelf_id = shelf.get('ShelfId')
+        
+        # Show confirmation dialog
+        confirm = QMessageBox.question(
+            self, 
+            "Confirm Restore",
+            f"Are you sure you want to restore the shelf:\n\nShelf ID: {shelf_id}?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        # The box stays unticked if the user cancelled
+        if confirm == QMessageBox.Yes:
+            self.db_seeder.restoreArchive("BookShelf", shelf_id, self.librarian_id or 1)
+            QMessageBox.information(self, "Success", f"Shelf '{shelf_id}' restored successfully.")
+            self.load_archived_shelves()  # Reload the list
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,14 +1,9 @@
 import sys
 import sqlite3
 import bcrypt 
-import Dashboard
 import re
 import io
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import os
-from dotenv import load_dotenv 
 from PySide6.QtCore import Qt, QSize, QTimer 
 from PySide6.QtGui import QFont, QMovie, QIcon
 from PySide6.QtWidgets import (
@@ -18,6 +13,7 @@ from PySide6.QtWidgets import (
 #initialize database from the seeder
 from tryDatabase import DatabaseSeeder 
 from navbar_logic import nav_manager 
+from page_prewarm import get_page_warmer
 from ResetPasswordDialog import ResetPasswordDialog 
 
  
@@ -331,6 +327,11 @@ class Authentication(QWidget):
             self.toggle_password_btn.setIcon(QIcon("assets/eye-closed.png"))
 
      
+    def showEvent(self, event):
+        # once the login window is up, import the dashboard in the background so logging in doesn't wait for it
+        super().showEvent(event)
+        get_page_warmer().preload(("Dashboard",))
+
     def handle_login(self):
         email = self.email_input.text()
         password = self.password_input.text()
@@ -362,10 +363,10 @@ class Authentication(QWidget):
                 self.set_current_librarian_id(librarian_id)
                 nav_manager.set_librarian_id(librarian_id)
                 print("Log in successful: ", librarian_id)
-                self.dashboard_window = Dashboard.LibraryDashboard() 
-                self.dashboard_window.librarian_id = librarian_id 
-                nav_manager._current_window = self.dashboard_window
-                self.dashboard_window.show()
+                nav_manager.handle_navigation("Dashboard", librarian_id)
+                self.dashboard_window = nav_manager.get_current_window()
+                # import and load the other pages while the librarian looks at the dashboard
+                get_page_warmer().start(librarian_id)
                 self.close() 
             else:
                 self.general_error_label.setText("Librarian Not Found...")
@@ -575,6 +576,11 @@ class ConfirmEmailDialog(QWidget):
             self.error_label.show()
     
     def send_real_email(self, recipient_email, otp):
+        # mail modules are only needed for a password reset, so they load here rather than before the login window
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from dotenv import load_dotenv
         try:
 
             load_dotenv("email.env") #access the email env file
@@ -1137,8 +1143,6 @@ class SignUp(QWidget):
 
         # Hash the password
         hashedPass = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-        
-        self.db_seeder.create_table("Librarian")
 
         # Create the account in the database
         self.db_seeder.seed_data(
@@ -1204,6 +1208,10 @@ if __name__ == "__main__":
         QLabel {color: #4A4947}         
     """)
 
+    #the first seeder applies WAL mode, tuned PRAGMAs and schema migrations; optimize and close on exit
+    db_seeder = DatabaseSeeder()
+    app.aboutToQuit.connect(db_seeder.shutdown)
+
     window = Authentication()
     nav_manager.initialize(app)
     window.show() 
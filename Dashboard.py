@@ -130,16 +130,13 @@ class LibraryDashboard(QMainWindow):
         # Fetches all borrow transactions for the current librarian and calculates days left for each
         try:
             borrow_manager = BorrowBooks()
-            transactions = borrow_manager.fetch_transaction(self.librarian_id) or []
+            # already grouped per transaction by the database, only borrowed ones
+            transactions = borrow_manager.fetch_transaction_feed(self.librarian_id, status="Borrowed")
             
             today = datetime.now().date()
-            transactions_dict = {}
+            borrowed = []
             
             for trans in transactions:
-                if trans.get('action') != 'Borrowed':
-                    continue
-                    
-                trans_id = trans.get('id')
                 due_date_str = trans.get('due_date', '')
                 
                 try:
@@ -147,28 +144,21 @@ class LibraryDashboard(QMainWindow):
                     due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date() if due_date_str else None
                     days_left = (due_date - today).days if due_date else 0
                 except (ValueError, TypeError) as e:
-                    print(f"Error parsing due date for transaction {trans_id}: {e}")
+                    print(f"Error parsing due date for transaction {trans.get('id')}: {e}")
                     days_left = 0
                     
-                if trans_id not in transactions_dict:
-                    transactions_dict[trans_id] = {
-                        'id': trans_id,
-                        'borrower': trans.get('borrower', 'N/A'),
-                        'borrowed_date': trans.get('date', 'N/A'),
-                        'due_date': due_date_str,
-                        'days_left': days_left,  # Store calculated days left
-                        'status': 'Borrowed',  # Default status
-                        'books': [],
-                        'quantity': 0
-                    }
-                    
-                transactions_dict[trans_id]['books'].append({
-                    'title': trans.get('book_title', 'N/A'),
-                    'quantity': trans.get('quantity', 1)
+                borrowed.append({
+                    'id': trans.get('id'),
+                    'borrower': trans.get('borrower_last_first', 'N/A'),
+                    'borrowed_date': trans.get('date', 'N/A'),
+                    'due_date': due_date_str,
+                    'days_left': days_left,  # Store calculated days left
+                    'status': 'Borrowed',  # Default status
+                    'books': [{'title': book['title'], 'quantity': book['quantity']} for book in trans['books']],
+                    'quantity': trans.get('quantity', 0)
                 })
-                transactions_dict[trans_id]['quantity'] += trans.get('quantity', 1)
                 
-            return list(transactions_dict.values())
+            return borrowed
         except Exception as e:
             QMessageBox.warning(self, "Fetch Error", f"Failed to fetch transactions: {str(e)}")
             return []
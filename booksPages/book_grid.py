@@ -0,0 +1,305 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QPoint, QRect, QSize, QTimer
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QListView, QStyle, QStyledItemDelegate
+from .cover_cache import cover_cache, cover_key, get_cover_loader
+
+# Role that returns the whole book dict of a row (see CollapsibleSidebar._build_book_data)
+BookRole = Qt.UserRole + 1
+
+CARD_SIZE = QSize(200, 280)
+COVER_SIZE = QSize(150, 200)
+# Covers outside the grid: the book preview dialog, and the add/details dialogs
+PREVIEW_COVER_SIZE = QSize(200, 280)
+FORM_COVER_SIZE = QSize(180, 210)
+
+# How long scrolling has to pause before covers of cards that left the view are dropped
+COVER_CANCEL_DELAY_MS = 150
+
+
+# to format author list for display
+def format_authors_display(authors):
+    if isinstance(authors, list):
+        author_text = ', '.join(authors[:2])
+        if len(authors) > 2:
+            author_text += f" +{len(authors)-2} more"
+        return author_text
+    return str(authors)
+
+# to load and scale pixmap safely (served from the shared cover cache)
+def load_pixmap_safely(image_path, target_size):
+    try:
+        return cover_cache.get(image_path, target_size)
+    except Exception as e:
+        print(f"Error loading image {image_path}: {e}")
+    return None
+
+
+def _book_key(book):
+    return book.get("book_code") or id(book)
+
+
+class BookGridModel(QAbstractListModel):
+    """List model for the book grid.
+
+    Rows are handed to the view in batches (canFetchMore/fetchMore), so a large
+    catalogue only creates the rows the user has scrolled to. set_books() applies
+    a new result list as row removals/insertions where it can, so a search
+    keystroke doesn't reset the whole view.
+    """
+
+    BATCH_SIZE = 60
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._books = []    # every book of the current result
+        self._loaded = 0    # rows exposed to the view so far
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        book = self._books[index.row()]
+        if role == Qt.DisplayRole:
+            return book.get("title", "")
+        if role == Qt.ToolTipRole:
+            return f"{book.get('title', '')}\n{', '.join(book.get('author', []))}"
+        if role == BookRole:
+            return book
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._books)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self._books) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def book_at(self, index):
+        return self.data(index, BookRole)
+
+    def set_books(self, books):
+        """Show a new list of books, keeping the rows both lists share"""
+        books = list(books)
+        target = books[:max(self._loaded, self.BATCH_SIZE)]
+        target_keys = [_book_key(book) for book in target]
+        current = self._books[:self._loaded]
+        current_keys = [_book_key(book) for book in current]
+
+        if current_keys == target_keys:
+            self._books = books
+            if target:
+                self.dataChanged.emit(self.index(0), self.index(len(target) - 1))
+            return
+
+        # the shared rows must keep their relative order, otherwise just reset
+        target_set = set(target_keys)
+        kept = [key for key in current_keys if key in target_set]
+        kept_set = set(kept)
+        if [key for key in target_keys if key in kept_set] != kept:
+            self.beginResetModel()
+            self._books = books
+            self._loaded = len(target)
+            self.endResetModel()
+            return
+
+        # remove rows that are no longer in the result, last run first
+        row = len(current_keys) - 1
+        while row >= 0:
+            if current_keys[row] in target_set:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and current_keys[row] not in target_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            del current[row + 1:end + 1]
+            del current_keys[row + 1:end + 1]
+            self._books = current
+            self._loaded = len(current)
+            self.endRemoveRows()
+
+        # insert the new rows in runs at their final position
+        row = 0
+        while row < len(target_keys):
+            if row < len(current_keys) and current_keys[row] == target_keys[row]:
+                row += 1
+                continue
+            end = row
+            while end < len(target_keys) and target_keys[end] not in kept_set:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            current[row:row] = target[row:end]
+            current_keys[row:row] = target_keys[row:end]
+            self._books = current
+            self._loaded = len(current)
+            self.endInsertRows()
+            row = end
+
+        # shared rows may carry updated data (copies, shelf, ...)
+        self._books = books
+        self._loaded = len(target)
+        if target:
+            self.dataChanged.emit(self.index(0), self.index(len(target) - 1))
+
+
+class BookCardDelegate(QStyledItemDelegate):
+    """Paints a book card (cover, title, authors) for the rows the view shows.
+
+    Covers are decoded in the background; until one is ready the card shows
+    the placeholder and the view repaints when the cover arrives.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.author_font = QFont()
+        self.author_font.setPixelSize(12)
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def paint(self, painter, option, index):
+        book = index.data(BookRole)
+        if not book:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = option.rect.adjusted(1, 1, -1, -1)
+
+        # card background, highlighted like the old QPushButton on hover/press
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        selected = bool(option.state & QStyle.State_Selected)
+        background = "#e8e8e8" if selected else "#f0f0f0" if hovered else "#f8f8f8"
+        border = "#5C4033" if hovered or selected else "#e0e0e0"
+        painter.setPen(QPen(QColor(border), 2))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(card, 12, 12)
+
+        # cover
+        cover_rect = QRect(card.x() + (card.width() - COVER_SIZE.width()) // 2, card.y() + 10,
+                           COVER_SIZE.width(), COVER_SIZE.height())
+        pixmap = get_cover_loader().request(book.get("image"), COVER_SIZE)
+        if pixmap and not pixmap.isNull():
+            target = QRect(0, 0, pixmap.width(), pixmap.height())
+            target.moveCenter(cover_rect.center())
+            painter.drawPixmap(target, pixmap)
+            painter.setBrush(Qt.NoBrush)
+        else:
+            painter.setBrush(QColor("#dbcfc1"))
+        painter.setPen(QPen(QColor("#5C4033"), 2))
+        painter.drawRoundedRect(cover_rect, 8, 8)
+
+        # title (two lines at most) and authors
+        text_width = card.width() - 20
+        title_rect = QRect(card.x() + 10, cover_rect.bottom() + 8, text_width, 35)
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#5C4033"))
+        title = self._elide_lines(book.get("title", ""), QFontMetrics(self.title_font), text_width, 2)
+        painter.drawText(title_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, title)
+
+        author_rect = QRect(card.x() + 10, title_rect.bottom() + 2, text_width, 20)
+        painter.setFont(self.author_font)
+        painter.setPen(QColor("#8B4513"))
+        authors = QFontMetrics(self.author_font).elidedText(
+            format_authors_display(book.get("author", [])), Qt.ElideRight, text_width)
+        painter.drawText(author_rect, Qt.AlignHCenter | Qt.AlignTop, authors)
+        painter.restore()
+
+    def _elide_lines(self, text, metrics, width, lines):
+        # wrap word by word and elide whatever doesn't fit on the last line
+        words = text.split()
+        result = []
+        while words and len(result) < lines - 1:
+            line = words.pop(0)
+            while words and metrics.horizontalAdvance(f"{line} {words[0]}") <= width:
+                line = f"{line} {words.pop(0)}"
+            result.append(line)
+        if words:
+            result.append(metrics.elidedText(" ".join(words), Qt.ElideRight, width))
+        return "\n".join(result)
+
+
+class BookGridView(QListView):
+    """Icon-mode list view that lays the book cards out in a wrapping grid"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSpacing(15)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(120)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        # painting requests covers for the visible cards only; once scrolling pauses,
+        # queued jobs for cards that left the view are dropped so the newly visible
+        # cards load first
+        self.cover_loader = get_cover_loader()
+        self.cover_loader.cover_ready.connect(self.viewport().update)
+        self.cancel_timer = QTimer(self)
+        self.cancel_timer.setSingleShot(True)
+        self.cancel_timer.setInterval(COVER_CANCEL_DELAY_MS)
+        self.cancel_timer.timeout.connect(self.cancel_offscreen_covers)
+        self.verticalScrollBar().valueChanged.connect(self.cancel_timer.start)
+        self.setStyleSheet("""
+            QListView {
+                border: none;
+                background-color: transparent;
+            }
+            QScrollBar:vertical {
+                width: 12px;
+                background-color: #f0f0f0;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #5C4033;
+                border-radius: 6px;
+                min-height: 30px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #8B4513;
+            }
+        """)
+
+    def setModel(self, model):
+        super().setModel(model)
+        # the rows are gone, so are their covers (the signals' arguments aren't a keep set)
+        model.modelReset.connect(lambda: self.cover_loader.cancel_pending())
+        model.rowsRemoved.connect(lambda *_: self.cover_loader.cancel_pending())
+
+    def visible_rows(self):
+        """Rows with a card in the viewport, found by probing it every half card"""
+        rows = set()
+        area = self.viewport().rect()
+        for y in range(area.top(), area.bottom() + 1, CARD_SIZE.height() // 2):
+            for x in range(area.left(), area.right() + 1, CARD_SIZE.width() // 2):
+                index = self.indexAt(QPoint(x, y))
+                if index.isValid():
+                    rows.add(index.row())
+        return rows
+
+    def cancel_offscreen_covers(self):
+        if self.model() is None:
+            return
+        keep = set()
+        for row in self.visible_rows():
+            book = self.model().index(row, 0).data(BookRole) or {}
+            key = cover_key(book.get("image"), COVER_SIZE)
+            if key is not None:
+                keep.add(key)
+        self.cover_loader.cancel_pending(keep)
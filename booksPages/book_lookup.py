@@ -0,0 +1,218 @@
+import os
+import re
+import sys
+import json
+import time
+import requests
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from db_connection import get_connection_manager
+from .isbn_store import get_isbn_store
+
+GOOGLE_BOOKS_URL = "https://www.googleapis.com/books/v1/volumes"
+
+# Responses live in their own database so the cache can be deleted at any time;
+# it sits in the project folder next to bjrsLib.db, whatever the working directory
+CACHE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bjrsCache.db")
+RESULT_TTL = 30 * 24 * 3600      # a found volume rarely changes
+EMPTY_RESULT_TTL = 24 * 3600     # retry "no results" daily, the catalogue may have grown
+
+CACHE_SCHEMA = """CREATE TABLE IF NOT EXISTS ApiResponse(
+                    QueryKey TEXT PRIMARY KEY NOT NULL,
+                    Response TEXT NOT NULL,
+                    FetchedAt REAL NOT NULL,
+                    ExpiresAt REAL NOT NULL)"""
+
+
+def api_url():
+    # GOOGLE_BOOKS_API_URL points the app at another endpoint, e.g. stub_books_server.py
+    return os.getenv("GOOGLE_BOOKS_API_URL") or GOOGLE_BOOKS_URL
+
+
+def build_query(title, author, isbn):
+    """Google Books query for the inputs of AddBookDialog"""
+    terms = []
+    if isbn:
+        terms.append(f"isbn:{isbn}")
+    terms += [term for term in (title, author) if term]
+    return " ".join(terms)
+
+
+def normalize_query(title, author, isbn):
+    """Cache key: the same book typed with different case or spacing maps to one entry"""
+    isbn = re.sub(r'[^0-9X]', '', (isbn or "").upper())
+    title = " ".join((title or "").lower().split())
+    author = " ".join((author or "").lower().split())
+    return f"isbn:{isbn}|title:{title}|author:{author}"
+
+
+class LookupCache:
+    """SQLite-backed store of Google Books responses with per-entry expiry"""
+
+    def __init__(self, db_path=CACHE_DB):
+        self.manager = get_connection_manager(db_path)
+        conn = self.manager.acquire()
+        try:
+            conn.execute(CACHE_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key, now=None):
+        now = time.time() if now is None else now
+        conn = self.manager.acquire()
+        try:
+            row = conn.execute("SELECT Response FROM ApiResponse WHERE QueryKey = ? AND ExpiresAt > ?",
+                               (key, now)).fetchone()
+            return json.loads(row[0]) if row else None
+        finally:
+            conn.close()
+
+    def put(self, key, data, now=None):
+        now = time.time() if now is None else now
+        ttl = RESULT_TTL if data.get("items") else EMPTY_RESULT_TTL
+        conn = self.manager.acquire()
+        try:
+            conn.execute("INSERT OR REPLACE INTO ApiResponse (QueryKey, Response, FetchedAt, ExpiresAt) "
+                         "VALUES (?, ?, ?, ?)", (key, json.dumps(data), now, now + ttl))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def purge_expired(self, now=None):
+        now = time.time() if now is None else now
+        conn = self.manager.acquire()
+        try:
+            deleted = conn.execute("DELETE FROM ApiResponse WHERE ExpiresAt <= ?", (now,)).rowcount
+            conn.commit()
+            return deleted
+        finally:
+            conn.close()
+
+
+def fetch_volumes(title, author, isbn, timeout=10):
+    """Blocking Google Books request; raises requests exceptions like requests.get does"""
+    params = {"q": build_query(title, author, isbn)}
+    api_key = os.getenv('GOOGLE_BOOKS_API_KEY')
+    if api_key:
+        params["key"] = api_key
+    response = requests.get(api_url(), params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+class _LookupJob(QRunnable):
+    """Runs one Google Books request on a pool thread and caches the answer"""
+
+    def __init__(self, service, key, title, author, isbn):
+        super().__init__()
+        self.service = service
+        self.key = key
+        self.args = (title, author, isbn)
+
+    def run(self):
+        try:
+            data = fetch_volumes(*self.args)
+            self.service.cache.put(self.key, data)
+            self.service._done.emit(self.key, data, "", 0, "")
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 0
+            self.service._done.emit(self.key, None, "http", status, str(e))
+        except requests.exceptions.RequestException as e:
+            self.service._done.emit(self.key, None, "network", 0, str(e))
+        except Exception as e:
+            self.service._done.emit(self.key, None, "error", 0, str(e))
+
+
+class BookLookupService(QObject):
+    """Looks up books on Google Books without blocking the GUI thread.
+
+    lookup() returns the normalised query key right away. Books found in the
+    offline ISBN store (isbn_store.py) are answered without a request. The answer arrives
+    through finished(key, data), or failed(key, kind, status, message) where
+    kind is "http", "network" or "error". Cached answers are delivered on the
+    next event loop pass, and a query that is already in flight is not sent
+    again: callers waiting on the same key all receive the one answer.
+    """
+
+    finished = Signal(str, object)
+    failed = Signal(str, str, int, str)
+    _done = Signal(str, object, str, int, str)
+
+    def __init__(self, cache=None, store=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or LookupCache()
+        self.store = store or get_isbn_store()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self._in_flight = {}
+        self._done.connect(self._on_done)
+
+    def lookup(self, title, author, isbn):
+        key = normalize_query(title, author, isbn)
+        # the offline ISBN store answers first, then the response cache, then the network
+        info = self.store.get(isbn) if isbn else None
+        data = {"totalItems": 1, "items": [{"volumeInfo": info}]} if info else self.cache.get(key)
+        if data is not None:
+            QTimer.singleShot(0, lambda: self.finished.emit(key, data))
+        elif key not in self._in_flight:
+            job = _LookupJob(self, key, title, author, isbn)
+            job.setAutoDelete(False)
+            self._in_flight[key] = job
+            self.pool.start(job)
+        return key
+
+    def is_pending(self, key):
+        return key in self._in_flight
+
+    def _on_done(self, key, data, kind, status, message):
+        self._in_flight.pop(key, None)
+        if data is None:
+            self.failed.emit(key, kind, status, message)
+        else:
+            self.finished.emit(key, data)
+
+
+_lookup_service = None
+
+
+# shared service, created on first use once the QApplication exists
+def get_lookup_service():
+    global _lookup_service
+    if _lookup_service is None:
+        _lookup_service = BookLookupService()
+    return _lookup_service
+
+
+if __name__ == "__main__":
+    # python -m booksPages.book_lookup -> exercise the service against stub_books_server.py:
+    # three identical lookups share one request, a re-typed one is served from the cache
+    # and an ISBN from the offline store needs no request at all
+    import tempfile
+    from PySide6.QtCore import QCoreApplication
+    from stub_books_server import StubBooksServer
+    from .isbn_store import IsbnStore
+
+    app = QCoreApplication(sys.argv)
+    with StubBooksServer() as server, tempfile.TemporaryDirectory() as folder:
+        os.environ["GOOGLE_BOOKS_API_URL"] = server.url
+        service = BookLookupService(LookupCache(os.path.join(folder, "cache.db")),
+                                    IsbnStore(os.path.join(folder, "isbn.db")))
+        answers = []
+        service.finished.connect(lambda key, data: answers.append(data["totalItems"]))
+        service.failed.connect(lambda key, kind, status, message: answers.append(kind))
+        # the answer is broadcast once per key, however many callers asked for it
+        for _ in range(3):
+            service.lookup("Clean Code", "Robert C. Martin", "9780132350884")
+        while len(answers) < 1:
+            app.processEvents()
+        service.lookup("  clean code ", "robert c. martin", "978-0-13-235088-4")
+        while len(answers) < 2:
+            app.processEvents()
+        # a book from the offline store never reaches the server
+        service.store.import_records([{"isbn": "0-306-40615-2", "title": "Offline Book", "authors": "Jane Doe"}])
+        service.lookup("Offline Book", "Jane Doe", "9780306406157")
+        while len(answers) < 3:
+            app.processEvents()
+        print(f"answers: {answers}, requests sent to the server: {server.request_count}")
+        get_connection_manager(os.path.join(folder, "cache.db")).close_all()
+        get_connection_manager(os.path.join(folder, "isbn.db")).close_all()
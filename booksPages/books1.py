@@ -1,103 +1,32 @@
 import os
-import re
 import sys
-import shutil
-import requests
 import traceback
 from dotenv import load_dotenv
 from navbar_logic import nav_manager
 from navigation_sidebar import NavigationSidebar
-from PySide6.QtCore import Qt, QSize, QEvent, QPropertyAnimation, QTimer, QRect
+from PySide6.QtCore import Qt, QEvent, QPropertyAnimation, QTimer, QRect
 from PySide6.QtGui import QFont, QIcon, QFont, QPixmap
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
-    QLabel, QSizePolicy, QSpacerItem, QLineEdit, QScrollArea, QGridLayout,
+    QLabel, QSizePolicy, QSpacerItem, QLineEdit, QScrollArea,
     QTabWidget, QTextEdit, QMessageBox, QFormLayout, QDialog, QListWidget,
     QListWidgetItem, QGroupBox, QSpinBox, QFileDialog, QMenu, QComboBox,
     QToolTip)
 
 from tryDatabase import DatabaseSeeder
+from search_controller import SearchController
+from search_index import SEARCH_LIMIT, prefix_match, substring_match
+from .book_grid import (BookGridModel, BookCardDelegate, BookGridView, BookRole, FORM_COVER_SIZE,
+                        PREVIEW_COVER_SIZE, format_authors_display, load_pixmap_safely)
+from .book_lookup import get_lookup_service
+from .isbn_store import validate_isbn, clean_isbn
+from .cover_ingest import get_cover_downloader, store_cover_file
+from .catalogue_import import CatalogueImportDialog, validate_shelf_format
 load_dotenv()
 
-# Utility functions for book management
-def validate_isbn(isbn):
-    if not isbn:
-        return False
-        
-    # Clean ISBN by removing non-alphanumeric characters except X
-    isbn_clean = re.sub(r'[^0-9X]', '', isbn.upper())
-    
-    if len(isbn_clean) not in [10, 13]:
-        return False
-        
-    if len(isbn_clean) == 10:
-        return _validate_isbn10(isbn_clean)
-    return _validate_isbn13(isbn_clean)
-
-# for ISBN-10 validation
-def _validate_isbn10(isbn):
-    if len(isbn) != 10:
-        return False
-    total = 0 
-    for i in range(9):
-        if not isbn[i].isdigit():
-            return False
-        total += int(isbn[i]) * (10 - i) 
-    if isbn[9] == 'X':
-        total += 10
-    elif isbn[9].isdigit():
-        total += int(isbn[9])
-    else:
-        return False
-    return total % 11 == 0
-
-# for ISBN-13 validation
-def _validate_isbn13(isbn):
-    if len(isbn) != 13:
-        return False
-    if not isbn.isdigit():
-        return False 
-    total = 0 
-    for i in range(12):
-        if i % 2 == 0:
-            total += int(isbn[i])
-        else:
-            total += int(isbn[i]) * 3
-    check_digit = (10 - (total % 10)) % 10
-    return check_digit == int(isbn[12])
-
-# Utility functions for book data processing
-def clean_isbn(isbn):
-    #Clean and format ISBN by removing non-alphanumeric characters
-    return re.sub(r'[^0-9X]', '', isbn.strip().upper())
-
-# Validate shelf format (A-Z followed by 1-5 digits)
-def validate_shelf_format(shelf):
-    return bool(re.match(r'^[A-Z][0-9]{1,5}$', shelf))
-
-# to format author list for display
-def format_authors_display(authors):
-    if isinstance(authors, list):
-        author_text = ', '.join(authors[:2])
-        if len(authors) > 2:
-            author_text += f" +{len(authors)-2} more"
-        return author_text
-    return str(authors)
-
 def format_authors_for_processing(author_text):
     return list(set([a.strip() for a in author_text.strip().split(',') if a.strip()]))
 
-# to load and scale pixmap safely
-def load_pixmap_safely(image_path, target_size):
-    try:
-        if image_path and isinstance(image_path, str) and os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                return pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-    except Exception as e:
-        print(f"Error loading image {image_path}: {e}")
-    return None
-
 # Dialog for previewing book details before editing
 class BookPreviewDialog(QDialog):
     def __init__(self, book_data, parent=None):
@@ -170,7 +99,7 @@ class BookPreviewDialog(QDialog):
         
         # Load book cover using utility function
         image_path = self.book_data.get("image", "")
-        scaled_pixmap = load_pixmap_safely(image_path, QSize(200, 280))
+        scaled_pixmap = load_pixmap_safely(image_path, PREVIEW_COVER_SIZE)
         
         if scaled_pixmap:
             self.cover_label.setPixmap(scaled_pixmap)
@@ -641,14 +570,10 @@ class BookEditView(QWidget):
                     return shelf_record['ShelfId']
             
             # Create new shelf if not found
-            self.db_seeder.seed_data("BookShelf", [{"ShelfName": shelf_name, "LibrarianID": librarian_id}], 
-                                     ["ShelfName", "LibrarianID"])
-            
-            # Get the newly created shelf ID
-            shelf_records = self.db_seeder.get_all_records("BookShelf", librarian_id)
-            for shelf_record in shelf_records:
-                if shelf_record['ShelfName'] == shelf_name:
-                    return shelf_record['ShelfId']
+            shelf_ids = self.db_seeder.seed_batch("BookShelf", [{"ShelfName": shelf_name, "LibrarianID": librarian_id}], 
+                                                  ["ShelfName", "LibrarianID"])
+            if shelf_ids:
+                return shelf_ids[0]
             
         except Exception:
             # Fallback: use the shelf name
@@ -832,6 +757,19 @@ class AddBookDialog(QDialog):
         # Track API-found book data vs manual entry
         self.found_book_data = None
         
+        # Google Books lookups run in the background; only the latest one is shown
+        self.lookup_service = get_lookup_service()
+        self.lookup_service.finished.connect(self._on_lookup_finished)
+        self.lookup_service.failed.connect(self._on_lookup_failed)
+        self._lookup_key = None
+        self._lookup_inputs = None
+        
+        # Covers download in the background too and are stored by content hash
+        self.cover_downloader = get_cover_downloader()
+        self.cover_downloader.downloaded.connect(self._on_cover_downloaded)
+        self.cover_downloader.failed.connect(self._on_cover_failed)
+        self._cover_url = None
+        
         # Configure dialog window properties
         self.setWindowTitle("Add New Book")
         self.setFixedSize(500, 700)
@@ -940,6 +878,7 @@ class AddBookDialog(QDialog):
         # Search button to verify book information via API
         search_btn = QPushButton("Search & Verify Book")
         search_btn.clicked.connect(self.search_book)
+        self.search_btn = search_btn
         search_btn.setStyleSheet("""
             QPushButton {
                 background-color: #5C4033;
@@ -997,7 +936,7 @@ class AddBookDialog(QDialog):
 
         # Book cover preview label
         self.book_preview = QLabel()
-        self.book_preview.setFixedSize(180, 210)
+        self.book_preview.setFixedSize(FORM_COVER_SIZE)
         self.book_preview.setAlignment(Qt.AlignCenter)
         self.book_preview.setStyleSheet("""
             QLabel {
@@ -1100,6 +1039,9 @@ class AddBookDialog(QDialog):
     
     def reset_cover_preview(self):
         """Reset the book cover preview and information labels to default state"""
+        # Ignore a cover still downloading for the previous search
+        self._cover_url = None
+        
         # Clear the cover image and reset to placeholder
         self.book_preview.setPixmap(QPixmap())
         self.book_preview.setText("Book Cover Preview")   
@@ -1144,56 +1086,82 @@ class AddBookDialog(QDialog):
             self.reset_cover_preview() 
             return
             
+        # Clear previous preview before searching
+        self.reset_cover_preview()
+        
+        # Search using Google Books API without blocking the window
+        self.search_via_api(title, author, isbn)
+    
+    def search_via_api(self, title, author, isbn):
+        """Start a Google Books lookup; the answer arrives in _on_lookup_finished/_on_lookup_failed"""
+        self._lookup_inputs = (title, author, isbn)
+        self._lookup_key = self.lookup_service.lookup(title, author, isbn)
+        self.search_btn.setEnabled(False)
+        self.search_btn.setText("Searching...")
+    
+    def _finish_lookup(self, key):
+        """Return the inputs of the search this answer belongs to, or None for a stale answer"""
+        if key != self._lookup_key:
+            return None
+        self._lookup_key = None
+        self.search_btn.setEnabled(True)
+        self.search_btn.setText("Search & Verify Book")
+        return self._lookup_inputs
+    
+    def _on_lookup_finished(self, key, data):
+        """Process the Google Books answer for the current search"""
+        inputs = self._finish_lookup(key)
+        if inputs is None:
+            return
+        title, author, isbn = inputs
         try:
-            # Clear previous preview before searching
-            self.reset_cover_preview()
-            
-            # Search using Google Books API
-            self.search_via_api(title, author, isbn)
-                
-        except requests.exceptions.RequestException as e:
-            # Handle network connectivity errors
-            QMessageBox.warning(self, "Network Error", "Unable to search books. Please check your internet connection")
-            self.found_book_data = None
+            # Check if API returned any results
+            if 'items' not in data or len(data['items']) == 0:
+                # No results found - redirect to manual entry
+                self.open_manual_entry(title, author, isbn)
+                return
+
+            # Process the first result from API response
+            self.process_api_result(data['items'][0]['volumeInfo'], isbn)
+        except Exception as e:
+            # Handle any other unexpected errors
+            QMessageBox.warning(self, "Search Error", f"Error: {e}")
+            self.open_manual_entry(title, author, isbn)
             self.reset_cover_preview()
-            
-        except requests.exceptions.HTTPError as e:
+    
+    def _on_lookup_failed(self, key, kind, status, message):
+        """Report a failed Google Books lookup for the current search"""
+        inputs = self._finish_lookup(key)
+        if inputs is None:
+            return
+        self.found_book_data = None
+        if kind == "http":
             # Handle HTTP errors (API key issues, etc.)
-            if hasattr(self, 'response') and self.response.status_code == 403:
+            if status == 403:
                 QMessageBox.warning(self, "API Error", "Invalid API key")
             else:
-                QMessageBox.warning(self, "API Error", f"HTTP Error: {e}")
+                QMessageBox.warning(self, "API Error", f"HTTP Error: {message}")
             self.reset_cover_preview()
-            
-        except Exception as e:
+        elif kind == "network":
+            # Handle network connectivity errors
+            QMessageBox.warning(self, "Network Error", "Unable to search books. Please check your internet connection")
+            self.reset_cover_preview()
+        else:
             # Handle any other unexpected errors
-            QMessageBox.warning(self, "Search Error", f"Error: {e}")
-            self.open_manual_entry(title, author, isbn)
+            QMessageBox.warning(self, "Search Error", f"Error: {message}")
+            self.open_manual_entry(*inputs)
             self.reset_cover_preview()
     
-    def search_via_api(self, title, author, isbn):
-        """Perform the actual API search and process results"""
-        # Prepare API request
-        API_KEY = os.getenv('GOOGLE_BOOKS_API_KEY')
-        
-        # Build search query combining ISBN, title, and author
-        search_term = [f"isbn:{isbn}", f"{title}", f"{author}"]
-        query = " ".join(search_term) 
-        url = f"https://www.googleapis.com/books/v1/volumes?q={query}&key={API_KEY}"
-        
-        # Send request to Google Books API
-        self.response = requests.get(url, timeout=10)
-        self.response.raise_for_status()
-        data = self.response.json()
-
-        # Check if API returned any results
-        if 'items' not in data or len(data['items']) == 0:
-            # No results found - redirect to manual entry
-            self.open_manual_entry(title, author, isbn)
-            return
-
-        # Process the first result from API response
-        self.process_api_result(data['items'][0]['volumeInfo'], isbn)
+    def done(self, result):
+        """Stop listening for lookups once the dialog closes"""
+        try:
+            self.lookup_service.finished.disconnect(self._on_lookup_finished)
+            self.lookup_service.failed.disconnect(self._on_lookup_failed)
+            self.cover_downloader.downloaded.disconnect(self._on_cover_downloaded)
+            self.cover_downloader.failed.disconnect(self._on_cover_failed)
+        except (RuntimeError, TypeError):
+            pass
+        super().done(result)
     
     def process_api_result(self, book_info, input_isbn):
         """Process API search result and update UI with book information"""
@@ -1356,59 +1324,36 @@ class AddBookDialog(QDialog):
         """)
             
     def load_cover(self, image_url):
-        """Download and display book cover image from URL"""
-        try:
-            # Download image from the provided URL
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-
-            # Create QPixmap from downloaded image data
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            
-            if not pixmap.isNull():
-                # Scale and display the image
-                self.display_cover_image(pixmap, response.content)
-            else:
-                # Image failed to load - show placeholder
-                self.show_cover_placeholder()
-                
-        except Exception as e:
-            # Handle any errors during image loading
+        """Download the book cover in the background; it is displayed once stored"""
+        self._cover_url = image_url
+        self.cover_downloader.download(image_url)
+    
+    def _on_cover_downloaded(self, url, image_path):
+        """Show the downloaded cover if it belongs to the current search"""
+        if url == self._cover_url:
+            self.display_cover_image(image_path)
+    
+    def _on_cover_failed(self, url, message):
+        """Handle a cover that could not be downloaded"""
+        if url == self._cover_url:
             self.show_cover_error()
     
-    def display_cover_image(self, pixmap, image_content):
-        """Display the book cover image and save it locally"""
+    def display_cover_image(self, image_path):
+        """Display the stored book cover image and remember its path"""
         # Scale image to fit preview area while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self.book_preview.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        pixmap = load_pixmap_safely(image_path, self.book_preview.size())
+        if pixmap is None:
+            # Image failed to load - show placeholder
+            self.show_cover_placeholder()
+            return
         
         # Display the scaled image and clear placeholder styling
-        self.book_preview.setPixmap(scaled_pixmap)
+        self.book_preview.setPixmap(pixmap)
         self.book_preview.setStyleSheet("")
 
-        # Save image locally in assets folder
-        self.save_cover_locally(image_content)
-    
-    def save_cover_locally(self, image_content):
-        """Save the book cover image to local assets folder"""
-        # Create assets folder if it doesn't exist
-        if not os.path.exists('assets'): 
-            os.makedirs('assets')
-            
-        # Use ISBN for filename, fallback to 'temp' if not available
-        isbn = self.found_book_data.get('isbn', 'temp')
-        image_path = os.path.normpath(os.path.join('assets', f"book_cover_{isbn}.png"))
-        
-        # Write image data to local file
-        with open(image_path, 'wb') as f:
-            f.write(image_content)
-            
         # Store local image path in book data
-        self.found_book_data['image'] = image_path
+        if self.found_book_data:
+            self.found_book_data['image'] = image_path
     
     def show_cover_placeholder(self):
         """Show placeholder when cover image fails to load"""
@@ -1474,7 +1419,7 @@ class BookDetailsDialog(QDialog):
         self.parent = parent
         self.book_data = book_data or {}
         self.is_found_book = is_found_book
-        self.image_preview_size = QSize(180, 210)
+        self.image_preview_size = FORM_COVER_SIZE
         self.selected_genres = []
         
         # Initialize database connection and librarian ID
@@ -1950,17 +1895,8 @@ class BookDetailsDialog(QDialog):
         )
         if file_path:
             try:
-                # Create assets directory if it doesn't exist
-                if not os.path.exists('assets'):
-                    os.makedirs('assets')
-                
-                # Generate filename using ISBN or fallback to 'temp'
-                isbn = clean_isbn(self.isbn_edit.text().strip()) or 'temp'
-                filename = f"book_cover_{isbn}.png"
-                image_path = os.path.normpath(os.path.join('assets', filename))
-                
-                # Copy file to assets directory
-                shutil.copy(file_path, image_path)
+                # Store the file by content hash (thumbnails are built at the same time)
+                image_path = store_cover_file(file_path)
                 
                 if os.path.exists(image_path):
                     # Update book data and UI with new image
@@ -2087,10 +2023,10 @@ class BookDetailsDialog(QDialog):
         book_columns = ['BookTitle', 'Publisher', 'BookDescription', 'BookShelf', 'ISBN', 
                        'BookTotalCopies', 'BookAvailableCopies', 'BookCover', 'LibrarianID']
         
-        self.db_seeder.seed_data(tableName="Book", data=[book_data], columnOrder=book_columns)
-
-        # Retrieve the BookCode of the newly inserted book
-        return self._get_inserted_book_code()
+        book_codes = self.db_seeder.seed_batch(tableName="Book", data=[book_data], columnOrder=book_columns)
+        if not book_codes:
+            raise Exception("Could not insert the book")
+        return book_codes[0]
 
     def _get_or_create_shelf_id(self, shelf_name):
         """Get shelf ID from database or create new shelf if it doesn't exist"""
@@ -2105,36 +2041,13 @@ class BookDetailsDialog(QDialog):
         
         # Create new shelf if it doesn't exist
         if shelf_id is None:
-            self.db_seeder.seed_data("BookShelf", [{"ShelfName": shelf_name, "LibrarianID": self.librarian_id}], 
-                                     ["ShelfName", "LibrarianID"])
-            
-            # Get the newly created shelf ID
-            shelf_records = self.db_seeder.get_all_records("BookShelf", self.librarian_id)
-            for shelf_record in shelf_records:
-                if shelf_record['ShelfName'] == shelf_name:
-                    shelf_id = shelf_record['ShelfId']
-                    break
+            shelf_ids = self.db_seeder.seed_batch("BookShelf", [{"ShelfName": shelf_name, "LibrarianID": self.librarian_id}], 
+                                                  ["ShelfName", "LibrarianID"])
+            if shelf_ids:
+                shelf_id = shelf_ids[0]
         
         return shelf_id
 
-    def _get_inserted_book_code(self):
-        """Retrieve the BookCode of the newly inserted book"""
-        conn, cursor = self.db_seeder.get_connection_and_cursor()
-        try:
-            cursor.execute("""
-                SELECT BookCode FROM Book 
-                WHERE BookTitle = ? AND ISBN = ? AND LibrarianID = ?
-                ORDER BY BookCode DESC LIMIT 1
-            """, (self.book_data['title'], self.book_data['isbn'], self.librarian_id))
-            
-            result = cursor.fetchone()
-            if not result:
-                raise Exception("Could not find the inserted book")
-            
-            return result[0]
-        finally:
-            conn.close()
-
     def _save_related_data(self, book_code, authors, genres):
         """Save author and genre records for the book"""
         # Insert author records
@@ -2303,60 +2216,15 @@ class CollapsibleSidebar(QWidget):
     def load_books_from_database(self):
         """Load and process books data from database with related authors and genres"""
         try:
-            # Retrieve data from all related tables using librarian ID for filtering
-            books = self.db_seeder.get_all_records("Book", self.librarian_id or 1)
-            book_authors = self.db_seeder.get_all_records("BookAuthor", self.librarian_id or 1)
-            book_genres = self.db_seeder.get_all_records("Book_Genre", self.librarian_id or 1)
-            book_shelf = self.db_seeder.get_all_records("BookShelf", self.librarian_id or 1)
-            
-            # Clear existing books data and process each book record
-            self.books_data = []
-            
-            for book in books:
-                try:
-                    book_code = book.get("BookCode")
-                    if not book_code:
-                        continue
-                    
-                    # Get related data for this book
-                    book_authors_list = [
-                        author["bookAuthor"] for author in book_authors 
-                        if author.get("BookCode") == book_code and author.get("bookAuthor")
-                    ] or ["Unknown Author"]
-                    
-                    book_genres_list = [
-                        genre["Genre"] for genre in book_genres 
-                        if genre.get("BookCode") == book_code and genre.get("Genre")
-                    ] or ["Unknown Genre"]
-                    
-                    # Find shelf name for the BookShelf ID
-                    shelf_name = self._get_shelf_name(book.get("BookShelf"), book_shelf)
-                    
-                    # Create book data dictionary
-                    book_data = {
-                        "book_code": book_code,
-                        "title": book.get("BookTitle", "Unknown Title"),
-                        "author": book_authors_list,
-                        "genre": book_genres_list,
-                        "isbn": book.get("ISBN", ""),
-                        "publisher": book.get("Publisher", "Unknown Publisher"), 
-                        "description": book.get("BookDescription", ""),
-                        "shelf": shelf_name,
-                        "copies": book.get("BookTotalCopies", 0),
-                        "available_copies": book.get("BookAvailableCopies", 0),
-                        "image": book.get("BookCover", "")
-                    }
-                    
-                    self.books_data.append(book_data)
-                    
-                except Exception as e:
-                    continue
+            # Books arrive with authors, genres and shelf name already attached
+            books = self.db_seeder.get_books_with_details(self.librarian_id or 1)
+            self.books_data = [self._build_book_data(book) for book in books if book.get("BookCode")]
             
             # Store original data for search functionality
             self.original_books_data = self.books_data.copy()
             
             # Populate the display if grid layout exists
-            if hasattr(self, 'grid_layout'):
+            if hasattr(self, 'book_model'):
                 self.populate_books()
                 
         except Exception as e:
@@ -2364,22 +2232,22 @@ class CollapsibleSidebar(QWidget):
             self.books_data = []
             self.original_books_data = []
 
-    def _get_shelf_name(self, book_shelf_id, book_shelf_records):
-        """Get shelf name from shelf ID"""
-        shelf_name = ""
-        if book_shelf_id:
-            try:
-                book_shelf_id_int = int(book_shelf_id)
-            except (ValueError, TypeError):
-                book_shelf_id_int = None
-                
-            for shelf in book_shelf_records:
-                shelf_id = shelf.get("ShelfId")
-                if shelf_id == book_shelf_id_int or str(shelf_id) == str(book_shelf_id):
-                    shelf_name = shelf.get("ShelfName", "")
-                    break
-        return shelf_name
-    
+    def _build_book_data(self, book):
+        """Convert a book record from get_books_with_details into the UI format"""
+        return {
+            "book_code": book.get("BookCode"),
+            "title": book.get("BookTitle", "Unknown Title"),
+            "author": [author for author in book.get("Authors", []) if author] or ["Unknown Author"],
+            "genre": [genre for genre in book.get("Genres", []) if genre] or ["Unknown Genre"],
+            "isbn": book.get("ISBN", ""),
+            "publisher": book.get("Publisher", "Unknown Publisher"), 
+            "description": book.get("BookDescription", ""),
+            "shelf": book.get("ShelfName") or "",
+            "copies": book.get("BookTotalCopies", 0),
+            "available_copies": book.get("BookAvailableCopies", 0),
+            "image": book.get("BookCover", "")
+        }
+
     #SORTING BOOKS 
     def show_sort_options(self):
         """Show a popup menu with sorting options"""
@@ -2448,52 +2316,9 @@ class CollapsibleSidebar(QWidget):
 
     def _process_book_records(self, book_records):
         """Helper method to process book records from database into UI format"""
-        book_authors = self.db_seeder.get_all_records("BookAuthor", self.librarian_id or 1)
-        book_genres = self.db_seeder.get_all_records("Book_Genre", self.librarian_id or 1)
-        book_shelf = self.db_seeder.get_all_records("BookShelf", self.librarian_id or 1)
-        
-        processed_books = []
-        for book in book_records:
-            try:
-                book_code = book.get("BookCode")
-                if not book_code:
-                    continue
-                
-                # Get related data for this book
-                book_authors_list = [
-                    author["bookAuthor"] for author in book_authors 
-                    if author.get("BookCode") == book_code and author.get("bookAuthor")
-                ] or ["Unknown Author"]
-                
-                book_genres_list = [
-                    genre["Genre"] for genre in book_genres 
-                    if genre.get("BookCode") == book_code and genre.get("Genre")
-                ] or ["Unknown Genre"]
-                
-                # Find shelf name
-                shelf_name = self._get_shelf_name(book.get("BookShelf"), book_shelf)
-                
-                # Create book data dictionary
-                book_data = {
-                    "book_code": book_code,
-                    "title": book.get("BookTitle", "Unknown Title"),
-                    "author": book_authors_list,
-                    "genre": book_genres_list,
-                    "isbn": book.get("ISBN", ""),
-                    "publisher": book.get("Publisher", "Unknown Publisher"), 
-                    "description": book.get("BookDescription", ""),
-                    "shelf": shelf_name,
-                    "copies": book.get("BookTotalCopies", 0),
-                    "available_copies": book.get("BookAvailableCopies", 0),
-                    "image": book.get("BookCover", "")
-                }
-                
-                processed_books.append(book_data)
-                
-            except Exception:
-                continue
-        
-        return processed_books
+        # One batched query attaches authors, genres and shelf names, keeping the sort order
+        books = self.db_seeder.hydrate_books(book_records, self.librarian_id or 1)
+        return [self._build_book_data(book) for book in books]
 
     def show_shelf_view(self):
         """Show books organized by shelf location"""
@@ -2689,8 +2514,8 @@ class CollapsibleSidebar(QWidget):
         # Create search bar
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search books...")
+        self.search_bar.setToolTip("Words match from their start. Begin with * to match inside words, e.g. *otter")
         self.search_bar.setFixedSize(300, 50)
-        self.search_bar.returnPressed.connect(self.perform_search)
         self.search_bar.setStyleSheet("""
             QLineEdit {
                 color: #5C4033; font-size: 16px; padding: 10px 15px; background-color: #FFFEF0;
@@ -2698,7 +2523,12 @@ class CollapsibleSidebar(QWidget):
             }
             QLineEdit:focus { border-color: #8B4513; background-color: white; }
         """)
-        self.search_bar.textChanged.connect(self.perform_search)
+        # Search as the user types: debounced, queried on a worker thread (Enter searches at once)
+        self.search_controller = SearchController(self.search_bar, self._search_books,
+                                                  narrow=self._book_matches_query, limit=SEARCH_LIMIT)
+        self.search_controller.results.connect(self._show_search_results)
+        self.search_controller.cleared.connect(self._show_all_books)
+        self.search_controller.failed.connect(self._search_failed)
 
         # Create control buttons
         button_style = """
@@ -2740,7 +2570,7 @@ class CollapsibleSidebar(QWidget):
         return search_container
     
     def show_add_options(self):
-        """Show dropdown menu with Add Book and Add Shelf options"""
+        """Show dropdown menu with Add Book, Add Shelf and Import Catalogue options"""
         add_menu = QMenu(self)
         add_menu.setStyleSheet("""
             QMenu {
@@ -2753,10 +2583,16 @@ class CollapsibleSidebar(QWidget):
         # Add options
         add_menu.addAction("Add Book", self.show_add_book_dialog)
         add_menu.addAction("Add Shelf", self.show_add_shelf_dialog)
+        add_menu.addAction("Import Catalogue", self.show_import_catalogue_dialog)
         
         # Show menu at button position
         add_menu.exec(self.add_button.mapToGlobal(self.add_button.rect().bottomLeft()))
 
+    def show_import_catalogue_dialog(self):
+        """Show dialog to bulk import books from a CSV/JSON file"""
+        dialog = CatalogueImportDialog(self)
+        dialog.exec()
+
     def show_add_shelf_dialog(self):
         """Show dialog to add a new bookshelf"""
         # Create the add shelf dialog
@@ -2906,60 +2742,45 @@ class CollapsibleSidebar(QWidget):
         """
             
     def perform_search(self):
-        """Perform search based on search bar text"""
-        search_text = self.search_bar.text().strip()
-        
-        if search_text:
-            # Search using database
-            try:
-                search_results = self.db_seeder.search_records("Book", search_text, self.librarian_id or 1)
-                self.books_data = [self._format_book_for_ui(book) for book in search_results]
-            except Exception:
-                # Fallback to local search if database fails
-                self._perform_local_search(search_text)
-        else:
-            # Restore all books when search is cleared
-            self.load_books_from_database()
-        
+        """Search for the search bar text right away (search button)"""
+        self.search_controller.search_now()
+
+    def _search_books(self, search_text):
+        """Matching books in UI format; runs on the search controller's worker thread"""
+        # a leading * asks for the mid-word search, e.g. *otter finds Potter
+        substring = search_text.startswith("*")
+        search_results = self.db_seeder.search_records("Book", search_text.lstrip("*").strip(),
+                                                       self.librarian_id or 1, substring=substring)
+        return self._process_book_records(search_results)
+
+    def _show_search_results(self, search_text, books):
+        self.books_data = books
+        self.populate_books()
+
+    def _search_failed(self, search_text, message):
+        # Fallback to local search if database fails
+        self._perform_local_search(search_text)
+        self.populate_books()
+
+    def _show_all_books(self):
+        # Restore all books when search is cleared
+        self.load_books_from_database()
         self.populate_books()
 
+    def _book_matches_query(self, book, search_text):
+        """Match a book the way _search_books does (every word a prefix, or mid-word after a *), to narrow results"""
+        authors = [author for author in book.get('author', []) if author != "Unknown Author"]
+        genres = [genre for genre in book.get('genre', []) if genre != "Unknown Genre"]
+        fields = (book.get('title'), book.get('isbn'), book.get('publisher'), book.get('description'), authors, genres)
+        if search_text.startswith("*"):
+            return substring_match(search_text.lstrip("*").strip(), *fields)
+        return prefix_match(search_text, *fields)
+
     def _format_book_for_ui(self, book):
         """Format database book record for UI display"""
         try:
-            # Get related data
-            book_authors = self.db_seeder.get_all_records("BookAuthor", self.librarian_id or 1)
-            book_genres = self.db_seeder.get_all_records("Book_Genre", self.librarian_id or 1)
-            book_shelf = self.db_seeder.get_all_records("BookShelf", self.librarian_id or 1)
-            
-            book_code = book.get("BookCode", "")
-            
-            # Get authors and genres for this book
-            authors = [
-                author["bookAuthor"] for author in book_authors 
-                if author.get("BookCode") == book_code and author.get("bookAuthor")
-            ] or ["Unknown Author"]
-            
-            genres = [
-                genre["Genre"] for genre in book_genres 
-                if genre.get("BookCode") == book_code and genre.get("Genre")
-            ] or ["Unknown Genre"]
-            
-            # Get shelf name
-            shelf_name = self._get_shelf_name(book.get("BookShelf"), book_shelf)
-            
-            return {
-                "book_code": book_code,
-                "title": book.get("BookTitle", "Unknown Title"),
-                "author": authors,
-                "genre": genres,
-                "isbn": book.get("ISBN", ""),
-                "publisher": book.get("Publisher", "Unknown Publisher"),
-                "description": book.get("BookDescription", ""),
-                "shelf": shelf_name,
-                "copies": book.get("BookTotalCopies", 0),
-                "available_copies": book.get("BookAvailableCopies", 0),
-                "image": book.get("BookCover", "")
-            }
+            books = self._process_book_records([book])
+            return books[0] if books else {}
         except Exception:
             return {}
 
@@ -3031,153 +2852,21 @@ class CollapsibleSidebar(QWidget):
         """)
         books_layout.addWidget(books_title)
         
-        # Create scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                width: 12px;
-                background-color: #f0f0f0;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #5C4033;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #8B4513;
-            }
-        """)
-        
-        # Create scrollable content widget
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background-color: transparent;")
-          # Use grid layout with multiple columns
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(15)
-        self.grid_layout.setContentsMargins(15, 15, 15, 15)
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        
-        for i in range(6):  
-            self.grid_layout.setColumnStretch(i, 1)   
-        
-        scroll_area.setWidget(self.scroll_content)
-        books_layout.addWidget(scroll_area)
+        # Virtualized grid: the delegate paints only the cards in view and the
+        # model hands rows to the view in batches as the user scrolls
+        self.book_model = BookGridModel(self)
+        self.book_delegate = BookCardDelegate(self)
+        self.book_view = BookGridView()
+        self.book_view.setModel(self.book_model)
+        self.book_view.setItemDelegate(self.book_delegate)
+        self.book_view.clicked.connect(lambda index: self.show_book_preview(index.data(BookRole)))
+        books_layout.addWidget(self.book_view)
         
         return books_container
     
     def populate_books(self):
-        """Populate the books grid layout with book cards"""
-        # Clear existing book card widgets from the grid
-        self._clear_grid_layout()
-        
-        # Add book cards to grid layout (6 books per row)
-        columns_per_row = 6
-        for index, book in enumerate(self.books_data):
-            row = index // columns_per_row
-            col = index % columns_per_row            
-            
-            book_card = self.create_book_card(book)
-            self.grid_layout.addWidget(book_card, row, col)
-
-    def _clear_grid_layout(self):
-        """Clear all widgets from the grid layout"""
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-    
-    def create_book_card(self, book_data):
-        """Create a clickable book card widget with cover, title, and author"""
-        # Create main card button widget
-        card_widget = QPushButton()
-        card_widget.setFixedSize(200, 280)
-        card_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        # Connect click event and apply styling
-        card_widget.clicked.connect(lambda checked, data=book_data: self.show_book_preview(data))
-        card_widget.setStyleSheet(self._get_book_card_style())
-        
-        # Create card layout and content
-        card_layout = QVBoxLayout(card_widget)
-        card_layout.setContentsMargins(10, 10, 10, 8)
-        card_layout.setSpacing(8)
-        
-        # Add book cover, title, and author
-        book_cover = self._create_book_cover(book_data)
-        title_label = self._create_book_title_label(book_data["title"])
-        author_label = self._create_book_author_label(book_data["author"])
-        
-        card_layout.addWidget(book_cover, alignment=Qt.AlignCenter)
-        card_layout.addWidget(title_label)
-        card_layout.addWidget(author_label)
-        
-        return card_widget
-
-    def _get_book_card_style(self):
-        """Get book card styling"""
-        return """
-            QPushButton {
-                background-color: #f8f8f8; border-radius: 12px; border: 2px solid #e0e0e0; text-align: center;
-            }
-            QPushButton:hover { background-color: #f0f0f0; border-color: #5C4033; }
-            QPushButton:pressed { background-color: #e8e8e8; }
-        """
-
-    def _create_book_cover(self, book_data):
-        """Create book cover image widget"""
-        book_cover = QLabel()
-        book_cover.setFixedSize(150, 200)
-        book_cover.setAlignment(Qt.AlignCenter)
-        book_cover.setStyleSheet("""
-            QLabel { background-color: #dbcfc1; border-radius: 8px; border: 2px solid #5C4033; }
-        """)
-        
-        # Load book cover image using shared utility function
-        image_path = book_data.get("image", "")
-        pixmap = load_pixmap_safely(image_path, QSize(150, 200))
-        
-        if pixmap and not pixmap.isNull():
-            book_cover.setPixmap(pixmap)
-            book_cover.setStyleSheet("QLabel { border-radius: 8px; border: 2px solid #5C4033; }")
-        
-        return book_cover
-
-    def _create_book_title_label(self, title):
-        """Create book title label"""
-        title_label = QLabel(title)
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setWordWrap(True)
-        title_label.setMaximumHeight(35)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #5C4033; font-size: 14px; font-weight: bold; background-color: transparent;
-                border: none; padding: 2px;
-            }
-        """)
-        return title_label
-
-    def _create_book_author_label(self, authors):
-        """Create book author label"""
-        author_text = format_authors_display(authors)
-        author_label = QLabel(author_text)
-        author_label.setAlignment(Qt.AlignCenter)
-        author_label.setWordWrap(True)
-        author_label.setMaximumHeight(25)
-        author_label.setStyleSheet("""
-            QLabel {
-                color: #8B4513; font-size: 12px; background-color: transparent;
-                border: none; padding: 1px;
-            }
-        """)
-        return author_label 
+        """Show books_data in the book grid"""
+        self.book_model.set_books(self.books_data)
     
     def show_book_preview(self, book_data):
         """Show book preview dialog"""
@@ -3219,6 +2908,12 @@ class CollapsibleSidebar(QWidget):
         """Refresh the books display"""
         self.load_books_from_database()
 
+    def refresh_page(self, changed_tables):
+        """Reload the books when navigation shows this page again after they changed"""
+        self.load_books_from_database()
+        if self.search_controller.text():
+            self.search_controller.refresh()
+
     def show_add_book_dialog(self):
         """Show the book add dialog"""
         dialog = AddBookDialog(self)
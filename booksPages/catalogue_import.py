@@ -0,0 +1,352 @@
+import os
+import re
+import sys
+import time
+import argparse
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QProgressBar, QFileDialog, QMessageBox, QCheckBox)
+from tryDatabase import DatabaseSeeder, insert_rows
+from .isbn_store import FIELD_ALIASES, clean_isbn, normalize_isbn, pick_field, read_dump, split_list
+
+# Column names accepted in catalogue files: the ISBN dump names plus shelf and copies.
+# "cover" (or image/BookCover) may be a local image file or a URL.
+CATALOGUE_FIELDS = dict(
+    FIELD_ALIASES,
+    shelf=("shelf", "BookShelf", "ShelfName", "location"),
+    copies=("copies", "BookTotalCopies", "quantity", "qty"),
+    image_url=FIELD_ALIASES["image_url"] + ("image", "BookCover", "cover_path"),
+)
+
+BOOK_COLUMNS = ["BookTitle", "Publisher", "BookDescription", "ISBN", "BookTotalCopies",
+                "BookAvailableCopies", "BookCover", "LibrarianID", "BookShelf"]
+
+
+# Validate shelf format (A-Z followed by 1-5 digits)
+def validate_shelf_format(shelf):
+    return bool(re.match(r'^[A-Z][0-9]{1,5}$', shelf))
+
+
+def chunked(records, size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class CatalogueImporter:
+    """Streams catalogue records into Book, BookAuthor and Book_Genre.
+
+    The librarian's ISBNs and shelves are read once up front. Every chunk is
+    validated and its local cover files stored (relative paths are resolved
+    against the catalogue file's folder) before the chunk is inserted with
+    executemany inside one transaction, so the write lock isn't held while
+    images are copied and thumbnailed. progress(stats) is called after each
+    chunk with the running counts and rows_per_second.
+    """
+
+    def __init__(self, librarian_id, db_seeder=None, chunk_size=1000, download_covers=False, progress=None):
+        self.librarian_id = librarian_id
+        self.db_seeder = db_seeder or DatabaseSeeder()
+        self.chunk_size = chunk_size
+        self.download_covers = download_covers
+        self.progress = progress
+        self.base_dir = None
+        self.isbns = set()
+        self.shelves = {}
+        self.stats = {"read": 0, "imported": 0, "duplicates": 0, "invalid": 0,
+                      "shelves_created": 0, "covers": 0, "rows_per_second": 0.0, "elapsed": 0.0}
+
+    def _load_existing(self, cursor):
+        # archived books count as duplicates too, like handleDuplication
+        cursor.execute("SELECT ISBN FROM Book WHERE LibrarianID = ?", (self.librarian_id,))
+        self.isbns = {normalize_isbn(str(row[0])) for row in cursor.fetchall()}
+        self.isbns.discard(None)
+        cursor.execute("SELECT ShelfId, ShelfName FROM BookShelf WHERE LibrarianID = ? AND isDeleted IS NULL",
+                       (self.librarian_id,))
+        self.shelves = {name: shelf_id for shelf_id, name in cursor.fetchall()}
+
+    def prepare(self, record):
+        """Validate one record and turn it into a book dict, or None if it is skipped"""
+        title = str(pick_field(record, "title", CATALOGUE_FIELDS) or "").strip()
+        isbn = clean_isbn(str(pick_field(record, "isbn", CATALOGUE_FIELDS) or ""))
+        key = normalize_isbn(isbn)
+        if not title or key is None:
+            self.stats["invalid"] += 1
+            return None
+        if key in self.isbns:
+            self.stats["duplicates"] += 1
+            return None
+        self.isbns.add(key)
+
+        shelf = str(pick_field(record, "shelf", CATALOGUE_FIELDS) or "").strip().upper()
+        try:
+            copies = max(int(pick_field(record, "copies", CATALOGUE_FIELDS) or 1), 1)
+        except (TypeError, ValueError):
+            copies = 1
+        cover = str(pick_field(record, "image_url", CATALOGUE_FIELDS) or "").strip()
+        if cover and not cover.startswith(("http://", "https://")):
+            cover = self._store_local_cover(cover)
+        return {
+            "title": title,
+            "isbn": isbn,
+            "publisher": str(pick_field(record, "publisher", CATALOGUE_FIELDS) or "").strip(),
+            "description": str(pick_field(record, "description", CATALOGUE_FIELDS) or "").strip(),
+            "authors": list(dict.fromkeys(split_list(pick_field(record, "authors", CATALOGUE_FIELDS)))),
+            "genres": list(dict.fromkeys(split_list(pick_field(record, "categories", CATALOGUE_FIELDS)))),
+            "shelf": shelf if validate_shelf_format(shelf) else None,
+            "copies": copies,
+            "cover": cover,
+        }
+
+    def _store_local_cover(self, cover):
+        # a catalogue that ships covers/x.jpg means next to the catalogue file
+        from .cover_ingest import store_cover_file
+        path = os.path.join(self.base_dir or os.getcwd(), os.path.expanduser(cover))
+        if not os.path.isfile(path):
+            print(f"✗ Skipping cover {cover}: no such file")
+            return ""
+        try:
+            return store_cover_file(path)
+        except (OSError, ValueError) as e:
+            print(f"✗ Skipping cover {cover}: {e}")
+            return ""
+
+    def _insert_chunk(self, cursor, books):
+        # shelves that don't exist yet are created once, in the same transaction
+        for name in dict.fromkeys(book["shelf"] for book in books if book["shelf"]):
+            if name not in self.shelves:
+                cursor.execute("INSERT INTO BookShelf (ShelfName, LibrarianID) VALUES (?, ?)",
+                               (name, self.librarian_id))
+                self.shelves[name] = cursor.lastrowid
+                self.stats["shelves_created"] += 1
+
+        # the write lock is held, so insert_rows can hand back the consecutive codes of this batch
+        codes = insert_rows(cursor, "Book", BOOK_COLUMNS, [
+            (book["title"], book["publisher"], book["description"], book["isbn"], book["copies"],
+             book["copies"], "" if book["cover"].startswith(("http://", "https://")) else book["cover"],
+             self.librarian_id, self.shelves.get(book["shelf"]))
+            for book in books])
+
+        cursor.executemany("INSERT OR IGNORE INTO BookAuthor (BookCode, bookAuthor) VALUES (?, ?)",
+                           [(code, author) for code, book in zip(codes, books) for author in book["authors"]])
+        cursor.executemany("INSERT OR IGNORE INTO Book_Genre (BookCode, Genre) VALUES (?, ?)",
+                           [(code, genre) for code, book in zip(codes, books) for genre in book["genres"]])
+        return {code: book["cover"] for code, book in zip(codes, books)
+                if book["cover"].startswith(("http://", "https://"))}
+
+    def _fetch_covers(self, cursor, conn, urls):
+        from .cover_ingest import download_covers
+        paths = download_covers(urls)
+        if paths:
+            cursor.executemany("UPDATE Book SET BookCover = ? WHERE BookCode = ?",
+                               [(path, code) for code, path in paths.items()])
+            conn.commit()
+            self.db_seeder.catalogue.invalidate("Book")
+            self.stats["covers"] += len(paths)
+
+    def run(self, records, base_dir=None):
+        """Import records; local cover paths are relative to base_dir (default: the working directory)"""
+        self.base_dir = base_dir
+        conn, cursor = self.db_seeder.get_connection_and_cursor()
+        start = time.perf_counter()
+        try:
+            self._load_existing(cursor)
+            for chunk in chunked(records, self.chunk_size):
+                self.stats["read"] += len(chunk)
+                books = [book for book in map(self.prepare, chunk) if book]
+                if books:
+                    cursor.execute("BEGIN IMMEDIATE")
+                    try:
+                        cover_urls = self._insert_chunk(cursor, books)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    self.db_seeder.catalogue.invalidate("Book", "BookAuthor", "Book_Genre", "BookShelf")
+                    self.stats["imported"] += len(books)
+                    if self.download_covers and cover_urls:
+                        self._fetch_covers(cursor, conn, cover_urls)
+                elapsed = time.perf_counter() - start
+                self.stats["elapsed"] = elapsed
+                self.stats["rows_per_second"] = self.stats["imported"] / elapsed if elapsed else 0.0
+                if self.progress:
+                    self.progress(dict(self.stats))
+        finally:
+            conn.close()
+        print(f"✓ Imported {self.stats['imported']} books ({self.stats['duplicates']} duplicates, "
+              f"{self.stats['invalid']} invalid) at {self.stats['rows_per_second']:.0f} rows/s")
+        return dict(self.stats)
+
+    def import_file(self, path):
+        return self.run(read_dump(path), os.path.dirname(os.path.abspath(path)))
+
+
+def format_stats(stats):
+    return (f"{stats['read']:,} read · {stats['imported']:,} imported · {stats['duplicates']:,} duplicates · "
+            f"{stats['invalid']:,} invalid · {stats['rows_per_second']:,.0f} rows/s")
+
+
+class _ImportSignals(QObject):
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _ImportJob(QRunnable):
+    def __init__(self, path, librarian_id, download_covers, signals):
+        super().__init__()
+        self.path = path
+        self.librarian_id = librarian_id
+        self.download_covers = download_covers
+        self.signals = signals
+
+    def run(self):
+        try:
+            importer = CatalogueImporter(self.librarian_id, download_covers=self.download_covers,
+                                         progress=self.signals.progress.emit)
+            self.signals.finished.emit(importer.import_file(self.path))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+# Dialog for importing a whole catalogue file in the background
+class CatalogueImportDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_window = parent
+        self.librarian_id = getattr(parent, 'librarian_id', None) if parent else None
+        self.file_path = ""
+        self.signals = None
+        self.setWindowTitle("Import Catalogue")
+        self.setFixedSize(560, 320)
+        self.setStyleSheet("""QDialog {background-color: #f1efe3;} """)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(15)
+
+        title = QLabel("Import Catalogue")
+        title.setStyleSheet("QLabel { color: #5C4033; font-size: 24px; font-weight: bold; }")
+        layout.addWidget(title)
+
+        hint = QLabel("CSV, JSON or JSONL with title, isbn, authors, genres, publisher, shelf and copies columns.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("QLabel { color: #8B4513; font-size: 13px; }")
+        layout.addWidget(hint)
+
+        button_style = """
+            QPushButton {
+                background-color: #5C4033; color: white; padding: 10px 18px; border: none;
+                border-radius: 15px; font-size: 14px;
+            }
+            QPushButton:hover { background-color: #8B4513; }
+            QPushButton:disabled { background-color: #b8a99a; }
+        """
+        file_row = QHBoxLayout()
+        self.file_label = QLabel("No file selected")
+        self.file_label.setStyleSheet("QLabel { color: #5C4033; font-size: 14px; }")
+        choose_button = QPushButton("Choose File")
+        choose_button.setStyleSheet(button_style)
+        choose_button.clicked.connect(self.choose_file)
+        file_row.addWidget(self.file_label, 1)
+        file_row.addWidget(choose_button)
+        layout.addLayout(file_row)
+
+        self.covers_checkbox = QCheckBox("Download cover images from URLs")
+        self.covers_checkbox.setStyleSheet("QCheckBox { color: #5C4033; font-size: 14px; }")
+        layout.addWidget(self.covers_checkbox)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("QLabel { color: #5C4033; font-size: 13px; }")
+        layout.addWidget(self.status_label)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.import_button = QPushButton("Import")
+        self.import_button.setStyleSheet(button_style)
+        self.import_button.setEnabled(False)
+        self.import_button.clicked.connect(self.start_import)
+        self.close_button = QPushButton("Close")
+        self.close_button.setStyleSheet(button_style)
+        self.close_button.clicked.connect(self.reject)
+        buttons.addWidget(self.import_button)
+        buttons.addWidget(self.close_button)
+        layout.addLayout(buttons)
+
+    def choose_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Catalogue File", "", "Catalogue files (*.csv *.json *.jsonl)")
+        if file_path:
+            self.file_path = file_path
+            self.file_label.setText(os.path.basename(file_path))
+            self.import_button.setEnabled(True)
+
+    def start_import(self):
+        if not self.file_path:
+            return
+        if self.librarian_id is None:
+            QMessageBox.warning(self, "Import Error", "No librarian is logged in.")
+            return
+        self.import_button.setEnabled(False)
+        self.close_button.setEnabled(False)
+        # the total isn't known while streaming, so show a busy bar with running counts
+        self.progress_bar.setRange(0, 0)
+        self.status_label.setText("Importing...")
+        self.signals = _ImportSignals(self)
+        self.signals.progress.connect(lambda stats: self.status_label.setText(format_stats(stats)))
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+        QThreadPool.globalInstance().start(
+            _ImportJob(self.file_path, self.librarian_id, self.covers_checkbox.isChecked(), self.signals))
+
+    def _reset_controls(self):
+        self.progress_bar.setRange(0, 1)
+        self.close_button.setEnabled(True)
+        self.import_button.setEnabled(True)
+
+    def _on_finished(self, stats):
+        self._reset_controls()
+        self.progress_bar.setValue(1)
+        self.status_label.setText(format_stats(stats))
+        if hasattr(self.parent_window, 'refresh_books_display'):
+            self.parent_window.refresh_books_display()
+        QMessageBox.information(self, "Import Complete",
+                                f"Imported {stats['imported']:,} books in {stats['elapsed']:.1f} s.")
+
+    def _on_failed(self, message):
+        self._reset_controls()
+        self.status_label.setText("Import failed; the current chunk was rolled back.")
+        QMessageBox.warning(self, "Import Error", f"Error: {message}")
+
+
+if __name__ == "__main__":
+    # python -m booksPages.catalogue_import books.csv --librarian 1 [--chunk-size 1000] [--covers]
+    parser = argparse.ArgumentParser(description="Bulk import a CSV/JSON/JSONL catalogue into bjrsLib.db")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--librarian", type=int, required=True, help="LibrarianID that owns the books")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--covers", action="store_true", help="download cover URLs while importing")
+    parser.add_argument("--db", default="bjrsLib.db")
+    args = parser.parse_args()
+
+    seeder = DatabaseSeeder(args.db)
+    for path in args.files:
+        importer = CatalogueImporter(args.librarian, seeder, args.chunk_size, args.covers,
+                                     progress=lambda stats: print("  " + format_stats(stats), flush=True))
+        stats = importer.import_file(path)
+        print(f"{path}: {format_stats(stats)} ({stats['elapsed']:.1f} s)")
+    seeder.shutdown()
+    sys.exit(0)
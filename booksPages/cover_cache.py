@@ -0,0 +1,267 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+# Scaled covers kept in memory (BJRS_COVER_CACHE_MB overrides the budget) and
+# the folder for the on-disk thumbnails, in the project's assets/ whatever the
+# working directory. The oldest thumbnails are deleted once the folder passes
+# THUMBNAIL_BUDGET_MB (BJRS_THUMBNAIL_MB overrides it); they are rebuilt on demand.
+DEFAULT_BUDGET_MB = 48
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THUMBNAIL_DIR = os.path.join(PROJECT_DIR, "assets", "thumbnails")
+THUMBNAIL_BUDGET_MB = int(os.environ.get("BJRS_THUMBNAIL_MB", 256))
+
+
+def cover_key(image_path, target_size):
+    """Cache key for a cover: (path, mtime, file size, width, height), or None if the file is missing"""
+    if not image_path or not isinstance(image_path, str):
+        return None
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size,
+            target_size.width(), target_size.height())
+
+
+def _thumbnail_path(key):
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(THUMBNAIL_DIR, f"{digest}.png")
+
+
+def load_cover_image(key):
+    """Return the scaled QImage for a key, from the thumbnail tier or by decoding the original.
+
+    Only uses QImage, so it is safe to call from worker threads.
+    """
+    path, _, _, width, height = key
+    thumbnail = _thumbnail_path(key)
+    if os.path.exists(thumbnail):
+        image = QImage(thumbnail)
+        if not image.isNull():
+            return image
+
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    target = QSize(width, height)
+    original = reader.size()
+    if original.isValid():
+        # let the decoder produce (close to) the final size instead of the full image
+        reader.setScaledSize(original.scaled(target, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    if image.size() != image.size().scaled(target, Qt.KeepAspectRatio):
+        image = image.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    try:
+        os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+        temp_path = f"{thumbnail}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if image.save(temp_path, "PNG"):
+            os.replace(temp_path, thumbnail)
+    except OSError as e:
+        print(f"Error saving thumbnail for {path}: {e}")
+    return image
+
+
+def prune_thumbnails(budget_bytes=None):
+    """Delete the oldest thumbnails until the folder fits the budget; returns how many went"""
+    budget = THUMBNAIL_BUDGET_MB * 1024 * 1024 if budget_bytes is None else budget_bytes
+    try:
+        entries = [entry for entry in os.scandir(THUMBNAIL_DIR) if entry.is_file()]
+    except FileNotFoundError:
+        return 0
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, path in sorted(files):
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        print(f"✓ Pruned {removed} old cover thumbnails")
+    return removed
+
+
+class CoverCache:
+    """LRU of scaled cover QPixmaps bounded by a byte budget.
+
+    Misses fall back to the on-disk thumbnail and only then to the original
+    image, so once a cover has been shown the original is never decoded again
+    until the file changes.
+    """
+
+    def __init__(self, budget_bytes=None):
+        if budget_bytes is None:
+            try:
+                budget_bytes = int(os.environ.get("BJRS_COVER_CACHE_MB", DEFAULT_BUDGET_MB)) * 1024 * 1024
+            except ValueError:
+                budget_bytes = DEFAULT_BUDGET_MB * 1024 * 1024
+        self.budget_bytes = budget_bytes
+        self._pixmaps = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def cached(self, key):
+        """Return the pixmap for a key if it is in memory"""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self._stats["hits"] += 1
+        return pixmap
+
+    def put(self, key, image):
+        """Store a scaled QImage or QPixmap and return it as a QPixmap"""
+        pixmap = QPixmap.fromImage(image) if isinstance(image, QImage) else image
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= self._cost(old)
+        cost = self._cost(pixmap)
+        if cost <= self.budget_bytes:
+            self._pixmaps[key] = pixmap
+            self._bytes += cost
+            while self._bytes > self.budget_bytes:
+                _, evicted = self._pixmaps.popitem(last=False)
+                self._bytes -= self._cost(evicted)
+                self._stats["evictions"] += 1
+        return pixmap
+
+    def get(self, image_path, target_size):
+        """Return the scaled cover as a QPixmap, or None if it can't be loaded"""
+        key = cover_key(image_path, target_size)
+        if key is None:
+            return None
+        pixmap = self.cached(key)
+        if pixmap is not None:
+            return pixmap
+        self._stats["misses"] += 1
+        image = load_cover_image(key)
+        if image is None:
+            return None
+        return self.put(key, image)
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def stats(self):
+        return dict(self._stats, entries=len(self._pixmaps), bytes=self._bytes)
+
+
+# shared by the grid, the preview dialog and the edit view
+cover_cache = CoverCache()
+
+
+class _CoverJob(QRunnable):
+    """Decodes one cover into a QImage on a pool thread"""
+
+    def __init__(self, loader, key):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.cancelled = False
+
+    def run(self):
+        image = None
+        # a job cancelled after it was picked up still reports back so it leaves the pending list
+        if not self.cancelled:
+            try:
+                image = load_cover_image(self.key)
+            except Exception as e:
+                print(f"Error loading image {self.key[0]}: {e}")
+        self.loader._finished.emit(self.key, image, self.cancelled)
+
+
+class _PruneJob(QRunnable):
+    def run(self):
+        try:
+            prune_thumbnails()
+        except Exception as e:
+            print(f"Error pruning cover thumbnails: {e}")
+
+
+class CoverLoader(QObject):
+    """Loads covers on a QThreadPool and hands them to the GUI thread.
+
+    request() answers from the cover cache right away and otherwise queues a
+    decode job and returns None, so the caller can paint a placeholder and
+    repaint when cover_ready fires. cancel_pending(keep) drops queued jobs except
+    those for the keys in keep, e.g. when the grid scrolls (keeping the cards still
+    on screen) or a search replaces its rows.
+    """
+
+    cover_ready = Signal(object)
+    _finished = Signal(object, object, bool)
+
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or cover_cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() - 1))
+        self._pending = {}
+        self._failed = set()
+        self._finished.connect(self._on_finished)
+        # once per run, behind any covers the first screen asks for
+        self.pool.start(_PruneJob(), -1)
+
+    def request(self, image_path, target_size):
+        key = cover_key(image_path, target_size)
+        if key is None or key in self._failed:
+            return None
+        pixmap = self.cache.cached(key)
+        if pixmap is not None:
+            return pixmap
+        if key not in self._pending:
+            job = _CoverJob(self, key)
+            job.setAutoDelete(False)
+            self._pending[key] = job
+            self.pool.start(job)
+        return None
+
+    def cancel_pending(self, keep=()):
+        for key, job in list(self._pending.items()):
+            if key in keep:
+                continue
+            job.cancelled = True
+            # jobs that already started finish on their own
+            if self.pool.tryTake(job):
+                del self._pending[key]
+
+    def _on_finished(self, key, image, cancelled):
+        self._pending.pop(key, None)
+        if image is None:
+            if not cancelled:
+                self._failed.add(key)
+            return
+        # a cover decoded before its job was cancelled is still worth keeping
+        self.cache.put(key, image)
+        self.cover_ready.emit(key)
+
+
+_cover_loader = None
+
+
+# shared loader, created on first use once the QApplication exists
+def get_cover_loader():
+    global _cover_loader
+    if _cover_loader is None:
+        _cover_loader = CoverLoader()
+    return _cover_loader
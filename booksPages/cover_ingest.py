@@ -0,0 +1,209 @@
+import os
+import sys
+import hashlib
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from .book_grid import COVER_SIZE, FORM_COVER_SIZE, PREVIEW_COVER_SIZE
+from .cover_cache import PROJECT_DIR, THUMBNAIL_DIR, cover_key, load_cover_image
+
+# Covers are stored once per content: assets/covers/<first 2 hex>/<sha256>.<ext>,
+# in the project's assets/ whatever the working directory
+COVERS_DIR = os.path.join(PROJECT_DIR, "assets", "covers")
+
+# Sizes the UI shows covers at (grid card, preview dialog, add/details dialogs);
+# their thumbnails are written at ingest so no view decodes a full-size download
+THUMBNAIL_SIZES = (COVER_SIZE, PREVIEW_COVER_SIZE, FORM_COVER_SIZE)
+
+MAX_COVER_BYTES = 10 * 1024 * 1024
+
+# magic bytes -> file extension
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"BM", ".bmp"),
+)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# one Session for every download so connections to the image host are reused
+def get_session(pool_size=16):
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def detect_extension(data):
+    """File extension for image bytes, or None if they aren't a supported image"""
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def store_cover(data):
+    """Save image bytes under their content hash and pre-build the thumbnails.
+
+    Returns the stored path; identical images share one file. Raises ValueError
+    for data that isn't an image.
+    """
+    extension = detect_extension(data)
+    if extension is None:
+        raise ValueError("not a supported image")
+    digest = hashlib.sha256(data).hexdigest()
+    folder = os.path.join(COVERS_DIR, digest[:2])
+    path = os.path.normpath(os.path.join(folder, digest + extension))
+    if not os.path.exists(path):
+        os.makedirs(folder, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    for size in THUMBNAIL_SIZES:
+        key = cover_key(path, size)
+        if key is not None:
+            load_cover_image(key)
+    return path
+
+
+def store_cover_file(file_path):
+    """Ingest a local image file (e.g. an uploaded cover)"""
+    with open(file_path, "rb") as f:
+        return store_cover(f.read())
+
+
+def download_cover(url, timeout=10):
+    """Download one cover over the shared session and store it; returns the stored path.
+
+    The body is streamed, so a cover larger than MAX_COVER_BYTES is rejected from its
+    Content-Length or as soon as that many bytes arrived, never read into memory.
+    """
+    with get_session().get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > MAX_COVER_BYTES:
+            raise ValueError("cover image too large")
+        chunks, size = [], 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > MAX_COVER_BYTES:
+                raise ValueError("cover image too large")
+            chunks.append(chunk)
+    return store_cover(b"".join(chunks))
+
+
+def download_covers(urls, max_workers=8):
+    """Download many covers concurrently.
+
+    urls maps any key (ISBN, BookCode, ...) to a cover URL. Returns key -> stored
+    path for the covers that downloaded; a URL shared by several keys is fetched once.
+    """
+    unique = list(dict.fromkeys(url for url in urls.values() if url))
+    paths = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {url: pool.submit(download_cover, url) for url in unique}
+        for url, future in futures.items():
+            try:
+                paths[url] = future.result()
+            except Exception as e:
+                print(f"✗ Cover download failed for {url}: {e}")
+    return {key: paths[url] for key, url in urls.items() if url in paths}
+
+
+class _DownloadJob(QRunnable):
+    def __init__(self, downloader, url):
+        super().__init__()
+        self.downloader = downloader
+        self.url = url
+
+    def run(self):
+        try:
+            self.downloader._done.emit(self.url, download_cover(self.url), "")
+        except Exception as e:
+            self.downloader._done.emit(self.url, "", str(e))
+
+
+class CoverDownloader(QObject):
+    """Downloads covers for the GUI on a background pool.
+
+    download(url) returns immediately; downloaded(url, path) or failed(url, message)
+    follow on the GUI thread. A URL that is already downloading is not fetched twice.
+    """
+
+    downloaded = Signal(str, str)
+    failed = Signal(str, str)
+    _done = Signal(str, str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self._in_flight = {}
+        self._done.connect(self._on_done)
+
+    def download(self, url):
+        if url not in self._in_flight:
+            job = _DownloadJob(self, url)
+            job.setAutoDelete(False)
+            self._in_flight[url] = job
+            self.pool.start(job)
+
+    def _on_done(self, url, path, message):
+        self._in_flight.pop(url, None)
+        if path:
+            self.downloaded.emit(url, path)
+        else:
+            self.failed.emit(url, message)
+
+
+_cover_downloader = None
+
+
+# shared downloader, created on first use once the QApplication exists
+def get_cover_downloader():
+    global _cover_downloader
+    if _cover_downloader is None:
+        _cover_downloader = CoverDownloader()
+    return _cover_downloader
+
+
+if __name__ == "__main__":
+    # python -m booksPages.cover_ingest <isbn> ... -> fetch the covers of many books at once,
+    # using the offline ISBN store first and Google Books for the rest
+    import time
+    from .isbn_store import get_isbn_store
+    from .book_lookup import fetch_volumes
+
+    if len(sys.argv) < 2:
+        print("usage: python -m booksPages.cover_ingest <isbn> ...")
+        sys.exit(1)
+    store = get_isbn_store()
+    urls = {}
+    for isbn in sys.argv[1:]:
+        info = store.get(isbn)
+        if info is None:
+            try:
+                items = fetch_volumes("", "", isbn).get("items", [])
+                info = items[0]["volumeInfo"] if items else None
+            except requests.exceptions.RequestException as e:
+                print(f"✗ Lookup failed for {isbn}: {e}")
+        # Google Books hands out http: thumbnail links that also work over https
+        urls[isbn] = (info or {}).get("imageLinks", {}).get("thumbnail", "").replace("http:", "https:")
+    start = time.perf_counter()
+    paths = download_covers(urls)
+    for isbn in sys.argv[1:]:
+        print(f"{isbn}: {paths.get(isbn, 'no cover')}")
+    print(f"{len(paths)} covers in {time.perf_counter() - start:.1f} s (thumbnails in {THUMBNAIL_DIR})")
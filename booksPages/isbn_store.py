@@ -0,0 +1,330 @@
+import os
+import re
+import csv
+import sys
+import json
+import time
+from db_connection import get_connection_manager
+
+# Offline book metadata keyed by ISBN-13 (ISBN-10s are converted), filled from
+# JSONL/CSV dumps and checked before Google Books is asked. The database sits in
+# the project folder next to bjrsLib.db, whatever the working directory.
+STORE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bjrsIsbn.db")
+
+STORE_SCHEMA = """CREATE TABLE IF NOT EXISTS IsbnMetadata(
+                    Isbn13 INTEGER PRIMARY KEY NOT NULL,
+                    Title VARCHAR NOT NULL,
+                    Authors TEXT,
+                    Publisher VARCHAR,
+                    PublishedDate VARCHAR,
+                    Description TEXT,
+                    Categories TEXT,
+                    ImageUrl VARCHAR)"""
+
+# Column names accepted in dumps for each field; JSONL files may also use the
+# Google Books volumeInfo layout (industryIdentifiers, imageLinks.thumbnail)
+FIELD_ALIASES = {
+    "isbn": ("isbn", "isbn13", "isbn_13", "isbn10", "isbn_10", "ISBN"),
+    "title": ("title", "Title", "BookTitle"),
+    "authors": ("authors", "author", "Authors", "Author"),
+    "publisher": ("publisher", "Publisher"),
+    "published_date": ("publishedDate", "published_date", "publish_date", "year"),
+    "description": ("description", "Description", "BookDescription"),
+    "categories": ("categories", "genres", "subjects", "Genre"),
+    "image_url": ("image_url", "thumbnail", "cover", "ImageUrl"),
+}
+
+
+# Validate ISBN-10 or ISBN-13 with check digits
+def validate_isbn(isbn):
+    if not isbn:
+        return False
+
+    # Clean ISBN by removing non-alphanumeric characters except X
+    isbn_clean = re.sub(r'[^0-9X]', '', isbn.upper())
+
+    if len(isbn_clean) not in [10, 13]:
+        return False
+
+    if len(isbn_clean) == 10:
+        return _validate_isbn10(isbn_clean)
+    return _validate_isbn13(isbn_clean)
+
+# for ISBN-10 validation
+def _validate_isbn10(isbn):
+    if len(isbn) != 10:
+        return False
+    total = 0
+    for i in range(9):
+        if not isbn[i].isdigit():
+            return False
+        total += int(isbn[i]) * (10 - i)
+    if isbn[9] == 'X':
+        total += 10
+    elif isbn[9].isdigit():
+        total += int(isbn[9])
+    else:
+        return False
+    return total % 11 == 0
+
+# for ISBN-13 validation
+def _validate_isbn13(isbn):
+    if len(isbn) != 13:
+        return False
+    if not isbn.isdigit():
+        return False
+    total = 0
+    for i in range(12):
+        if i % 2 == 0:
+            total += int(isbn[i])
+        else:
+            total += int(isbn[i]) * 3
+    check_digit = (10 - (total % 10)) % 10
+    return check_digit == int(isbn[12])
+
+# Clean and format ISBN by removing non-alphanumeric characters
+def clean_isbn(isbn):
+    return re.sub(r'[^0-9X]', '', isbn.strip().upper())
+
+
+# Normalise an ISBN-10 or ISBN-13 to the ISBN-13 integer used as the store key
+def normalize_isbn(isbn):
+    if isbn is None:
+        return None
+    isbn = clean_isbn(str(isbn))
+    if not validate_isbn(isbn):
+        return None
+    if len(isbn) == 10:
+        body = "978" + isbn[:9]
+        total = sum(int(digit) * (1 if i % 2 == 0 else 3) for i, digit in enumerate(body))
+        isbn = body + str((10 - total % 10) % 10)
+    return int(isbn)
+
+
+# First non-empty value of a field under any of its accepted column names
+def pick_field(record, field, aliases=FIELD_ALIASES):
+    for name in aliases[field]:
+        value = record.get(name)
+        if value not in (None, "", []):
+            return value
+    return None
+
+
+# Authors/categories as a list, whether the dump holds a list or a delimited string
+def split_list(value):
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    # CSV cells hold several authors/categories separated by ';' or '|'
+    return [item.strip() for item in re.split(r"[;|]", str(value)) if item.strip()]
+
+
+# Turn one dump record into a table row, or None if it has no valid ISBN or title
+def record_to_row(record):
+    isbn = pick_field(record, "isbn")
+    if isbn is None:
+        for identifier in record.get("industryIdentifiers", []):
+            if identifier.get("type") in ("ISBN_13", "ISBN_10"):
+                isbn = identifier.get("identifier")
+                break
+    key = normalize_isbn(isbn)
+    title = pick_field(record, "title")
+    if key is None or not title:
+        return None
+    image_url = pick_field(record, "image_url") or record.get("imageLinks", {}).get("thumbnail")
+    return (key, str(title).strip(), json.dumps(split_list(pick_field(record, "authors"))),
+            pick_field(record, "publisher"), pick_field(record, "published_date"), pick_field(record, "description"),
+            json.dumps(split_list(pick_field(record, "categories"))), image_url)
+
+
+def iter_json_array(f, chunk_size=64 * 1024):
+    """Yield the items of the JSON array in text file f one at a time.
+
+    The file is read in chunks and each item is decoded with raw_decode as soon as
+    it is complete, so only the current item (and one chunk) is held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof, started = "", 0, False, False
+    while True:
+        while position < len(buffer) and (buffer[position].isspace() or (started and buffer[position] == ",")):
+            position += 1
+        item, end = None, len(buffer)
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("a .json dump must hold one array of records")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+        if end == len(buffer):
+            # out of text, an item cut off by the chunk, or a number that may go on
+            if eof:
+                if position == len(buffer):
+                    raise ValueError("the JSON array is not closed" if started else "the JSON file is empty")
+            else:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+        position = end
+        yield item
+
+
+def read_dump(path):
+    """Yield the records of a .jsonl, .json (array) or .csv dump, one at a time"""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+        return
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            for record in iter_json_array(f):
+                yield record.get("volumeInfo", record)
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                # accept whole Google Books volumes as well as bare volumeInfo objects
+                yield record.get("volumeInfo", record)
+
+
+class IsbnStore:
+    """Local ISBN -> metadata table; lookups are a single primary-key read"""
+
+    def __init__(self, db_path=STORE_DB):
+        self.manager = get_connection_manager(db_path)
+        conn = self.manager.acquire()
+        try:
+            conn.execute(STORE_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, isbn):
+        """Return the book as a Google Books volumeInfo dict, or None if it isn't stored"""
+        key = normalize_isbn(isbn)
+        if key is None:
+            return None
+        conn = self.manager.acquire()
+        try:
+            row = conn.execute("SELECT Title, Authors, Publisher, PublishedDate, Description, Categories, "
+                               "ImageUrl FROM IsbnMetadata WHERE Isbn13 = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        title, authors, publisher, published_date, description, categories, image_url = row
+        info = {
+            "title": title,
+            "authors": json.loads(authors or "[]") or ["Unknown Author"],
+            "publisher": publisher or "Unknown Publisher",
+            "publishedDate": published_date or "",
+            "description": description or "",
+            "categories": json.loads(categories or "[]") or [""],
+            "industryIdentifiers": [{"type": "ISBN_13", "identifier": str(key)}],
+        }
+        if image_url:
+            info["imageLinks"] = {"thumbnail": image_url}
+        return info
+
+    def import_records(self, records, chunk_size=5000):
+        """Insert or replace records in chunks inside one transaction; returns (imported, skipped)"""
+        imported = skipped = 0
+        conn = self.manager.acquire()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            chunk = []
+            for record in records:
+                row = record_to_row(record)
+                if row is None:
+                    skipped += 1
+                    continue
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    conn.executemany("INSERT OR REPLACE INTO IsbnMetadata VALUES (?, ?, ?, ?, ?, ?, ?, ?)", chunk)
+                    imported += len(chunk)
+                    chunk = []
+            if chunk:
+                conn.executemany("INSERT OR REPLACE INTO IsbnMetadata VALUES (?, ?, ?, ?, ?, ?, ?, ?)", chunk)
+                imported += len(chunk)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return imported, skipped
+
+    def import_file(self, path, chunk_size=5000):
+        return self.import_records(read_dump(path), chunk_size)
+
+    def count(self):
+        conn = self.manager.acquire()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM IsbnMetadata").fetchone()[0]
+        finally:
+            conn.close()
+
+
+_isbn_store = None
+
+
+# shared store used by the Google Books lookup
+def get_isbn_store():
+    global _isbn_store
+    if _isbn_store is None:
+        _isbn_store = IsbnStore()
+    return _isbn_store
+
+
+if __name__ == "__main__":
+    # python -m booksPages.isbn_store import dump.jsonl [books.csv ...]
+    # python -m booksPages.isbn_store lookup 9780132350884
+    command, arguments = (sys.argv[1], sys.argv[2:]) if len(sys.argv) > 1 else ("", [])
+    if command == "import" and arguments:
+        store = IsbnStore(os.getenv("BJRS_ISBN_DB", STORE_DB))
+        for path in arguments:
+            start = time.perf_counter()
+            imported, skipped = store.import_file(path)
+            print(f"✓ {path}: {imported} imported, {skipped} skipped ({time.perf_counter() - start:.1f} s)")
+        print(f"{store.count()} ISBNs in {store.manager.db_path}")
+    elif command == "bench":
+        # python -m booksPages.isbn_store bench [rows] -> import speed and lookup latency on a scratch store
+        import tempfile
+        rows = int(arguments[0]) if arguments else 200000
+        folder = tempfile.mkdtemp()
+        bench = IsbnStore(os.path.join(folder, "bench.db"))
+        isbns = []
+        for n in range(rows):
+            body = f"978{n:09d}"
+            total = sum(int(digit) * (1 if i % 2 == 0 else 3) for i, digit in enumerate(body))
+            isbns.append(body + str((10 - total % 10) % 10))
+        start = time.perf_counter()
+        bench.import_records({"isbn": isbn, "title": f"Book {i}", "authors": "A. Author"} for i, isbn in enumerate(isbns))
+        print(f"imported {rows} records in {time.perf_counter() - start:.2f} s")
+        start = time.perf_counter()
+        for isbn in isbns[::max(rows // 10000, 1)]:
+            bench.get(isbn)
+        lookups = len(isbns[::max(rows // 10000, 1)])
+        print(f"{(time.perf_counter() - start) / lookups * 1e6:.1f} us per lookup")
+        bench.manager.close_all()
+    elif command == "lookup" and arguments:
+        store = IsbnStore(os.getenv("BJRS_ISBN_DB", STORE_DB))
+        for isbn in arguments:
+            start = time.perf_counter()
+            info = store.get(isbn)
+            elapsed = (time.perf_counter() - start) * 1e6
+            print(f"{isbn}: {json.dumps(info, ensure_ascii=False) if info else 'not found'} ({elapsed:.0f} us)")
+    else:
+        print("usage: python -m booksPages.isbn_store import <dump.jsonl|dump.csv> ... | lookup <isbn> ... | bench [rows]")
+        sys.exit(1)
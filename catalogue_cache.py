@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+
+# Tables each catalogue write can change besides the one it names: removing a shelf
+# clears Book.BookShelf, and deleting a transaction puts its copies back on the books
+WRITE_EFFECTS = {
+    "BookShelf": ("Book",),
+    "BookTransaction": ("TransactionDetails", "Book"),
+}
+
+
+def _copy(value):
+    # callers sort, filter and edit what they get, so hand out fresh lists and dicts,
+    # nested ones included (a feed entry's Books list)
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
+
+
+class CatalogueCache:
+    """Read-through cache of catalogue queries for one database file.
+
+    Entries are keyed by (LibrarianID, key) and remember the version of every
+    table they were read from. Writers call invalidate(*tables) once they have
+    committed, which bumps those versions, so the next read of an entry built
+    from them goes back to SQLite while everything else is served from memory.
+    Commits that no invalidate() call accounts for, such as a catalogue import
+    run from the command line, are noticed through PRAGMA data_version (see
+    check_data_version) and drop the whole cache.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._generation = 0
+        self._entries = {}
+        # one connection of its own, so data_version sees the commits of every
+        # pooled (per-thread) connection, and the value it had after the last
+        # commit invalidate() or check_data_version() accounted for
+        self._watch_lock = threading.Lock()
+        self._watch = None
+        self._data_version = None
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def _snapshot(self, tables):
+        return (self._generation,) + tuple(self._versions.get(table, 0) for table in tables)
+
+    def table_versions(self, tables):
+        """Current version of each table; compare two results to see which tables were written"""
+        with self._lock:
+            return {table: (self._generation, self._versions.get(table, 0)) for table in tables}
+
+    def read(self, librarian_id, key, tables, loader):
+        """Return the cached value of key, or call loader() and remember its result.
+
+        loader must raise on failure, so that errors are never cached.
+        """
+        entry_key = (librarian_id, key)
+        with self._lock:
+            versions = self._snapshot(tables)
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] == versions:
+                self.stats["hits"] += 1
+                return _copy(entry[1])
+            self.stats["misses"] += 1
+        value = loader()
+        with self._lock:
+            # versions were taken before the load: a write committed meanwhile makes it stale at once
+            self._entries[entry_key] = (versions, value)
+        return _copy(value)
+
+    def invalidate(self, *tables):
+        """Bump the version of the given tables (and the tables a write to them affects).
+
+        Called after the write committed, so the data_version it now sees is
+        accounted for and check_data_version() won't clear the cache for it.
+        """
+        affected = set(tables)
+        for table in tables:
+            affected.update(WRITE_EFFECTS.get(table, ()))
+        with self._lock:
+            for table in affected:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            self.stats["invalidations"] += 1
+        with self._watch_lock:
+            self._data_version = self._read_data_version()
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+
+    def check_data_version(self):
+        """Clear the cache if something committed that no invalidate() call accounted for.
+
+        PRAGMA data_version on the cache's own connection changes with every commit
+        of any other connection, in this process or not. A commit made between a
+        writer's commit and its invalidate() call may clear the cache needlessly,
+        which only costs a reload.
+        """
+        with self._watch_lock:
+            previous = self._data_version
+            self._data_version = self._read_data_version()
+            changed = previous is not None and previous != self._data_version
+        if changed:
+            self.clear()
+
+    # callers hold _watch_lock
+    def _read_data_version(self):
+        if self.db_path is None:
+            return None
+        try:
+            if self._watch is None:
+                self._watch = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+            return self._watch.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"✗ Error reading data_version of {self.db_path}: {e}")
+            return None
+
+    def close(self):
+        """Close the cache's own connection (reopened on the next check)"""
+        with self._watch_lock:
+            if self._watch is not None:
+                self._watch.close()
+                self._watch = None
+            self._data_version = None
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+# Return the shared cache of a database file, so every DatabaseSeeder pointing at the
+# same file (one per window) reads from and invalidates the same entries
+def get_catalogue_cache(db_path):
+    key = db_path if db_path == ":memory:" else os.path.abspath(db_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = CatalogueCache(db_path)
+            _caches[key] = cache
+        return cache
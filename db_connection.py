@@ -0,0 +1,288 @@
+import os
+import sys
+import time
+import atexit
+import sqlite3
+import tempfile
+import threading
+
+# Default tuning for bjrsLib.db. Every value can be overridden with the matching
+# BJRS_DB_* environment variable (for example BJRS_DB_SYNCHRONOUS=FULL in .env)
+# or by passing a settings dict to get_connection_manager().
+DEFAULT_SETTINGS = {
+    "journal_mode": "WAL",        # readers no longer block the writer
+    "synchronous": "NORMAL",      # in WAL mode only checkpoints fsync
+    "cache_size": -20000,         # negative means KiB, so about 20 MB of page cache
+    "mmap_size": 268435456,       # 256 MB memory-mapped reads
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,         # milliseconds to wait on a locked database
+    "optimize_on_close": True,    # run PRAGMA optimize when the app shuts down
+}
+
+# Settings that SQLite itself would use, handy for comparisons
+SQLITE_DEFAULT_SETTINGS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+    "busy_timeout": 0,
+    "optimize_on_close": False,
+}
+
+
+# Values SQLite accepts for the settings that go into PRAGMA statements as words
+SETTING_CHOICES = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY", "0", "1", "2"),
+}
+
+
+# Read the database settings, letting environment variables override the defaults
+def get_database_settings(overrides=None):
+    settings = dict(DEFAULT_SETTINGS)
+    for key, default in DEFAULT_SETTINGS.items():
+        env_value = os.environ.get(f"BJRS_DB_{key.upper()}")
+        if env_value is None:
+            continue
+        if isinstance(default, bool):
+            settings[key] = env_value.strip().lower() in ("1", "true", "yes", "on")
+        elif isinstance(default, int):
+            try:
+                settings[key] = int(env_value)
+            except ValueError:
+                print(f"✗ Ignoring invalid BJRS_DB_{key.upper()} value: {env_value}")
+        elif env_value.strip().upper() in SETTING_CHOICES[key]:
+            settings[key] = env_value.strip().upper()
+        else:
+            print(f"✗ Ignoring invalid BJRS_DB_{key.upper()} value: {env_value}")
+    if overrides:
+        settings.update(overrides)
+    return settings
+
+
+# Build the PRAGMA statements for a connection from the settings.
+# Raises ValueError for a value SQLite wouldn't accept, as it is pasted into the SQL.
+def build_pragmas(settings):
+    for key, choices in SETTING_CHOICES.items():
+        if str(settings[key]).upper() not in choices:
+            raise ValueError(f"Invalid {key} setting: {settings[key]!r} (expected one of {', '.join(choices)})")
+    return (
+        "PRAGMA foreign_keys = ON;",
+        f"PRAGMA journal_mode = {settings['journal_mode']};",
+        f"PRAGMA synchronous = {settings['synchronous']};",
+        f"PRAGMA cache_size = {int(settings['cache_size'])};",
+        f"PRAGMA mmap_size = {int(settings['mmap_size'])};",
+        f"PRAGMA temp_store = {settings['temp_store']};",
+        f"PRAGMA busy_timeout = {int(settings['busy_timeout'])};",
+    )
+
+
+class PooledConnection:
+    """Thin handle around a shared sqlite3 connection.
+
+    Behaves like the sqlite3 connection it wraps, except that close() only
+    hands the connection back to the manager instead of closing it.
+    """
+
+    def __init__(self, manager, conn):
+        self._manager = manager
+        self._conn = conn
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def raw(self):
+        return self._conn
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._manager.release(self._conn)
+
+
+class ConnectionManager:
+    """Keeps one open sqlite3 connection per thread for a database file."""
+
+    def __init__(self, db_path, settings=None):
+        self.db_path = db_path
+        self.settings = get_database_settings(settings)
+        self.pragmas = build_pragmas(self.settings)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections = []
+        #set by DatabaseSeeder.initialize_database() once migrations have run
+        self.initialized = False
+        self._stats = {"opened": 0, "reused": 0, "released": 0, "closed": 0}
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    # open a new physical connection for the calling thread and apply the PRAGMAs once
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in self.pragmas:
+            conn.execute(pragma)
+        with self._lock:
+            self._all_connections.append(conn)
+            self._stats["opened"] += 1
+        self._local.conn = conn
+        self._local.depth = 0
+        return conn
+
+    # Startup step: open the connection so the PRAGMAs (including the persistent
+    # journal mode) are applied, and report what SQLite actually accepted.
+    def initialize(self):
+        conn = self.acquire()
+        try:
+            return {
+                "journal_mode": conn.execute("PRAGMA journal_mode").fetchone()[0],
+                "synchronous": conn.execute("PRAGMA synchronous").fetchone()[0],
+                "cache_size": conn.execute("PRAGMA cache_size").fetchone()[0],
+                "mmap_size": conn.execute("PRAGMA mmap_size").fetchone()[0],
+                "temp_store": conn.execute("PRAGMA temp_store").fetchone()[0],
+                "busy_timeout": conn.execute("PRAGMA busy_timeout").fetchone()[0],
+            }
+        finally:
+            conn.close()
+
+    # get the connection of the calling thread, opening it on first use
+    def acquire(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+        else:
+            self._count("reused")
+        self._local.depth += 1
+        return PooledConnection(self, conn)
+
+    # hand a connection back. Once the outermost user is done, anything left
+    # uncommitted is rolled back, just like closing a plain connection would.
+    def release(self, conn):
+        self._count("released")
+        if getattr(self._local, "conn", None) is not conn:
+            return
+        self._local.depth = max(self._local.depth - 1, 0)
+        if self._local.depth == 0 and conn.in_transaction:
+            conn.rollback()
+
+    # close the connection owned by the calling thread
+    def close_thread_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        self._local.depth = 0
+        self._close(conn)
+
+    def _close(self, conn):
+        with self._lock:
+            if conn not in self._all_connections:
+                return
+            self._all_connections.remove(conn)
+            self._stats["closed"] += 1
+        try:
+            if self.settings.get("optimize_on_close"):
+                conn.execute("PRAGMA optimize;")
+        except sqlite3.Error as e:
+            print(f"✗ Error optimizing {self.db_path}: {e}")
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"✗ Error closing connection to {self.db_path}: {e}")
+
+    # close every connection opened by this manager (used on shutdown)
+    def close_all(self):
+        with self._lock:
+            connections = list(self._all_connections)
+        for conn in connections:
+            self._close(conn)
+        self._local = threading.local()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["open"] = len(self._all_connections)
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+# Return the shared manager for a database file so every DatabaseSeeder pointing
+# at the same file reuses the same connections. Settings only take effect when
+# the manager is first created; asking for different ones later raises ValueError
+# instead of silently handing out connections tuned another way.
+def get_connection_manager(db_path, settings=None):
+    key = db_path if db_path == ":memory:" else os.path.abspath(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = ConnectionManager(db_path, settings)
+            _managers[key] = manager
+        elif settings and get_database_settings(settings) != manager.settings:
+            differing = sorted(name for name, value in get_database_settings(settings).items()
+                               if manager.settings.get(name) != value)
+            raise ValueError(f"{db_path} is already open with other settings ({', '.join(differing)}); "
+                             "pass the settings before the first connection is made")
+        return manager
+
+
+def close_all_managers():
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close_all()
+
+
+atexit.register(close_all_managers)
+
+
+# Measure how many single-row commits per second a configuration sustains
+def benchmark_commits(settings, rows=500):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    manager = ConnectionManager(path, dict(settings, optimize_on_close=False))
+    try:
+        conn = manager.acquire()
+        conn.execute("CREATE TABLE Bench (ID INTEGER PRIMARY KEY, Payload TEXT)")
+        conn.commit()
+        start = time.perf_counter()
+        for i in range(rows):
+            conn.execute("INSERT INTO Bench (Payload) VALUES (?)", (f"row {i}",))
+            conn.commit()
+        elapsed = time.perf_counter() - start
+        conn.close()
+        return rows / elapsed if elapsed else float("inf")
+    finally:
+        manager.close_all()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    # python db_connection.py [rows] -> compare commit throughput before and after tuning
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    baseline = benchmark_commits(SQLITE_DEFAULT_SETTINGS, rows)
+    tuned = benchmark_commits(get_database_settings(), rows)
+    print(f"SQLite defaults : {baseline:10.1f} commits/s")
+    print(f"Tuned (WAL)     : {tuned:10.1f} commits/s")
+    print(f"Speed-up        : {tuned / baseline:10.2f}x")
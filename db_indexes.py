@@ -0,0 +1,230 @@
+import os
+import re
+import sys
+import tempfile
+
+# Bump INDEX_SET_VERSION whenever INDEXES changes so existing databases
+# drop the old set and rebuild the new one on the next start.
+INDEX_SET_VERSION = 1
+
+# (index name, table, definition)
+# Partial indexes (WHERE isDeleted IS NULL) only hold active rows, which is what
+# every screen except the archive asks for.
+INDEXES = (
+    ("idx_librarian_username", "Librarian",
+     "CREATE INDEX IF NOT EXISTS idx_librarian_username ON Librarian (LibUsername)"),
+
+    ("idx_book_active_title", "Book",
+     "CREATE INDEX IF NOT EXISTS idx_book_active_title ON Book (LibrarianID, BookTitle) WHERE isDeleted IS NULL"),
+    ("idx_book_active_shelf", "Book",
+     "CREATE INDEX IF NOT EXISTS idx_book_active_shelf ON Book (LibrarianID, BookShelf) WHERE isDeleted IS NULL"),
+    ("idx_book_archived", "Book",
+     "CREATE INDEX IF NOT EXISTS idx_book_archived ON Book (LibrarianID, isDeleted)"),
+
+    ("idx_member_active_name", "Member",
+     "CREATE INDEX IF NOT EXISTS idx_member_active_name ON Member (LibrarianID, MemberLN, MemberFN) WHERE isDeleted IS NULL"),
+    ("idx_member_archived", "Member",
+     "CREATE INDEX IF NOT EXISTS idx_member_archived ON Member (LibrarianID, isDeleted)"),
+    ("idx_member_contact", "Member",
+     "CREATE INDEX IF NOT EXISTS idx_member_contact ON Member (MemberContact)"),
+
+    ("idx_bookshelf_active_name", "BookShelf",
+     "CREATE INDEX IF NOT EXISTS idx_bookshelf_active_name ON BookShelf (LibrarianID, ShelfName) WHERE isDeleted IS NULL"),
+    ("idx_bookshelf_archived", "BookShelf",
+     "CREATE INDEX IF NOT EXISTS idx_bookshelf_archived ON BookShelf (LibrarianID, isDeleted)"),
+
+    ("idx_bookauthor_author", "BookAuthor",
+     "CREATE INDEX IF NOT EXISTS idx_bookauthor_author ON BookAuthor (bookAuthor)"),
+
+    ("idx_transaction_librarian_date", "BookTransaction",
+     "CREATE INDEX IF NOT EXISTS idx_transaction_librarian_date ON BookTransaction (LibrarianID, BorrowedDate)"),
+    ("idx_transaction_status", "BookTransaction",
+     "CREATE INDEX IF NOT EXISTS idx_transaction_status ON BookTransaction (LibrarianID, Status, BorrowedDate)"),
+    ("idx_transaction_member", "BookTransaction",
+     "CREATE INDEX IF NOT EXISTS idx_transaction_member ON BookTransaction (MemberID)"),
+
+    ("idx_details_transaction", "TransactionDetails",
+     "CREATE INDEX IF NOT EXISTS idx_details_transaction ON TransactionDetails (TransactionID)"),
+    ("idx_details_book", "TransactionDetails",
+     "CREATE INDEX IF NOT EXISTS idx_details_book ON TransactionDetails (BookCode)"),
+)
+
+# Queries that are full scans on purpose (the librarian list is tiny and unfiltered)
+ALLOWED_SCANS = (
+    "SELECT * FROM Librarian",
+)
+
+
+def _existing_tables(cursor):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def _stored_version(cursor):
+    cursor.execute("CREATE TABLE IF NOT EXISTS IndexVersion (Version INTEGER NOT NULL)")
+    row = cursor.execute("SELECT Version FROM IndexVersion").fetchone()
+    return row[0] if row else 0
+
+
+# Create the current index set, dropping indexes from an older set first.
+# Indexes for tables that don't exist yet are skipped and picked up by the next call.
+def ensure_indexes(conn, commit=True):
+    cursor = conn.cursor()
+    version = _stored_version(cursor)
+    if version != INDEX_SET_VERSION:
+        current = {name for name, _, _ in INDEXES}
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx\\_%' ESCAPE '\\'")
+        for (name,) in cursor.fetchall():
+            if name not in current:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        cursor.execute("DELETE FROM IndexVersion")
+        cursor.execute("INSERT INTO IndexVersion (Version) VALUES (?)", (INDEX_SET_VERSION,))
+        print(f"✓ Index set upgraded from v{version} to v{INDEX_SET_VERSION}")
+
+    tables = _existing_tables(cursor)
+    created = 0
+    for name, table, definition in INDEXES:
+        if table in tables:
+            cursor.execute(definition)
+            created += 1
+    if commit:
+        conn.commit()
+    return created
+
+
+# Return the EXPLAIN QUERY PLAN lines that read a whole table without an index
+def full_scans(conn, sql):
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    scans = []
+    for row in plan:
+        detail = row[-1]
+        if not detail.startswith("SCAN ") or "USING" in detail or "CONSTANT ROW" in detail:
+            continue
+        # a virtual table answering a constraint (e.g. an FTS5 MATCH) is an index lookup
+        if re.search(r"VIRTUAL TABLE INDEX \d+:\S+", detail):
+            continue
+        # json_each(?) walks the bound ID list, not a table
+        if re.match(r"SCAN (json_each|json_tree)\b", detail):
+            continue
+        scans.append(detail)
+    return scans
+
+
+# Rows for check_query_plans: one of each, so the searches find something and
+# take their full-text branches, and checkout/return have a book to lend
+SAMPLE_ROWS = (
+    "INSERT INTO Librarian (LibrarianID, LibUsername, FName, LName, LibPass) VALUES (1, 'librarian', 'Lib', 'Rarian', 'x')",
+    "INSERT INTO BookShelf (ShelfId, ShelfName, LibrarianID) VALUES (1, 'A1', 1)",
+    """INSERT INTO Book (BookCode, BookTitle, Publisher, BookDescription, ISBN, BookTotalCopies,
+                         BookAvailableCopies, LibrarianID, BookShelf)
+       VALUES (1, 'Clean Code', 'Prentice Hall', 'Agile software craftsmanship', 9780132350884, 2, 2, 1, 1)""",
+    "INSERT INTO BookAuthor (BookCode, bookAuthor) VALUES (1, 'Robert Martin')",
+    "INSERT INTO Book_Genre (BookCode, Genre) VALUES (1, 'Programming')",
+    "INSERT INTO Member (MemberID, MemberFN, MemberLN, MemberContact, LibrarianID) VALUES (1, 'Ada', 'Lovelace', '09123456789', 1)",
+)
+
+
+# Run every method of DatabaseSeeder that queries or updates rows against a scratch
+# database holding SAMPLE_ROWS, capture the SQL it sends and check each SELECT,
+# UPDATE and DELETE with EXPLAIN QUERY PLAN.
+def check_query_plans():
+    from tryDatabase import DatabaseSeeder, CheckoutError, ARCHIVE_KEYS
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    # creating the seeder runs the migrations, which build the tables and indexes
+    seeder = DatabaseSeeder(path, settings={"optimize_on_close": False})
+    try:
+        conn, cursor = seeder.get_connection_and_cursor()
+        try:
+            for sql in SAMPLE_ROWS:
+                cursor.execute(sql)
+            conn.commit()
+        finally:
+            conn.close()
+
+        statements = []
+        conn, _ = seeder.get_connection_and_cursor()
+        conn.raw.set_trace_callback(statements.append)
+        try:
+            transaction_id = seeder.checkout(1, 1, [{"book": "Clean Code", "quantity": 1}], "2024-01-01", "2024-01-15")
+            try:
+                seeder.checkout(1, 1, [{"book": "Missing Book", "quantity": 1}], "2024-01-01", "2024-01-15")
+            except CheckoutError:
+                pass
+            seeder.get_borrowed_transactions(1)
+            seeder.get_transaction_with_details(member_id=1, librarian_id=1)
+            seeder.get_all_transactions(1)
+            for table in ("Book", "Member", "BookAuthor", "Book_Genre", "BookShelf",
+                          "TransactionDetails", "BookTransaction"):
+                seeder.get_all_records(table, 1)
+            seeder.get_all_records("Librarian", "")
+            seeder.findUsername("librarian@example.com")
+            seeder.findMemberContact("09123456789")
+            for sort in ("ascendingTitle", "descendingTitle", "ascendingAuthor", "descendingAuthor",
+                         "mostCopies", "leastCopies", "No Shelf", "A1"):
+                seeder.filterBooks(sort, 1)
+            for table in ("Book", "BookAuthor", "Book_Genre", "Member", "BookShelf"):
+                seeder.archiveTable(table, 1)
+            seeder.get_books_with_details(1)
+            seeder.get_books_with_details(1, [1, 2, 3])
+            seeder.handleDuplication("Book", 1, "ISBN", "9780306406157")
+            seeder.handleDuplication("BookShelf", 1, "ShelfName", "A1")
+            for table in ("Book", "Member", "BookShelf"):
+                seeder.dashboardCount(table, 1)
+                seeder.count_records(table, 1)
+                seeder.search_archived_records(table, "a", 1)
+            seeder.dashboardCount("BookTransaction", 1)
+            for table, text in (("Book", "clean"), ("Member", "ada"), ("BookTransaction", "ada"), ("BookShelf", "a")):
+                seeder.search_records(table, text, 1)
+            seeder.search_records("Book", "lean", 1, substring=True)
+            seeder.search_records("Member", "lovelase", 1, fuzzy=True)
+            seeder.search_records("BookTransaction", "lovelase", 1, fuzzy=True)
+            for status in (None, "Borrowed", "Returned"):
+                seeder.get_transaction_feed(1, status)
+            seeder.get_transaction_feed(1, "Borrowed", [1, 2])
+            for status in (None, "Returned"):
+                seeder.get_transaction_feed(1, status, after=("2024-01-15", 10), limit=100)
+            for table in ARCHIVE_KEYS:
+                seeder.get_archive_page(table, 1)
+                seeder.get_archive_page(table, 1, after=("2024-01-15 00:00:00", 10))
+            seeder.return_transactions([transaction_id, transaction_id + 1], 1, "2024-01-15")
+        finally:
+            conn.raw.set_trace_callback(None)
+            conn.close()
+
+        failures = []
+        seen = set()
+        conn, _ = seeder.get_connection_and_cursor()
+        try:
+            for sql in statements:
+                text = " ".join(sql.split())
+                if not text.upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE")) or text in seen:
+                    continue
+                # skip the bookkeeping queries ensure_indexes runs
+                if "sqlite_master" in text or "IndexVersion" in text:
+                    continue
+                seen.add(text)
+                if text in ALLOWED_SCANS:
+                    continue
+                scans = full_scans(conn, text)
+                if scans:
+                    failures.append((text, scans))
+        finally:
+            conn.close()
+        return len(seen), failures
+    finally:
+        seeder.shutdown()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    # python db_indexes.py -> exits with status 1 if any query needs a full table scan
+    checked, failures = check_query_plans()
+    for sql, scans in failures:
+        print("✗ Full table scan:", "; ".join(scans))
+        print("   " + sql)
+    print(f"Checked {checked} queries, {len(failures)} with full table scans")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,136 @@
+from db_indexes import ensure_indexes
+from search_index import (create_book_search, create_member_transaction_search, narrow_book_search_trigger,
+                          narrow_member_transaction_search_triggers)
+
+# ----Base schema (migration 1)----
+# Kept here so DatabaseSeeder.query() and the migrations share one definition.
+SCHEMA = {
+    "Librarian": """CREATE TABLE IF NOT EXISTS Librarian (
+                LibrarianID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                LibUsername VARCHAR(20) NOT NULL,
+                FName VARCHAR(30) NOT NULL,
+                LName VARCHAR(20) NOT NULL,
+                MName VARCHAR(20),
+                LibPass BLOB NOT NULL
+                )""",
+    "Member": """CREATE TABLE IF NOT EXISTS Member(
+                    MemberID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    MemberLN VARCHAR(20) NOT NULL,
+                    MemberMI VARCHAR(20),
+                    MemberFN VARCHAR (20) NOT NULL,
+                    MemberContact TEXT(11) NOT NULL,
+                    CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    isDeleted TIMESTAMP DEFAULT NULL,
+                    LibrarianID INTEGER,
+                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID)
+                    )""",
+    "Book": """CREATE TABLE IF NOT EXISTS Book(
+                    BookCode INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    BookTitle VARCHAR NOT NULL,
+                    Publisher VARCHAR NOT NULL,
+                    BookDescription VARCHAR NOT NULL,
+                    ISBN INTEGER NOT NULL,
+                    BookTotalCopies INTEGER NOT NULL,
+                    BookAvailableCopies INTEGER NOT NULL,
+                    BookCover BLOB,
+                    isDeleted TIMESTAMP DEFAULT NULL,
+                    LibrarianID INTEGER,
+                    BookShelf VARCHAR(6),
+                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID),
+                    FOREIGN KEY (BookShelf) REFERENCES BookShelf(ShelfId))""",
+    "BookAuthor": """CREATE TABLE IF NOT EXISTS BookAuthor(
+                    BookCode INTEGER,
+                    bookAuthor VARCHAR NOT NULL,
+                    PRIMARY KEY (BookCode, bookAuthor),
+                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))""",
+    "Book_Genre": """CREATE TABLE IF NOT EXISTS Book_Genre(
+                    BookCode INTEGER,
+                    Genre VARCHAR,
+                    PRIMARY KEY (BookCode, Genre),
+                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))""",
+    "BookShelf": """CREATE TABLE IF NOT EXISTS BookShelf(
+                    ShelfId INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    ShelfName VARCHAR(6) NOT NULL,
+                    LibrarianID INTEGER,
+                    isDeleted TIMESTAMP DEFAULT NULL,
+                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID))""",
+    "BookTransaction": """CREATE TABLE IF NOT EXISTS BookTransaction(
+                    TransactionID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    BorrowedDate TIMESTAMP NOT NULL,
+                    ReturnedDate TIMESTAMP DEFAULT NULL,
+                    Status VARCHAR(20) NOT NULL,
+                    Remarks VARCHAR(100) DEFAULT NULL,
+                    LibrarianID INTEGER,
+                    MemberID INTEGER,
+                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID),
+                    FOREIGN KEY (MemberID) REFERENCES Member (MemberID))""",
+    "TransactionDetails": """CREATE TABLE IF NOT EXISTS TransactionDetails (
+                    DetailsID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                    Quantity INTEGER NOT NULL,
+                    DueDate TIMESTAMP NOT NULL,
+                    TransactionID INTEGER,
+                    BookCode INTEGER,
+                    FOREIGN KEY (TransactionID) REFERENCES BookTransaction (TransactionID),
+                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))""",
+}
+
+# creation order respects the foreign keys
+SCHEMA_ORDER = ("Librarian", "Member", "BookShelf", "Book", "BookAuthor", "Book_Genre",
+                "BookTransaction", "TransactionDetails")
+
+
+def _create_base_tables(cursor):
+    for table in SCHEMA_ORDER:
+        cursor.execute(SCHEMA[table])
+
+
+def _create_indexes(cursor):
+    ensure_indexes(cursor.connection, commit=False)
+
+
+# Ordered list of (version, description, function). Each function gets a cursor
+# inside an open transaction. Append new migrations at the end; never edit or
+# reorder ones that have already shipped.
+MIGRATIONS = (
+    (1, "base tables", _create_base_tables),
+    (2, "secondary indexes", _create_indexes),
+    (3, "book full-text index", create_book_search),
+    (4, "member and transaction full-text indexes", create_member_transaction_search),
+    (5, "book search trigger on indexed columns only", narrow_book_search_trigger),
+    (6, "member and transaction search triggers on indexed columns only", narrow_member_transaction_search_triggers),
+)
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+# Bring the database up to LATEST_VERSION. Every migration runs in its own
+# transaction together with the user_version bump, so a failure leaves the
+# database at the last version that fully applied.
+def run_migrations(conn):
+    version = get_schema_version(conn)
+    if version > LATEST_VERSION:
+        print(f"⚠️ Database schema v{version} is newer than this app (v{LATEST_VERSION})")
+        return version
+
+    for target, description, migrate in MIGRATIONS:
+        if target <= version:
+            continue
+        if conn.in_transaction:
+            conn.commit()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            migrate(cursor)
+            cursor.execute(f"PRAGMA user_version = {int(target)}")
+            conn.commit()
+            version = target
+            print(f"✓ Migrated database to v{target} ({description})")
+        except Exception as e:
+            conn.rollback()
+            print(f"✗ Migration to v{target} ({description}) failed: {e}")
+            raise
+    return version
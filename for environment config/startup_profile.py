@@ -0,0 +1,171 @@
+"""
+Startup profiling for run_app.py
+
+python run_app.py --profile-startup [report.txt]
+    starts the app once under -X importtime, stops it when the login window first
+    paints and writes the import breakdown and the time to first paint to report.txt
+python run_app.py --bench-startup [runs] [--save-baseline]
+    cold-starts the app several times and fails if the login window paints later
+    than the saved baseline allows, or if a module the login window doesn't need
+    was imported before it appeared
+"""
+
+import os
+import sys
+import json
+import time
+
+# Set in the child process: where to write the first-paint probe
+PROBE_ENV = "BJRS_STARTUP_PROBE"
+
+# Modules the login window must not need. They are imported on login or by a
+# background preload, so finding one loaded at first paint is a regression.
+DEFERRED_MODULES = (
+    "Dashboard", "booksPages.books1", "transactionPages.transaction_logic",
+    "membersPages.members", "Archive", "requests", "smtplib", "email.mime", "dotenv",
+)
+
+# A benchmark run may be this much slower than the saved baseline before it fails
+BASELINE_TOLERANCE = 1.25
+
+RUN_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_app.py")
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "bin", "startup_baseline.json")
+
+
+def watch_first_paint(window, started):
+    """In a profiled child: record the login window's first paint, then quit"""
+    path = os.environ.get(PROBE_ENV)
+    if not path:
+        return None
+    from PySide6.QtCore import QObject, QEvent, QTimer, QCoreApplication
+
+    class FirstPaintProbe(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint and not getattr(self, "fired", False):
+                self.fired = True
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({"painted_at": time.time(),
+                               "since_main_ms": (time.perf_counter() - started) * 1000,
+                               "modules": sorted(sys.modules)}, f)
+                QTimer.singleShot(0, QCoreApplication.quit)
+            return False
+
+    probe = FirstPaintProbe(window)
+    window.installEventFilter(probe)
+    return probe
+
+
+def run_once(importtime=False):
+    """Start run_app.py in a fresh interpreter until its first paint.
+
+    Returns (probe dict with first_paint_ms added, -X importtime lines)."""
+    # imported here so the measured child, which only calls watch_first_paint, doesn't pay for them
+    import tempfile
+    import subprocess
+    fd, probe_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.remove(probe_path)
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + [RUN_APP]
+    env = dict(os.environ, **{PROBE_ENV: probe_path})
+    try:
+        spawned_at = time.time()
+        result = subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, encoding="utf-8", errors="replace", timeout=120)
+        if not os.path.exists(probe_path):
+            raise RuntimeError(f"the login window never painted:\n{result.stderr[-2000:]}")
+        with open(probe_path, encoding="utf-8") as f:
+            probe = json.load(f)
+    finally:
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+    probe["first_paint_ms"] = (probe["painted_at"] - spawned_at) * 1000
+    return probe, [line for line in result.stderr.splitlines() if line.startswith("import time:")]
+
+
+def parse_importtime(lines):
+    """(module, self us, cumulative us, depth) for every -X importtime line"""
+    rows = []
+    for line in lines:
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the header line
+        name = parts[2].rstrip()
+        rows.append((name.strip(), int(parts[0]), int(parts[1]), (len(name) - len(name.lstrip())) // 2))
+    return rows
+
+
+def early_deferred(modules):
+    return [name for name in DEFERRED_MODULES
+            if name in modules or any(module.startswith(name + ".") for module in modules)]
+
+
+def format_report(probe, rows, top=25):
+    lines = [f"Time to first paint : {probe['first_paint_ms']:8.1f} ms (process start to login window paint)",
+             f"  of which in main() : {probe['since_main_ms']:8.1f} ms",
+             f"Imports             : {sum(row[1] for row in rows) / 1000:8.1f} ms in {len(rows)} modules", ""]
+
+    packages = {}
+    for name, self_us, _, _ in rows:
+        packages[name.split(".")[0]] = packages.get(name.split(".")[0], 0) + self_us
+    lines.append("Self time by top-level package:")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    lines += ["", "Slowest imports (cumulative, indented by nesting):"]
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda row: -row[2])[:top]:
+        lines.append(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:8.1f} ms self  {'  ' * depth}{name}")
+
+    early = early_deferred(probe["modules"])
+    lines += ["", "Deferred modules loaded before first paint: " + (", ".join(early) if early else "none")]
+    return "\n".join(lines)
+
+
+def profile(report_path="startup_profile.txt"):
+    probe, lines = run_once(importtime=True)
+    report = format_report(probe, parse_importtime(lines))
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write(report + "\n\n" + "\n".join(lines) + "\n")
+    print(report)
+    print(f"\n✓ Full -X importtime output written to {report_path}")
+    return 0
+
+
+def bench(runs=5, save_baseline=False):
+    import statistics
+    first_paints, early = [], set()
+    for run in range(runs):
+        probe, _ = run_once()
+        first_paints.append(probe["first_paint_ms"])
+        early.update(early_deferred(probe["modules"]))
+        print(f"  run {run + 1}: {probe['first_paint_ms']:7.1f} ms to first paint")
+    median = statistics.median(first_paints)
+    print(f"Median {median:.1f} ms, best {min(first_paints):.1f} ms over {runs} cold starts")
+
+    failed = False
+    if early:
+        print(f"✗ Imported before the login window: {', '.join(sorted(early))}")
+        failed = True
+    if save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_FILE), exist_ok=True)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"median_ms": median, "runs": runs, "saved": time.strftime("%Y-%m-%d %H:%M:%S")}, f)
+        print(f"✓ Baseline saved to {BASELINE_FILE}")
+    elif os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as f:
+            baseline = json.load(f)["median_ms"]
+        limit = baseline * BASELINE_TOLERANCE
+        if median > limit:
+            print(f"✗ Startup regressed: {median:.1f} ms against a baseline of {baseline:.1f} ms (limit {limit:.1f} ms)")
+            failed = True
+        else:
+            print(f"✓ Within the baseline of {baseline:.1f} ms (limit {limit:.1f} ms)")
+    return 1 if failed else 0
+
+
+def main(argv):
+    command, arguments = argv[0], [arg for arg in argv[1:] if not arg.startswith("--")]
+    if command == "--profile-startup":
+        return profile(*arguments[:1])
+    runs = int(arguments[0]) if arguments else 5
+    return bench(runs, save_baseline="--save-baseline" in argv)
@@ -4,6 +4,7 @@ from tryDatabase import DatabaseSeeder
 from Authentication import Authentication
 from navigation_sidebar import NavigationSidebar
 from navbar_logic import nav_manager
+from page_prewarm import get_page_warmer
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
@@ -550,6 +551,8 @@ class Settings(QMainWindow):
         )
         if reply == QMessageBox.StandardButton.Yes:
             self.close()
+            get_page_warmer().cancel()
+            nav_manager.clear_pages() # pages kept for quick navigation belong to this session
             from Authentication import Authentication
             self.auth_window = Authentication()
             self.auth_window.show()
@@ -13,6 +13,8 @@ from navbar_logic import nav_manager
 
 # Connect to database seeder 
 from tryDatabase import DatabaseSeeder
+from search_controller import SearchController
+from search_index import prefix_match
 
 
 class ProtectedContactLineEdit(QLineEdit):
@@ -846,8 +848,11 @@ class MembersMainWindow(QWidget):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search members...")
         self.search_bar.setFixedSize(300, 50)
-        self.search_bar.textChanged.connect(lambda text: self.searchMembers(text))  # Search as user types
-        self.search_bar.returnPressed.connect(lambda: self.searchMembers(self.search_bar.text()))  # Search on Enter
+        # Search as user types (debounced, on a worker thread) and on Enter
+        self.search_controller = SearchController(self.search_bar, self.query_members, narrow=self.member_matches_prefix)
+        self.search_controller.results.connect(self.show_member_results)
+        self.search_controller.cleared.connect(self.show_all_members)
+        self.search_controller.failed.connect(self.on_member_search_failed)
         self.search_bar.setStyleSheet("""
             QLineEdit {
                 color: #5C4033;
@@ -880,7 +885,7 @@ class MembersMainWindow(QWidget):
                 color: white;
             }
         """)
-        search_btn.clicked.connect(lambda: self.searchMembers(self.search_bar.text()))
+        search_btn.clicked.connect(self.search_controller.search_now)
         
         # Clear search button
         clear_btn = QPushButton("✕")
@@ -965,35 +970,51 @@ class MembersMainWindow(QWidget):
             self.original_members = self.members.copy()  # Update original data
             self.refresh_members_grid()
 
+    def refresh_page(self, changed_tables):
+        # This reloads the members when navigation shows this page again after they changed
+        self.members = self.db_seeder.get_all_records(tableName="Member", id= self.librarian_id)
+        self.original_members = self.members.copy()
+        if self.search_controller.text():
+            self.search_controller.refresh()
+        else:
+            self.refresh_members_grid()
+
     def clear_search(self):
         # This clears the search bar and shows all the members again
         """Clear the search and restore all members"""
-        self.search_bar.clear()
+        if self.search_bar.text():
+            self.search_bar.clear()  # the search controller then calls show_all_members
+        else:
+            self.show_all_members()
+
+    def show_all_members(self):
+        # This shows every member again once the search bar is empty
         self.members = self.original_members.copy()
         self.refresh_members_grid()
 
-    def searchMembers(self, search_text):
-        # This searches for members by name or contact number
-        """Search members based on the input text"""
-        search_text = search_text.strip()
-        if not search_text:
-            self.clear_search()
-            return
-        
+    def query_members(self, search_text):
+        # This searches for members by name or contact number (runs on the search worker thread)
+        """Search members in the database"""
         print(f"🔍 Searching members for: '{search_text}'")
-        try:
-            # Use database search instead of local search
-            search_results = self.db_seeder.search_records("Member", search_text, self.librarian_id)
-            self.members = search_results
-            print(f"✅ Found {len(search_results)} matching members from database")
-            
-        except Exception as e:
-            print(f"❌ Error searching members: {e}")
-            # Fallback to local search if database search fails
-            self.perform_local_member_search(search_text)
-        
+        return self.db_seeder.search_records("Member", search_text, self.librarian_id, fuzzy=True)
+
+    def show_member_results(self, search_text, search_results):
+        # This shows the members the search found
+        self.members = search_results
+        print(f"✅ Found {len(search_results)} matching members")
         self.refresh_members_grid()
 
+    def on_member_search_failed(self, search_text, message):
+        print(f"❌ Error searching members: {message}")
+        # Fallback to local search if database search fails
+        self.perform_local_member_search(search_text)
+        self.refresh_members_grid()
+
+    def member_matches_prefix(self, member, search_text):
+        # Same fields and word-prefix rule as the MemberSearch index, used to narrow results while typing
+        return prefix_match(search_text, member.get('MemberFN'), member.get('MemberMI'),
+                            member.get('MemberLN'), member.get('MemberContact'))
+
     def perform_local_member_search(self, search_text):
         # If the database search doesn't work, this does a simple search in the list
         """Fallback local member search method"""
@@ -1,76 +1,93 @@
+import os
+import time
+import importlib
+from collections import OrderedDict
 from PySide6.QtWidgets import QWidget, QHBoxLayout
 from PySide6.QtCore import QObject
+from shiboken6 import isValid
+from catalogue_cache import get_catalogue_cache
+
+# Pages the sidebar opens: module, window class and the tables the page shows.
+# A page kept in the cache is shown again as it was; if any of its tables were
+# written since it was hidden, its refresh_page(changed_tables) method is called.
+PAGES = {
+    "Dashboard": ("Dashboard", "LibraryDashboard",
+                  ("Book", "Member", "BookTransaction", "TransactionDetails")),
+    "Books": ("booksPages.books1", "CollapsibleSidebar",
+              ("Book", "BookAuthor", "Book_Genre", "BookShelf")),
+    "Transactions": ("transactionPages.Transaction1", "LibraryTransactionSystem",
+                     ("Book", "Member", "BookTransaction", "TransactionDetails")),
+    "Members": ("membersPages.members", "MembersMainWindow", ("Member",)),
+    "Archive": ("Archive", "ArchiveManager", ("Book", "BookAuthor", "Book_Genre", "Member", "BookShelf")),
+    "Settings": ("librarianPages.settings", "Settings", ("Librarian",)),
+}
+
+# How many hidden pages stay alive, and how many Qt objects (widgets, layouts,
+# models...) they may hold together before the least recently used are closed.
+# Override with BJRS_PAGE_CACHE_PAGES / BJRS_PAGE_CACHE_OBJECTS (0 turns the cache off).
+PAGE_CACHE_PAGES = int(os.environ.get("BJRS_PAGE_CACHE_PAGES", 5))
+PAGE_CACHE_OBJECTS = int(os.environ.get("BJRS_PAGE_CACHE_OBJECTS", 60000))
+
+DATABASE = "bjrsLib.db"
+
 
 class NavigationManager(QObject):
     def __init__(self):
         super().__init__()
         self._current_window = None
+        self._current_page = None
         self._librarian_id = None
-    
+        # page name -> window, least recently shown first; holds every live page, the current one included
+        self._pages = OrderedDict()
+        # page name -> {"versions": table versions when hidden, "objects": size when hidden}
+        self._hidden = {}
+        self._stats = {}
+
     def initialize(self, app):
         """Initialize with QApplication instance"""
         self._app = app
-    
+
     def set_librarian_id (self, librarian_id):
+        # pages of another librarian must not be shown again; the one on screen is closed on the next navigation
+        if librarian_id != self._librarian_id:
+            self.clear_pages()
+            self._pages.pop(self._current_page, None)
+            self._current_page = None
         self._librarian_id = librarian_id
 
     def handle_navigation(self, item_name, librarian_id=None):
         """Central navigation logic for all forms"""
         print(f" Navigation requested: {item_name} (librarian_id: {librarian_id})")
-        
-        if librarian_id is not None:
-            self._librarian_id = librarian_id
+
+        if librarian_id is not None and librarian_id != self._librarian_id:
+            self.set_librarian_id(librarian_id)
             print(f" Updated librarian_id to: {self._librarian_id}")
-        
-        # Hide current window if it exists
-        if self._current_window:
-            print(f" Closing current window: {type(self._current_window).__name__}")
-            self._current_window.close()
-            self._current_window = None
-        
+
+        if item_name not in PAGES:
+            print(f" Unknown navigation item: {item_name}")
+            return
+        if item_name == self._current_page and self._is_alive(self._current_window):
+            self._current_window.show()
+            return
+
         try:
-            # Handle navigation based on clicked item
-            if item_name == "Dashboard":
-                print(" Loading Dashboard...")
-                from Dashboard import LibraryDashboard
-                self._current_window = LibraryDashboard(librarian_id = self._librarian_id)
-                
-            elif item_name == "Books":
-                print(" Loading Books...")
-                from booksPages.books1 import CollapsibleSidebar
-                self._current_window = CollapsibleSidebar(librarian_id=self._librarian_id)
-                
-            elif item_name == "Transactions":
-                print(" Loading Transactions...")
-                from transactionPages.Transaction1 import LibraryTransactionSystem
-                self._current_window = LibraryTransactionSystem(librarian_id= self._librarian_id)
-            
-            elif item_name == "Members":
-                print(" Loading Members...")
-                from membersPages.members import MembersMainWindow
-                self._current_window = MembersMainWindow(librarian_id=self._librarian_id)
-
-            elif item_name == "Archive":
-                print(" Loading Arhive...")
-                from Archive import ArchiveManager
-                self._current_window = ArchiveManager(librarian_id=self._librarian_id)
-
-            elif item_name == "Settings":
-                print(" Loading Settings...")
-                from librarianPages.settings import Settings
-                self._current_window = Settings(librarian_id = self._librarian_id)
-                
-            else:
-                print(f" Unknown navigation item: {item_name}")
-                return
-                
-            # Show the new window if one was created
-            if self._current_window:
-                print(f" Showing window: {type(self._current_window).__name__}")
-                self._current_window.show()
+            previous = self._current_window
+            window = self._show_cached(item_name)
+            if window is None:
+                window = self._build(item_name)
+
+            # Show the new window before hiding the old one, so the screen never goes empty
+            if window:
+                print(f" Showing window: {type(window).__name__}")
+                window.show()
+                self._leave(previous)
+                self._current_window, self._current_page = window, item_name
+                self._pages[item_name] = window
+                self._pages.move_to_end(item_name)
+                self._evict()
             else:
                 print(f" Failed to create window for: {item_name}")
-                
+
         except ImportError as e:
             print(f" Import error for {item_name}: {e}")
             # You could show a QMessageBox here if needed
@@ -79,15 +96,115 @@ class NavigationManager(QObject):
             import traceback
             traceback.print_exc()
 
+    # construct a page and record how long it took
+    def _build(self, item_name):
+        module_name, class_name, _tables = PAGES[item_name]
+        print(f" Loading {item_name}...")
+        start = time.perf_counter()
+        window_class = getattr(importlib.import_module(module_name), class_name)
+        window = window_class(librarian_id=self._librarian_id)
+        elapsed = (time.perf_counter() - start) * 1000
+        stats = self._page_stats(item_name)
+        stats["builds"] += 1
+        stats["build_ms"] = elapsed
+        print(f"✓ Built {item_name} in {elapsed:.0f} ms")
+        return window
+
+    # the kept window of a page, refreshed if its tables were written while it was hidden
+    def _show_cached(self, item_name):
+        window = self._pages.get(item_name)
+        hidden = self._hidden.pop(item_name, None)
+        if window is None:
+            return None
+        if not self._is_alive(window) or hidden is None:
+            self._pages.pop(item_name, None)
+            return None
+        start = time.perf_counter()
+        tables = PAGES[item_name][2]
+        versions = get_catalogue_cache(DATABASE).table_versions(tables)
+        changed = [table for table in tables if versions[table] != hidden["versions"][table]]
+        if changed and hasattr(window, "refresh_page"):
+            window.refresh_page(changed)
+        elapsed = (time.perf_counter() - start) * 1000
+        stats = self._page_stats(item_name)
+        stats["reuses"] += 1
+        stats["refreshes"] += bool(changed)
+        stats["show_ms"] = elapsed
+        refreshed = f", refreshed for {', '.join(changed)}" if changed else ""
+        print(f"✓ Showed kept {item_name} in {elapsed:.0f} ms{refreshed}")
+        return window
+
+    # hide the page being left, remembering what it showed so changes can be found later
+    def _leave(self, window):
+        if window is None or not self._is_alive(window):
+            return
+        page = self._current_page if self._pages.get(self._current_page) is window else None
+        if page is None or PAGE_CACHE_PAGES <= 0:
+            print(f" Closing current window: {type(window).__name__}")
+            self._discard(page, window)
+            return
+        self._collapse_sidebars(window)
+        window.hide()
+        self._hidden[page] = {
+            "versions": get_catalogue_cache(DATABASE).table_versions(PAGES[page][2]),
+            "objects": len(window.findChildren(QObject)),
+        }
+
+    # close the least recently shown pages until the cache fits its page and object limits
+    def _evict(self):
+        hidden = [page for page in self._pages if page in self._hidden]
+        while hidden and (len(hidden) > PAGE_CACHE_PAGES or
+                          sum(self._hidden[page]["objects"] for page in hidden) > PAGE_CACHE_OBJECTS):
+            page = hidden.pop(0)
+            print(f" Closing kept page {page} ({self._hidden[page]['objects']} objects)")
+            self._discard(page, self._pages.get(page))
+
+    def _discard(self, page, window):
+        if page is not None:
+            self._pages.pop(page, None)
+            self._hidden.pop(page, None)
+        if self._is_alive(window):
+            window.close()
+            window.deleteLater()
+
+    # a sidebar left expanded by the click that opened another page would stay open
+    def _collapse_sidebars(self, window):
+        from navigation_sidebar import NavigationSidebar
+        for sidebar in window.findChildren(NavigationSidebar):
+            if sidebar.expanded and not sidebar.manually_expanded:
+                sidebar.collapse_sidebar_hover()
+
+    @staticmethod
+    def _is_alive(window):
+        return window is not None and isValid(window)
+
+    def _page_stats(self, item_name):
+        return self._stats.setdefault(item_name, {"builds": 0, "build_ms": None, "reuses": 0,
+                                                   "refreshes": 0, "show_ms": None})
+
+    def page_stats(self):
+        """Per page: times built, last build time, times shown from the cache and refreshed"""
+        return {page: dict(stats) for page, stats in self._stats.items()}
+
+    def clear_pages(self):
+        """Close every kept page except the one on screen (e.g. on logout)"""
+        for page in list(self._hidden):
+            self._discard(page, self._pages.get(page))
+
+    def has_page(self, item_name):
+        """Whether the page is on screen or kept hidden, i.e. opening it won't build it"""
+        return item_name in self._pages
+
     def get_current_window(self):
         """Return the currently active window"""
         return self._current_window
-    
+
     def close_current_window(self):
         """Close the current window if it exists"""
         if self._current_window:
-            self._current_window.close()
+            self._discard(self._current_page, self._current_window)
             self._current_window = None
+            self._current_page = None
 
 # Create a single instance to be used across the application
-nav_manager = NavigationManager()
\ No newline at end of file
+nav_manager = NavigationManager()
@@ -5,12 +5,6 @@ from PySide6.QtWidgets import (
     QSizePolicy, QSpacerItem
 )
 
-# Import books module for navigation
-try:
-    from booksPages import books1
-except ImportError:
-    books1 = None
-
 
 class HoverButton(QPushButton):
     """Custom button that triggers sidebar expansion on hover"""
@@ -261,6 +255,13 @@ if __name__ == "__main__":
     import sys
     from PySide6.QtWidgets import QApplication, QMainWindow, QHBoxLayout, QLabel
     from PySide6.QtGui import QFont
+
+    # the test window opens the books page itself; every page imports this module, so
+    # loading books1 (and requests with it) at the top would slow down every window
+    try:
+        from booksPages import books1
+    except ImportError:
+        books1 = None
     
     class TestWindow(QMainWindow):
         def __init__(self):
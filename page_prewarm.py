@@ -0,0 +1,211 @@
+import os
+import time
+import threading
+import importlib
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThread, QThreadPool, QTimer, Signal
+from navbar_logic import PAGES, nav_manager
+
+# How long after login the warm-up waits, so the dashboard is built and painted first,
+# and the pause between two pages, so clicks and repaints get the GUI thread in between
+PREWARM_DELAY_MS = 1500
+PREWARM_STEP_MS = 200
+
+# Pages warmed after login, in the order librarians usually open them
+PREWARM_PAGES = ("Books", "Transactions", "Members")
+
+# Rows the warm-up may load into the catalogue cache, so a huge catalogue isn't held
+# in memory for pages nobody opens. Each page's rows are counted before its reads and
+# a page that would pass the cap is skipped. BJRS_PREWARM_MAX_ROWS overrides it;
+# 0 turns pre-warming off.
+PREWARM_MAX_ROWS = int(os.environ.get("BJRS_PREWARM_MAX_ROWS", 200000))
+
+# Covers of the first books in the grid decoded ahead of time (the cover cache bounds their memory)
+PREWARM_COVERS = 24
+
+
+# The reads each page makes while it is built; they are served from the catalogue
+# cache afterwards. Every function returns the lists it loaded. The matching
+# PREWARM_ROWS function tells how many rows those reads would load.
+def _books_rows(seeder, librarian_id):
+    return seeder.count_records("Book", librarian_id) + seeder.count_records("BookShelf", librarian_id)
+
+
+def _books_reads(seeder, librarian_id):
+    return [seeder.get_books_with_details(librarian_id), seeder.get_all_records("BookShelf", librarian_id)]
+
+
+def _transactions_rows(seeder, librarian_id):
+    from paged_table import PAGE_SIZE
+    return 2 * PAGE_SIZE  # first page of each status, at most
+
+
+def _transactions_reads(seeder, librarian_id):
+    from paged_table import PAGE_SIZE
+    return [seeder.get_transaction_feed(librarian_id, status, limit=PAGE_SIZE) for status in ("Borrowed", "Returned")]
+
+
+def _members_rows(seeder, librarian_id):
+    return seeder.count_records("Member", librarian_id)
+
+
+def _members_reads(seeder, librarian_id):
+    return [seeder.get_all_records("Member", librarian_id)]
+
+
+PREWARM_READS = {
+    "Books": _books_reads,
+    "Transactions": _transactions_reads,
+    "Members": _members_reads,
+}
+
+PREWARM_ROWS = {
+    "Books": _books_rows,
+    "Transactions": _transactions_rows,
+    "Members": _members_rows,
+}
+
+
+class _WarmJob(QRunnable):
+    """Imports one page's module and runs its reads on the warmer's worker thread,
+    unless they would load more than budget rows"""
+
+    def __init__(self, warmer, run_id, page, librarian_id, cancelled, budget):
+        super().__init__()
+        self.warmer = warmer
+        self.run_id = run_id
+        self.page = page
+        self.librarian_id = librarian_id
+        self.cancelled = cancelled
+        self.budget = budget
+
+    def run(self):
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+        start = time.perf_counter()
+        results, message, rows = None, "", 0
+        try:
+            importlib.import_module(PAGES[self.page][0])
+            results = []
+            reads = PREWARM_READS.get(self.page)
+            if reads and self.librarian_id is not None and not self.cancelled.is_set():
+                from tryDatabase import DatabaseSeeder
+                seeder = DatabaseSeeder()
+                rows = PREWARM_ROWS[self.page](seeder, self.librarian_id)
+                results = reads(seeder, self.librarian_id) if rows <= self.budget else None
+        except Exception as e:
+            message = str(e) or type(e).__name__
+        elapsed = (time.perf_counter() - start) * 1000
+        try:
+            if results is None and not message:
+                self.warmer._skipped.emit(self.run_id, self.page, rows)
+            else:
+                self.warmer._done.emit(self.run_id, self.page, results, message, elapsed)
+        except RuntimeError:
+            pass  # the application quit while the page was warming
+
+
+class PageWarmer(QObject):
+    """Warms the pages a librarian is likely to open next, while the dashboard is idle.
+
+    start(librarian_id) waits PREWARM_DELAY_MS, then for each page in PREWARM_PAGES
+    imports its module and runs the catalogue reads its constructor makes on a
+    low-priority worker thread, one page at a time; preload(pages) only imports. The first visit to a page then
+    skips the cold import and is answered from the catalogue cache. Pages already
+    built by the navigation manager are skipped, and so are pages whose reads would
+    take the rows loaded past PREWARM_MAX_ROWS. cancel() stops it between two steps
+    (on logout, on quit, or when start() is called again).
+    """
+
+    warmed = Signal(str, float)
+    finished = Signal()
+    _done = Signal(int, str, object, str, float)
+    _skipped = Signal(int, str, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._next)
+        self._run_id = 0
+        self._cancelled = threading.Event()
+        self._queue = []
+        self._librarian_id = None
+        self._rows = 0
+        self.stats = {}
+        self._done.connect(self._on_done)
+        self._skipped.connect(self._on_skipped)
+
+    def start(self, librarian_id, pages=PREWARM_PAGES, delay=PREWARM_DELAY_MS):
+        self.cancel()
+        if PREWARM_MAX_ROWS <= 0:
+            return
+        self._run_id += 1
+        self._cancelled = threading.Event()
+        self._queue = list(pages)
+        self._librarian_id = librarian_id
+        self._rows = 0
+        self.timer.start(delay)
+
+    def preload(self, pages, delay=PREWARM_STEP_MS):
+        """Only import the modules of pages, e.g. the Dashboard's while the login window waits"""
+        self.start(None, pages, delay)
+
+    def cancel(self):
+        self._cancelled.set()
+        self.timer.stop()
+        self.pool.clear()
+        self._queue = []
+
+    def _next(self):
+        while self._queue:
+            page = self._queue.pop(0)
+            if nav_manager.has_page(page):
+                continue  # already opened, nothing left to warm
+            self.pool.start(_WarmJob(self, self._run_id, page, self._librarian_id, self._cancelled,
+                                     PREWARM_MAX_ROWS - self._rows))
+            return
+        print(f"✓ Pre-warm finished ({self._rows} rows cached)")
+        self.finished.emit()
+
+    def _on_done(self, run_id, page, results, message, elapsed):
+        if run_id != self._run_id or self._cancelled.is_set():
+            return
+        if results is None:
+            print(f"✗ Pre-warming {page} failed: {message}")
+        else:
+            rows = sum(len(result) for result in results)
+            self._rows += rows
+            self.stats[page] = {"ms": elapsed, "rows": rows}
+            print(f"✓ Pre-warmed {page} in {elapsed:.0f} ms ({rows} rows)")
+            if page == "Books":
+                self._warm_covers(results[0])
+            self.warmed.emit(page, elapsed)
+        self.timer.start(PREWARM_STEP_MS)
+
+    def _on_skipped(self, run_id, page, rows):
+        if run_id != self._run_id or self._cancelled.is_set():
+            return
+        print(f"Pre-warm left {page} cold: {rows} more rows would pass the cap of {PREWARM_MAX_ROWS}")
+        self.timer.start(PREWARM_STEP_MS)
+
+    def _warm_covers(self, books):
+        # queued on the cover loader's pool; the grid picks them up from the cover cache
+        from booksPages.cover_cache import get_cover_loader
+        from booksPages.book_grid import COVER_SIZE
+        loader = get_cover_loader()
+        for book in books[:PREWARM_COVERS]:
+            if book.get("BookCover"):
+                loader.request(book["BookCover"], COVER_SIZE)
+
+
+_page_warmer = None
+
+
+# shared warmer, created on first use once the QApplication exists; quitting cancels it
+def get_page_warmer():
+    global _page_warmer
+    if _page_warmer is None:
+        _page_warmer = PageWarmer()
+        QCoreApplication.instance().aboutToQuit.connect(_page_warmer.cancel)
+    return _page_warmer
@@ -0,0 +1,114 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, Signal
+from PySide6.QtGui import QColor
+
+# Rows fetched per round trip; the view asks for the next page as it is scrolled
+PAGE_SIZE = 100
+
+
+class KeysetTableModel(QAbstractTableModel):
+    """Read-only table model that pulls its rows from a keyset-paginated query.
+
+    fetch_page(after, limit) returns up to limit row dicts that follow the cursor
+    after (None for the first page), and cursor_of(row) gives the cursor of a row.
+    Views ask for more through canFetchMore/fetchMore while the user scrolls, so
+    opening a table costs one page however many rows the query has.
+
+    columns is a list of dicts: "header", "value" (row -> text) and optionally
+    "align", "color" (row -> colour name), "tooltip" and "checkable". Ticking a
+    checkable cell emits checked(row) and the box is shown unticked again.
+    """
+
+    checked = Signal(object)
+
+    def __init__(self, columns, page_size=PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.page_size = page_size
+        self._fetch_page = None
+        self._cursor_of = None
+        self._rows = []
+        self._cursor = None
+        self._exhausted = True
+
+    def load(self, fetch_page, cursor_of):
+        """Start over with a new query and fetch its first page"""
+        self.beginResetModel()
+        self._fetch_page, self._cursor_of = fetch_page, cursor_of
+        self._rows, self._cursor, self._exhausted = [], None, False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def set_rows(self, rows):
+        """Show a fixed list of rows (e.g. search results) with nothing more to fetch"""
+        self.beginResetModel()
+        self._fetch_page = self._cursor_of = None
+        self._rows, self._cursor, self._exhausted = list(rows), None, True
+        self.endResetModel()
+
+    def rows(self):
+        """The rows loaded so far"""
+        return list(self._rows)
+
+    def row_at(self, row):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        rows = self._fetch_page(self._cursor, self.page_size)
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        if not rows:
+            return
+        self._cursor = self._cursor_of(rows[-1])
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]["header"]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = self.columns[index.column()]
+        if role == Qt.DisplayRole:
+            value = column["value"](row) if "value" in column else ""
+            return "" if value is None else str(value)
+        if role == Qt.ForegroundRole and "color" in column:
+            color = column["color"](row)
+            return QColor(color) if color else None
+        if role == Qt.TextAlignmentRole and "align" in column:
+            return column["align"]
+        if role == Qt.ToolTipRole and "tooltip" in column:
+            return column["tooltip"]
+        if role == Qt.CheckStateRole and column.get("checkable"):
+            return Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and self.columns[index.column()].get("checkable"):
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or not self.columns[index.column()].get("checkable"):
+            return False
+        if Qt.CheckState(value) == Qt.Checked:
+            row = self._rows[index.row()]
+            # handlers confirm with a dialog and reload the model, so let the click finish first
+            QTimer.singleShot(0, lambda: self.checked.emit(row))
+        return True
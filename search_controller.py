@@ -0,0 +1,125 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+# How long typing has to pause before the query runs
+SEARCH_DELAY_MS = 250
+
+
+class _SearchJob(QRunnable):
+    """Runs one query on the controller's worker thread"""
+
+    def __init__(self, controller, serial, text):
+        super().__init__()
+        self.controller = controller
+        self.serial = serial
+        self.text = text
+
+    def run(self):
+        try:
+            rows, message = self.controller.query(self.text), ""
+        except Exception as e:
+            rows, message = None, str(e)
+        try:
+            self.controller._done.emit(self.serial, self.text, rows, message)
+        except RuntimeError:
+            pass  # the screen was closed while the query ran
+
+
+class SearchController(QObject):
+    """Search-as-you-type for one search box.
+
+    Every edit restarts a short timer; once typing pauses, query(text) runs on a
+    worker thread and results(text, rows) follows on the GUI thread. Answers for
+    text that has changed since are dropped and queries still queued behind the
+    running one are cancelled. Emptying the box emits cleared() at once, Enter
+    searches without waiting, and a failing query emits failed(text, message).
+
+    narrow(row, text), if given, says whether a row matches text the way query
+    does. When the new text extends the text of the answer on screen and every row
+    of that answer matches it, the rows are filtered in memory instead. An empty
+    narrowed result still goes to the database, whose fallbacks may find more.
+    With limit, an answer of limit rows or more may have been cut short, so it is
+    never narrowed.
+    """
+
+    results = Signal(str, object)
+    cleared = Signal()
+    failed = Signal(str, str)
+    _done = Signal(int, str, object, str)
+
+    def __init__(self, line_edit, query, narrow=None, limit=None, delay=SEARCH_DELAY_MS, parent=None):
+        super().__init__(parent or line_edit)
+        self.line_edit = line_edit
+        self.query = query
+        self.narrow = narrow
+        self.limit = limit
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.search_now)
+        self._serial = 0
+        self._last = None  # (text, rows) on screen, kept only while it can be narrowed
+        self._done.connect(self._on_done)
+        line_edit.textChanged.connect(self._on_text_changed)
+        line_edit.returnPressed.connect(self.search_now)
+
+    def text(self):
+        return self.line_edit.text().strip()
+
+    def _on_text_changed(self, _text):
+        if self.text():
+            self.timer.start()
+        else:
+            self._cancel()
+            self.cleared.emit()
+
+    def _cancel(self):
+        self.timer.stop()
+        self.pool.clear()
+        self._serial += 1
+        self._last = None
+
+    def search_now(self):
+        """Search for the current text without waiting for the timer"""
+        text = self.text()
+        if not text:
+            self._cancel()
+            self.cleared.emit()
+            return
+        self.timer.stop()
+        self.pool.clear()
+        self._serial += 1
+        rows = self._narrowed(text)
+        if rows:
+            self._last = (text, rows)
+            self.results.emit(text, rows)
+        else:
+            self.pool.start(_SearchJob(self, self._serial, text))
+
+    def refresh(self):
+        """Query again, e.g. after the records behind the results changed"""
+        self._last = None
+        self.search_now()
+
+    def _narrowed(self, text):
+        if self.narrow is None or self._last is None:
+            return None
+        last_text, rows = self._last
+        if not text.lower().startswith(last_text.lower()):
+            return None
+        return [row for row in rows if self.narrow(row, text)]
+
+    def _on_done(self, serial, text, rows, message):
+        if serial != self._serial:
+            return  # newer input arrived while this query ran
+        if rows is None:
+            self._last = None
+            self.failed.emit(text, message)
+            return
+        # results from a fallback (LIKE, fuzzy) that the filter can't reproduce, or cut
+        # short by the limit, are never narrowed
+        narrowable = (self.narrow is not None and (self.limit is None or len(rows) < self.limit)
+                      and all(self.narrow(row, text) for row in rows))
+        self._last = (text, rows) if narrowable else None
+        self.results.emit(text, rows)
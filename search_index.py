@@ -0,0 +1,464 @@
+import os
+import re
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+
+# ----Book full-text index----
+# BookSearch holds one row per active book (rowid = BookCode). Triggers keep it in
+# sync with Book, BookAuthor and Book_Genre, and soft-deleted books are left out,
+# so a restore simply puts the row back.
+BOOK_SEARCH_TABLE = """CREATE VIRTUAL TABLE IF NOT EXISTS BookSearch USING fts5(
+                    BookTitle, ISBN, Publisher, BookDescription, Authors, Genres,
+                    LibrarianID UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3')"""
+
+# rebuild the index row of one book; {code} is the SQL expression for the BookCode
+_REFRESH_BOOK = """
+                    DELETE FROM BookSearch WHERE rowid = {code};
+                    INSERT INTO BookSearch (rowid, BookTitle, ISBN, Publisher, BookDescription, Authors, Genres, LibrarianID)
+                    SELECT b.BookCode, b.BookTitle, b.ISBN, b.Publisher, b.BookDescription,
+                        (SELECT group_concat(bookAuthor, ' ') FROM BookAuthor WHERE BookCode = b.BookCode),
+                        (SELECT group_concat(Genre, ' ') FROM Book_Genre WHERE BookCode = b.BookCode),
+                        b.LibrarianID
+                    FROM Book b WHERE b.BookCode = {code} AND b.isDeleted IS NULL;"""
+
+# covers edits, soft deletes (isDeleted set) and restores (isDeleted cleared); stock
+# changes (checkouts, returns) and cover updates leave the index row alone
+BOOK_SEARCH_UPDATE_TRIGGER = f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_book_update
+                AFTER UPDATE OF BookTitle, ISBN, Publisher, BookDescription, isDeleted, LibrarianID ON Book
+                BEGIN
+                    DELETE FROM BookSearch WHERE rowid = old.BookCode;{_REFRESH_BOOK.format(code="new.BookCode")}
+                END"""
+
+BOOK_SEARCH_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_book_insert AFTER INSERT ON Book
+                BEGIN{_REFRESH_BOOK.format(code="new.BookCode")}
+                END""",
+    BOOK_SEARCH_UPDATE_TRIGGER,
+    """CREATE TRIGGER IF NOT EXISTS trg_booksearch_book_delete AFTER DELETE ON Book
+                BEGIN
+                    DELETE FROM BookSearch WHERE rowid = old.BookCode;
+                END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_author_insert AFTER INSERT ON BookAuthor
+                BEGIN{_REFRESH_BOOK.format(code="new.BookCode")}
+                END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_author_delete AFTER DELETE ON BookAuthor
+                BEGIN{_REFRESH_BOOK.format(code="old.BookCode")}
+                END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_genre_insert AFTER INSERT ON Book_Genre
+                BEGIN{_REFRESH_BOOK.format(code="new.BookCode")}
+                END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_booksearch_genre_delete AFTER DELETE ON Book_Genre
+                BEGIN{_REFRESH_BOOK.format(code="old.BookCode")}
+                END""",
+)
+
+BOOK_SEARCH_POPULATE = """
+                    INSERT INTO BookSearch (rowid, BookTitle, ISBN, Publisher, BookDescription, Authors, Genres, LibrarianID)
+                    SELECT b.BookCode, b.BookTitle, b.ISBN, b.Publisher, b.BookDescription,
+                        (SELECT group_concat(bookAuthor, ' ') FROM BookAuthor WHERE BookCode = b.BookCode),
+                        (SELECT group_concat(Genre, ' ') FROM Book_Genre WHERE BookCode = b.BookCode),
+                        b.LibrarianID
+                    FROM Book b WHERE b.isDeleted IS NULL"""
+
+# bm25 weights, in column order: title, ISBN, publisher, description, authors, genres
+BOOK_RANK_WEIGHTS = "10.0, 8.0, 2.0, 1.0, 6.0, 3.0"
+
+
+# True when the SQLite build this Python uses ships the FTS5 module
+def fts5_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+# True when SQLite also ships the FTS5 trigram tokenizer (3.34 and later)
+def trigram_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.trigram_probe USING fts5(x, tokenize = 'trigram')")
+        conn.execute("DROP TABLE temp.trigram_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def table_exists(conn, name):
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+    return row is not None
+
+
+# Migration step: create BookSearch, its triggers and fill it from the current catalogue
+def create_book_search(cursor):
+    if not fts5_available(cursor.connection):
+        print("⚠️ SQLite was built without FTS5, book search stays on LIKE queries")
+        return
+    cursor.execute(BOOK_SEARCH_TABLE)
+    for trigger in BOOK_SEARCH_TRIGGERS:
+        cursor.execute(trigger)
+    cursor.execute("DELETE FROM BookSearch")
+    cursor.execute(BOOK_SEARCH_POPULATE)
+
+
+# Migration step: databases indexed before v5 rebuilt a book's index row on every
+# update of Book; recreate the trigger so only the indexed columns fire it
+def narrow_book_search_trigger(cursor):
+    if not table_exists(cursor.connection, "BookSearch"):
+        return
+    cursor.execute("DROP TRIGGER IF EXISTS trg_booksearch_book_update")
+    cursor.execute(BOOK_SEARCH_UPDATE_TRIGGER)
+
+
+# Turn what the librarian typed into an FTS5 query: every word must match, and
+# every word is treated as a prefix so results show up while typing.
+def build_match_query(search_text):
+    words = re.findall(r"\w+", search_text or "", flags=re.UNICODE)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+# In-memory twins of the searches above, for narrowing results already on screen:
+# prefix_match mirrors the FTS5 prefix query, substring_match a LIKE '%text%' query.
+# A field may be a list (authors, genres, book titles).
+def _field_values(fields):
+    for field in fields:
+        for value in (field if isinstance(field, list) else [field]):
+            if value is not None:
+                yield str(value).lower()
+
+
+def prefix_match(search_text, *fields):
+    words = re.findall(r"\w+", (search_text or "").lower())
+    tokens = [token for value in _field_values(fields) for token in re.findall(r"\w+", value)]
+    return all(any(token.startswith(word) for token in tokens) for word in words)
+
+
+def substring_match(search_text, *fields):
+    search_text = (search_text or "").lower()
+    return any(search_text in value for value in _field_values(fields))
+
+
+# bm25 weighs every hit of every word before it can rank any of them, so only
+# queries with at most RANK_WINDOW hits are ranked by it. Broader ones (a common
+# prefix while typing) show the newest RANK_WINDOW hits, those matching in the
+# title or authors first.
+RANK_WINDOW = 500
+
+# most rows a search-as-you-type query returns
+SEARCH_LIMIT = 200
+
+
+# Return active Book rows for the librarian, best match first,
+# or None when the index can't answer so the caller can fall back to LIKE.
+def search_books(conn, search_text, librarian_id, limit=SEARCH_LIMIT):
+    match = build_match_query(search_text)
+    if not match or not table_exists(conn, "BookSearch"):
+        return None
+    outside = conn.execute(
+        "SELECT rowid FROM BookSearch WHERE BookSearch MATCH ? AND LibrarianID = ? "
+        "ORDER BY rowid DESC LIMIT 1 OFFSET ?", (match, librarian_id, RANK_WINDOW)).fetchone()
+    parameters = [match, librarian_id]
+    if outside is None:
+        window = ""
+        order = f"bm25(BookSearch, {BOOK_RANK_WEIGHTS}), b.BookTitle ASC"
+    else:
+        window = "AND BookSearch.rowid > ?"
+        order = """BookSearch.rowid IN (SELECT rowid FROM BookSearch
+                                         WHERE BookSearch MATCH ? AND rowid > ?) DESC,
+                 b.BookTitle ASC"""
+        parameters += [outside[0], "{BookTitle Authors} : (" + match + ")", outside[0]]
+    query = f"""
+        SELECT b.* FROM BookSearch
+        JOIN Book AS b ON b.BookCode = BookSearch.rowid
+        WHERE BookSearch MATCH ?
+        AND BookSearch.LibrarianID = ?
+        {window}
+        AND b.isDeleted IS NULL
+        ORDER BY {order}
+    """
+    if limit:
+        query += " LIMIT ?"
+        parameters.append(limit)
+    cursor = conn.execute(query, parameters)
+    columns = [desc[0] for desc in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+# ----Member and transaction full-text indexes----
+# Each has a word index (prefix search) and, where SQLite ships the trigram
+# tokenizer (3.34+), a trigram index over the same text for typo-tolerant
+# matching. Both are rebuilt per row by the triggers below.
+MEMBER_SEARCH_TABLE = """CREATE VIRTUAL TABLE IF NOT EXISTS MemberSearch USING fts5(
+                    MemberFN, MemberMI, MemberLN, MemberContact,
+                    LibrarianID UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3')"""
+MEMBER_TRIGRAM_TABLE = """CREATE VIRTUAL TABLE IF NOT EXISTS MemberTrigram USING fts5(
+                    Document, LibrarianID UNINDEXED, tokenize = 'trigram')"""
+
+# {code} is the SQL expression for the MemberID
+_REFRESH_MEMBER = """
+                    DELETE FROM MemberSearch WHERE rowid = {code};
+                    INSERT INTO MemberSearch (rowid, MemberFN, MemberMI, MemberLN, MemberContact, LibrarianID)
+                    SELECT MemberID, MemberFN, MemberMI, MemberLN, MemberContact, LibrarianID
+                    FROM Member WHERE MemberID = {code} AND isDeleted IS NULL;"""
+
+_REFRESH_MEMBER_TRIGRAM = """
+                    DELETE FROM MemberTrigram WHERE rowid = {code};
+                    INSERT INTO MemberTrigram (rowid, Document, LibrarianID)
+                    SELECT MemberID, MemberFN || ' ' || ifnull(MemberMI, '') || ' ' || MemberLN || ' ' || MemberContact, LibrarianID
+                    FROM Member WHERE MemberID = {code} AND isDeleted IS NULL;"""
+
+
+def _refresh_member(code, trigram):
+    return _REFRESH_MEMBER.format(code=code) + (_REFRESH_MEMBER_TRIGRAM.format(code=code) if trigram else "")
+
+
+def member_search_triggers(trigram):
+    return (
+        f"""CREATE TRIGGER IF NOT EXISTS trg_membersearch_insert AFTER INSERT ON Member
+                BEGIN{_refresh_member("new.MemberID", trigram)}
+                END""",
+        # covers edits, soft deletes and restores
+        f"""CREATE TRIGGER IF NOT EXISTS trg_membersearch_update
+                AFTER UPDATE OF MemberFN, MemberMI, MemberLN, MemberContact, isDeleted, LibrarianID ON Member
+                BEGIN{_refresh_member("new.MemberID", trigram)}
+                END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_membersearch_delete AFTER DELETE ON Member
+                BEGIN
+                    DELETE FROM MemberSearch WHERE rowid = old.MemberID;
+                    {"DELETE FROM MemberTrigram WHERE rowid = old.MemberID;" if trigram else ""}
+                END""",
+    )
+
+
+TRANSACTION_SEARCH_TABLE = """CREATE VIRTUAL TABLE IF NOT EXISTS TransactionSearch USING fts5(
+                    BookTitles, Borrower, Status, Remarks,
+                    LibrarianID UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3')"""
+TRANSACTION_TRIGRAM_TABLE = """CREATE VIRTUAL TABLE IF NOT EXISTS TransactionTrigram USING fts5(
+                    Document, LibrarianID UNINDEXED, tokenize = 'trigram')"""
+
+# {where} selects the BookTransaction rows (alias t) to rebuild
+_TRANSACTION_ROWS = """
+                    SELECT t.TransactionID AS TransactionID,
+                        (SELECT group_concat(b.BookTitle, ' ') FROM TransactionDetails AS td
+                            JOIN Book AS b ON b.BookCode = td.BookCode
+                            WHERE td.TransactionID = t.TransactionID) AS BookTitles,
+                        (SELECT m.MemberFN || ' ' || m.MemberLN FROM Member AS m WHERE m.MemberID = t.MemberID) AS Borrower,
+                        t.Status AS Status, t.Remarks AS Remarks, t.LibrarianID AS LibrarianID
+                    FROM BookTransaction AS t WHERE {where}"""
+
+_INSERT_TRANSACTION_SEARCH = """
+                    INSERT INTO TransactionSearch (rowid, BookTitles, Borrower, Status, Remarks, LibrarianID)
+                    SELECT TransactionID, BookTitles, Borrower, Status, Remarks, LibrarianID FROM ({rows})"""
+
+_INSERT_TRANSACTION_TRIGRAM = """
+                    INSERT INTO TransactionTrigram (rowid, Document, LibrarianID)
+                    SELECT TransactionID, ifnull(BookTitles, '') || ' ' || ifnull(Borrower, '') || ' ' || ifnull(Remarks, ''), LibrarianID
+                    FROM ({rows})"""
+
+
+def _refresh_transactions(where, trigram):
+    rows = _TRANSACTION_ROWS.format(where=where)
+    selected = f"SELECT t.TransactionID FROM BookTransaction AS t WHERE {where}"
+    statements = f"""
+                    DELETE FROM TransactionSearch WHERE rowid IN ({selected});{_INSERT_TRANSACTION_SEARCH.format(rows=rows)};"""
+    if trigram:
+        statements += f"""
+                    DELETE FROM TransactionTrigram WHERE rowid IN ({selected});{_INSERT_TRANSACTION_TRIGRAM.format(rows=rows)};"""
+    return statements
+
+
+def transaction_search_triggers(trigram):
+    return (
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_insert AFTER INSERT ON BookTransaction
+                BEGIN{_refresh_transactions("t.TransactionID = new.TransactionID", trigram)}
+                END""",
+        # returns name Remarks in their SET clause (COALESCE keeps the old value), so
+        # only a real change rebuilds the rows
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_update
+                AFTER UPDATE OF MemberID, Remarks, LibrarianID ON BookTransaction
+                WHEN old.MemberID IS NOT new.MemberID OR old.Remarks IS NOT new.Remarks
+                    OR old.LibrarianID IS NOT new.LibrarianID
+                BEGIN{_refresh_transactions("t.TransactionID = new.TransactionID", trigram)}
+                END""",
+        # returns only change the status, which is not part of the trigram text
+        """CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_status AFTER UPDATE OF Status ON BookTransaction
+                WHEN old.Status IS NOT new.Status
+                BEGIN
+                    UPDATE TransactionSearch SET Status = new.Status WHERE rowid = new.TransactionID;
+                END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_delete AFTER DELETE ON BookTransaction
+                BEGIN
+                    DELETE FROM TransactionSearch WHERE rowid = old.TransactionID;
+                    {"DELETE FROM TransactionTrigram WHERE rowid = old.TransactionID;" if trigram else ""}
+                END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_details_insert AFTER INSERT ON TransactionDetails
+                BEGIN{_refresh_transactions("t.TransactionID = new.TransactionID", trigram)}
+                END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_details_delete AFTER DELETE ON TransactionDetails
+                BEGIN{_refresh_transactions("t.TransactionID = old.TransactionID", trigram)}
+                END""",
+        # a renamed member or book changes the text of every transaction it appears in
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_member_rename AFTER UPDATE OF MemberFN, MemberLN ON Member
+                BEGIN{_refresh_transactions("t.MemberID = new.MemberID", trigram)}
+                END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_transactionsearch_book_rename AFTER UPDATE OF BookTitle ON Book
+                BEGIN{_refresh_transactions("t.TransactionID IN (SELECT TransactionID FROM TransactionDetails WHERE BookCode = new.BookCode)", trigram)}
+                END""",
+    )
+
+
+# minimum share of the query's trigrams a fuzzy hit has to contain
+FUZZY_THRESHOLD = 0.5
+
+
+# Migration step: create the member and transaction indexes and fill them
+def create_member_transaction_search(cursor):
+    if not fts5_available(cursor.connection):
+        print("⚠️ SQLite was built without FTS5, member and transaction search stay on LIKE queries")
+        return
+    trigram = trigram_available(cursor.connection)
+    if not trigram:
+        print("⚠️ SQLite has no trigram tokenizer (3.34+), typo-tolerant search falls back to LIKE queries")
+    cursor.execute(MEMBER_SEARCH_TABLE)
+    cursor.execute(TRANSACTION_SEARCH_TABLE)
+    if trigram:
+        cursor.execute(MEMBER_TRIGRAM_TABLE)
+        cursor.execute(TRANSACTION_TRIGRAM_TABLE)
+    for statement in member_search_triggers(trigram) + transaction_search_triggers(trigram):
+        cursor.execute(statement)
+    for table in ("MemberSearch", "TransactionSearch") + (("MemberTrigram", "TransactionTrigram") if trigram else ()):
+        cursor.execute(f"DELETE FROM {table}")
+    cursor.execute("""INSERT INTO MemberSearch (rowid, MemberFN, MemberMI, MemberLN, MemberContact, LibrarianID)
+                    SELECT MemberID, MemberFN, MemberMI, MemberLN, MemberContact, LibrarianID
+                    FROM Member WHERE isDeleted IS NULL""")
+    rows = _TRANSACTION_ROWS.format(where="1 = 1")
+    cursor.execute(_INSERT_TRANSACTION_SEARCH.format(rows=rows))
+    if trigram:
+        cursor.execute("""INSERT INTO MemberTrigram (rowid, Document, LibrarianID)
+                    SELECT MemberID, MemberFN || ' ' || ifnull(MemberMI, '') || ' ' || MemberLN || ' ' || MemberContact, LibrarianID
+                    FROM Member WHERE isDeleted IS NULL""")
+        cursor.execute(_INSERT_TRANSACTION_TRIGRAM.format(rows=rows))
+
+
+# Migration step: databases indexed before v6 rebuilt a member's or transaction's
+# index rows on every update (returns included); recreate the triggers so only the
+# indexed columns fire them
+def narrow_member_transaction_search_triggers(cursor):
+    conn = cursor.connection
+    if not table_exists(conn, "MemberSearch"):
+        return
+    trigram = table_exists(conn, "MemberTrigram")
+    triggers = member_search_triggers(trigram) + transaction_search_triggers(trigram)
+    for trigger in triggers:
+        name = re.search(r"TRIGGER IF NOT EXISTS (\w+)", trigger).group(1)
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(trigger)
+
+
+def _trigrams(text):
+    text = " ".join(re.findall(r"\w+", (text or "").lower()))
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# Return the rowids of an FTS table that match the typed words as prefixes
+def prefix_matches(conn, table, search_text, librarian_id):
+    match = build_match_query(search_text)
+    if not match or not table_exists(conn, table):
+        return None
+    cursor = conn.execute(
+        f"SELECT rowid FROM {table} WHERE {table} MATCH ? AND LibrarianID = ? ORDER BY rank",
+        (match, librarian_id))
+    return [row[0] for row in cursor.fetchall()]
+
+
+# Typo-tolerant lookup: any shared trigram is a candidate, then candidates that
+# contain too few of the query's trigrams are dropped. Best matches come first.
+def fuzzy_matches(conn, table, search_text, librarian_id, limit=200):
+    grams = _trigrams(search_text)
+    if not grams or not table_exists(conn, table):
+        return None
+    match = " OR ".join('"' + gram.replace('"', '""') + '"' for gram in sorted(grams))
+    cursor = conn.execute(
+        f"SELECT rowid, Document FROM {table} WHERE {table} MATCH ? AND LibrarianID = ? ORDER BY rank LIMIT ?",
+        (match, librarian_id, limit))
+    scored = []
+    for rowid, document in cursor.fetchall():
+        score = len(grams & _trigrams(document)) / len(grams)
+        if score >= FUZZY_THRESHOLD:
+            scored.append((score, rowid))
+    scored.sort(key=lambda item: -item[0])
+    return [rowid for _, rowid in scored]
+
+
+# Build a synthetic catalogue and time ranked searches against it
+def benchmark_book_search(books=100000, runs=50):
+    from tryDatabase import DatabaseSeeder
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    seeder = DatabaseSeeder(path, settings={"optimize_on_close": False})
+    rng = random.Random(7)
+    # a few thousand made-up words plus some real ones, so hits are as selective as a real catalogue
+    syllables = ["ka", "lo", "mi", "ra", "ten", "dor", "vi", "san", "el", "qu", "bar", "nis"]
+    words = ["harry", "potter", "secret", "garden", "history", "mountain", "shadow", "empire", "journey"]
+    words += ["".join(rng.choices(syllables, k=3)) for _ in range(5000)]
+    try:
+        conn, cursor = seeder.get_connection_and_cursor()
+        try:
+            cursor.execute("INSERT INTO Librarian (LibrarianID, LibUsername, FName, LName, LibPass) "
+                           "VALUES (1, 'bench', 'Bench', 'Mark', 'x')")
+            cursor.executemany(
+                "INSERT INTO Book (BookTitle, Publisher, BookDescription, ISBN, BookTotalCopies, "
+                "BookAvailableCopies, LibrarianID) VALUES (?, ?, ?, ?, 1, 1, 1)",
+                ((" ".join(rng.sample(words, 3)).title() + f" {i}", "Publisher " + rng.choice(words),
+                  " ".join(rng.choices(words, k=12)), 9780000000000 + i) for i in range(books)))
+            cursor.execute("DROP TRIGGER trg_booksearch_author_insert")
+            cursor.executemany(
+                "INSERT INTO BookAuthor (BookCode, bookAuthor) VALUES (?, ?)",
+                ((i + 1, f"{rng.choice(words).title()} {rng.choice(words).title()}") for i in range(books)))
+            conn.commit()
+        finally:
+            conn.close()
+
+        # cheaper than letting the triggers rebuild a row for every author insert
+        conn, cursor = seeder.get_connection_and_cursor()
+        try:
+            cursor.execute("DELETE FROM BookSearch")
+            cursor.execute(BOOK_SEARCH_POPULATE)
+            conn.commit()
+        finally:
+            conn.close()
+
+        timings = {}
+        for text in ("harry pot", "secret garden", "mount", "ka", "97800000123", "shadow empire journey"):
+            conn, _ = seeder.get_connection_and_cursor()
+            try:
+                search_books(conn, text, 1)
+                start = time.perf_counter()
+                for _ in range(runs):
+                    search_books(conn, text, 1)
+                timings[text] = (time.perf_counter() - start) / runs * 1000
+            finally:
+                conn.close()
+        return timings
+    finally:
+        seeder.shutdown()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    # python search_index.py [books] -> average latency of ranked searches (top SEARCH_LIMIT hits)
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for text, ms in benchmark_book_search(size).items():
+        print(f"{text!r:28} {ms:8.2f} ms")
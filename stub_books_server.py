@@ -0,0 +1,121 @@
+import re
+import sys
+import json
+import time
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Canned Google Books volumes keyed by ISBN-13
+STUB_VOLUMES = {
+    "9780132350884": {
+        "title": "Clean Code",
+        "authors": ["Robert C. Martin"],
+        "publisher": "Prentice Hall",
+        "publishedDate": "2008",
+        "description": "A handbook of agile software craftsmanship.",
+        "categories": ["Computers"],
+        "industryIdentifiers": [
+            {"type": "ISBN_13", "identifier": "9780132350884"},
+            {"type": "ISBN_10", "identifier": "0132350882"},
+        ],
+    },
+    "9780306406157": {
+        "title": "Example Book",
+        "authors": ["Jane Doe", "John Roe"],
+        "publisher": "Example Press",
+        "publishedDate": "1999",
+        "description": "Used by the ISBN examples.",
+        "categories": ["Reference"],
+        "industryIdentifiers": [{"type": "ISBN_13", "identifier": "9780306406157"}],
+    },
+}
+
+
+class StubBooksServer:
+    """Local stand-in for the Google Books volumes endpoint.
+
+    Answers /volumes?q=isbn:<isbn> ... from STUB_VOLUMES and counts requests, so
+    the lookup cache and the in-flight de-duplication can be checked offline.
+    Set delay to slow every answer down and fail_status to answer with an HTTP error.
+
+        with StubBooksServer() as server:
+            os.environ["GOOGLE_BOOKS_API_URL"] = server.url
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, volumes=None, delay=0.2, fail_status=None):
+        self.volumes = STUB_VOLUMES if volumes is None else volumes
+        self.delay = delay
+        self.fail_status = fail_status
+        self.request_count = 0
+        self.queries = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/volumes"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+                with stub._lock:
+                    stub.request_count += 1
+                    stub.queries.append(query)
+                time.sleep(stub.delay)
+                if stub.fail_status:
+                    self._send(stub.fail_status, {"error": {"code": stub.fail_status}})
+                    return
+                match = re.search(r"isbn:([0-9X]+)", query)
+                volume = stub.volumes.get(match.group(1)) if match else None
+                if volume:
+                    body = {"kind": "books#volumes", "totalItems": 1, "items": [{"volumeInfo": volume}]}
+                else:
+                    body = {"kind": "books#volumes", "totalItems": 0}
+                self._send(200, body)
+
+            def _send(self, status, body):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+if __name__ == "__main__":
+    # python stub_books_server.py [port] -> then run the app with GOOGLE_BOOKS_API_URL=<printed url>
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = StubBooksServer(port=port, delay=0).start()
+    print(f"Stub Google Books API at {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -6,6 +6,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QDate, Signal
 from PySide6.QtGui import QFont
 from .transaction_logic import BorrowBooks
+from tryDatabase import CheckoutError
 from datetime import datetime
 import sqlite3
 
@@ -558,103 +559,37 @@ class AddTransactionForm(QDialog):
             QMessageBox.warning(self, "Input Error", "Due date cannot be before borrow date.")
             return
         
-        # Verify book availability
-        books = self.borrow_books.db_seeder.get_all_records(tableName="Book", id=self.librarian_id)
-        book_dict = {book["BookTitle"]: book for book in books}
-
-        #check each selected book
-        for book_data in books_data:
-            book_title = book_data["book"]
-            quantity = book_data["quantity"]
-            # Check book exists in library
-            if book_title not in book_dict:
-                QMessageBox.warning(self, "Input Error", f"Book '{book_title}' not found in the library.")
-                return
-            # Check sufficient copies available
-            if book_dict[book_title]["BookAvailableCopies"] < quantity:
-                QMessageBox.warning(self, "Input Error", f"Not enough copies of '{book_title}' available.")
-                return
-        
-        # Prepare transaction data for database
-        transaction_data = [{
-            "BorrowedDate": borrow_date,
-            "Status": "Borrowed",  # New transactions are always "Borrowed"
-            "Remarks": self.remarks_edit.toPlainText().strip() or None,
-            "LibrarianID": self.librarian_id,
-            "MemberID": int(validated_member_id),
-        }]
-
         try:
-            # Ensure tables exist
-            self.borrow_books.db_seeder.create_table("BookTransaction")
-            self.borrow_books.db_seeder.create_table("TransactionDetails")
-            
-            # Insert transaction record
-            transaction_id = self.borrow_books.db_seeder.seed_data(
-                tableName="BookTransaction",
-                data=transaction_data,
-                columnOrder=["BorrowedDate", "Status", "Remarks", "LibrarianID", "MemberID"]
+            # Stock check, transaction record, details and inventory updates in one database transaction
+            self.borrow_books.db_seeder.checkout(
+                member_id=int(validated_member_id),
+                librarian_id=self.librarian_id,
+                books=books_data,
+                borrow_date=borrow_date,
+                due_date=due_date,
+                remarks=self.remarks_edit.toPlainText().strip() or None
             )
-
-            if not transaction_id:
-                QMessageBox.warning(self, "Error", "Failed to create transaction. Check database logs for details.")
-                print(f"Transaction creation failed: {transaction_data}")
-                return
-            
-            # Add transaction details for each book
-            for book_data in books_data:
-                book_title = book_data["book"]
-                quantity = book_data["quantity"]
-                book_code = book_dict[book_title]["BookCode"]
-
-                details_data = [{
-                    "Quantity": quantity,
-                    "DueDate": due_date,
-                    "TransactionID": transaction_id,
-                    "BookCode": book_code,
-                }]
-                
-                # Insert transaction detail record
-                success = self.borrow_books.db_seeder.seed_data(
-                    tableName="TransactionDetails",
-                    data=details_data,
-                    columnOrder=["Quantity", "DueDate", "TransactionID", "BookCode"]
-                )
-                
-                if not success:
-                    QMessageBox.warning(self, "Error", f"Failed to add details for book '{book_title}'.")
-                    # Rollback transaction if details fail
-                    self.borrow_books.db_seeder.delete_table("BookTransaction", "TransactionID", transaction_id, self.librarian_id)
-                    return
-                
-                # Update book inventory
-                self.borrow_books.db_seeder.update_table(
-                    tableName="Book",
-                    updates={"BookAvailableCopies": book_dict[book_title]["BookAvailableCopies"] - quantity},
-                    column="BookCode",
-                    value=book_code
-                )
-
-            # Show success message
-            QMessageBox.information(self, "Success", "Borrow transaction added successfully!")
-            
-            # Notify parent to refresh if possible
-            if self.parent() and hasattr(self.parent(), 'refresh_transaction_displays'):
-                print("📢 Notifying parent to refresh displays...")
-                self.parent().refresh_transaction_displays()
-            
-            # Close dialog with success
-            super().accept()
-
+        except CheckoutError as e:
+            # Nothing was written; tell the librarian what to fix
+            QMessageBox.warning(self, "Input Error", str(e))
+            return
         except sqlite3.Error as e:
-            # Handle database errors
+            # Handle database errors, the checkout was rolled back
             QMessageBox.warning(self, "Error", f"Database error: {str(e)}")
-            print(f"Transaction creation error: {str(e)}, Data: {transaction_data}")
-            # Rollback transaction if error occurs
-            if transaction_id:
-                self.borrow_books.db_seeder.delete_table("BookTransaction", "TransactionID", transaction_id, self.librarian_id)
+            print(f"Transaction creation error: {str(e)}, Books: {books_data}")
             return
 
+        # Show success message
+        QMessageBox.information(self, "Success", "Borrow transaction added successfully!")
+
+        # Notify parent to refresh if possible
+        if self.parent() and hasattr(self.parent(), 'refresh_transaction_displays'):
+            print("📢 Notifying parent to refresh displays...")
+            self.parent().refresh_transaction_displays()
+
+        # Close dialog with success
+        super().accept()
+
     def get_transaction_data(self):
         """Get validated transaction data from form"""
         member_id = self.member_id_edit.text().strip()
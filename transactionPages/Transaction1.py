@@ -1,3 +1,4 @@
+import re
 import sys
 from navbar_logic import nav_manager
 from .transaction_logic import BorrowBooks
@@ -5,19 +6,27 @@ from .transaction_logic import BorrowBooks
 from datetime import datetime
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
     QLabel, QLineEdit, QMessageBox, QDialog,
-    QTableWidget, QTableWidgetItem, QHeaderView, QFrame,
-    QStackedWidget, QMainWindow
+    QTableView, QHeaderView, QFrame,
+    QStackedWidget, QMainWindow, QInputDialog
 )
-from functools import partial
+from paged_table import KeysetTableModel
+from search_controller import SearchController
+from search_index import prefix_match
 from .AddTransactionForm import AddTransactionForm  # PARA MA-IMPORT UNG TRANSACTION FORM 
 from .PreviewTransactionForm import PreviewTransactionForm # PARA MA-IMPORT UNG PREVIEW NG TRANSACTION
 from .HistoryPreviewForm import HistoryTransactionPreviewForm # PARA MA-IMPORT UNG PREVIEW NG HISTORY 
 from navigation_sidebar import NavigationSidebar # PARA SA SIDE BAR 
 
+TEXT_COLOR = "#5C4033" #dark brown table text
+
+
+#keyset cursor of a feed row: the next page starts after this (borrowed date, transaction id)
+def feed_cursor(transaction):
+    return (transaction['date'], transaction['id'])
+
 class TransactionCard(QFrame):
     #initialize transaction widget with transaction data and parent system reference
     def __init__(self, transaction, parent_system):
@@ -156,7 +165,6 @@ class LibraryTransactionSystem(QMainWindow):
         self.setGeometry(100, 100, 1400, 800) #set initialize window position and size
         self.showMaximized() #start window in maximized state
         self.setStyleSheet("background-color: white;") #default background color
-        self.transactions = [] ##initialized empty transaction list
         self.setup_ui() #set up UI
 
         self.setStyleSheet("""
@@ -274,7 +282,12 @@ class LibraryTransactionSystem(QMainWindow):
             }
         """)
         # connect search tects changes to filtering function
-        self.trans_search_edit.textChanged.connect(self.search_transactions)
+        #search as the user types, debounced and queried on a worker thread
+        self.trans_search = SearchController(
+            self.trans_search_edit, lambda term: self.query_transactions(term, "Borrowed"), narrow=self.transaction_matches)
+        self.trans_search.results.connect(lambda term, rows: self.display_transactions(rows))
+        self.trans_search.cleared.connect(self.display_transactions)
+        self.trans_search.failed.connect(lambda term, message: self.perform_local_transaction_search(term))
         search_layout.addWidget(self.trans_search_edit)
 
         #add transaction button
@@ -295,25 +308,45 @@ class LibraryTransactionSystem(QMainWindow):
         """)
         add_transaction_btn.clicked.connect(self.open_add_transaction_form)
         search_layout.addWidget(add_transaction_btn)
+
+        #return many transactions at once (end-of-day drop-box)
+        return_many_btn = QPushButton("📥")
+        return_many_btn.setToolTip("Return drop-box transactions")
+        return_many_btn.setStyleSheet(add_transaction_btn.styleSheet())
+        return_many_btn.clicked.connect(self.open_return_many_dialog)
+        search_layout.addWidget(return_many_btn)
         layout.addLayout(search_layout)  #add search bar to main layout
 
-        #for transaction table
-        self.trans_table = QTableWidget()
-        self.trans_table.setColumnCount(6) #set 6 columns
-        self.trans_table.setHorizontalHeaderLabels([
-            "Name", "Book Borrowed", "Borrowed Date", "Transaction Type", "Due Date", "" #empty header for action buttons
-        ])
+        #for transaction table, its rows are fetched a page at a time while scrolling
+        self.trans_model = KeysetTableModel([
+            {"header": "Name", "value": lambda t: t.get('borrower', 'N/A'), "color": lambda t: TEXT_COLOR},
+            {"header": "Book Borrowed", "value": lambda t: t['book_title'], "color": lambda t: TEXT_COLOR},
+            {"header": "Borrowed Date", "value": lambda t: t.get('date', 'N/A'), "color": lambda t: TEXT_COLOR},
+            #red for overdue, green for borrowed
+            {"header": "Transaction Type", "value": lambda t: t['status'],
+             "color": lambda t: "#c0392b" if t['status'] == "Overdue" else "#27ae60"},
+            {"header": "Due Date", "value": lambda t: t.get('due_date', 'N/A'), "color": lambda t: TEXT_COLOR},
+            #action column, clicking it deletes the transaction
+            {"header": "", "value": lambda t: "Delete", "color": lambda t: "#c0392b",
+             "align": Qt.AlignCenter, "tooltip": "Delete Transaction"},
+        ], parent=self)
+        self.trans_table = QTableView()
+        self.trans_table.setModel(self.trans_model)
         #table configuration
         self.trans_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch) #auto-resize
         self.trans_table.verticalHeader().setVisible(False) #hide row numbers
-        self.trans_table.setEditTriggers(QTableWidget.NoEditTriggers) #read only
-        self.trans_table.setSelectionBehavior(QTableWidget.SelectRows) #full row selection
+        self.trans_table.verticalHeader().setDefaultSectionSize(40) #row height
+        self.trans_table.setEditTriggers(QTableView.NoEditTriggers) #read only
+        self.trans_table.setSelectionBehavior(QTableView.SelectRows) #full row selection
         self.trans_table.setAlternatingRowColors(False) #no alternating background color of table rows 
         self.trans_table.setShowGrid(True) #show grid lines
         
         layout.addWidget(self.trans_table, stretch=1) #add table layout with stretch factor
         self.setup_table_style(self.trans_table) #apply custom table styling
-        self.trans_table.cellDoubleClicked.connect(self.on_transaction_double_click)  # double-click signal to see vie details
+        self.trans_table.doubleClicked.connect(
+            lambda index: self.on_transaction_double_click(index.row(), index.column()))  # double-click signal to see vie details
+        self.trans_table.clicked.connect(
+            lambda index: self.on_action_clicked(self.trans_model, index)) #delete column
         self.content_stack.addWidget(self.transactions_page)# addp page tostacked widget
 
     # HISTORY PAGE - transaction history view
@@ -347,30 +380,43 @@ class LibraryTransactionSystem(QMainWindow):
             }
         """)
         #connect text changes to search filtering
-        self.hist_search_edit.textChanged.connect(self.search_history)
+        self.hist_search = SearchController(
+            self.hist_search_edit, lambda term: self.query_transactions(term, "Returned"), narrow=self.transaction_matches)
+        self.hist_search.results.connect(lambda term, rows: self.display_history(rows))
+        self.hist_search.cleared.connect(self.display_history)
+        self.hist_search.failed.connect(lambda term, message: self.perform_local_history_search(term))
         #add search field to layout
         search_layout.addWidget(self.hist_search_edit)
         #add search bar to maintain layout
         layout.addLayout(search_layout)
 
-        #crete history table widget
-        self.hist_table = QTableWidget()
-        self.hist_table.setColumnCount(6)
-        self.hist_table.setHorizontalHeaderLabels([
-            "Borrower", "Book Title", "Borrowed Date", "Returned Date", "Due Date", "Action", " "#extra space colum for action
-        ])
+        #crete history table, newest borrowings first and fetched a page at a time
+        self.hist_model = KeysetTableModel([
+            {"header": "Borrower", "value": lambda t: t.get('borrower', ''), "color": lambda t: TEXT_COLOR},
+            {"header": "Book Title", "value": lambda t: t.get('book_title', ''), "color": lambda t: TEXT_COLOR},
+            {"header": "Borrowed Date", "value": lambda t: t.get('date', 'N/A'), "color": lambda t: TEXT_COLOR},
+            {"header": "Returned Date", "value": lambda t: t.get('returned_date', 'N/A'), "color": lambda t: TEXT_COLOR},
+            {"header": "Due Date", "value": lambda t: t.get('due_date', 'N/A'), "color": lambda t: "#8B4513"},
+            #action column, clicking it deletes the transaction
+            {"header": "Action", "value": lambda t: "Delete", "color": lambda t: "#c0392b",
+             "align": Qt.AlignCenter, "tooltip": "Delete Transaction Historty"},
+        ], parent=self)
+        self.hist_table = QTableView()
+        self.hist_table.setModel(self.hist_model)
         #auto resize columns to fit available copies
         self.hist_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.hist_table.verticalHeader().setVisible(False) #hide row headers
-        self.hist_table.setEditTriggers(QTableWidget.NoEditTriggers) #read only
-        self.hist_table.setSelectionBehavior(QTableWidget.SelectRows) #select entire rows
+        self.hist_table.verticalHeader().setDefaultSectionSize(40) #fixed row height
+        self.hist_table.setEditTriggers(QTableView.NoEditTriggers) #read only
+        self.hist_table.setSelectionBehavior(QTableView.SelectRows) #select entire rows
         self.hist_table.setAlternatingRowColors(False) #disable alternating row colors
         self.hist_table.setShowGrid(True) #show grid lines
 
         #add table to layout with stretch factor
         layout.addWidget(self.hist_table, stretch=1)
         self.setup_table_style(self.hist_table) #apply custom table styling
-        self.hist_table.cellDoubleClicked.connect(self.on_history_double_click)
+        self.hist_table.doubleClicked.connect(lambda index: self.on_history_double_click(index.row(), index.column()))
+        self.hist_table.clicked.connect(lambda index: self.on_action_clicked(self.hist_model, index)) #delete column
         self.content_stack.addWidget(self.history_page)  #add page to stacked widget
 
     #TSWITCH TO TRANSACTION PAGE VIEW
@@ -448,47 +494,22 @@ class LibraryTransactionSystem(QMainWindow):
         self.display_history()
 
     def display_transactions(self, filtered_transactions=None):
-         
-        # Always fetch all transactions for the current librarian
-        self.transactions = self.borrow_books.fetch_all_transactions(self.librarian_id) or []
-        print("Transaction(Current):", self.transactions)
-        #sort transactions by date (newest first)
-        self.transactions.sort(key=lambda x: datetime.strptime(x.get('date', '1970-01-01'), "%Y-%m-%d"), reverse=True)
-
-        # Only show transactions where action is "Borrowed"
-        transaction_dict = {}
-        for trans in self.transactions:
-            if trans.get('action') != 'Borrowed':
-                continue
-            trans_id = trans.get('id') #group books by transaction id
-            if trans_id not in transaction_dict:
-                #create transcation entry if not exits
-                transaction_dict[trans_id]  = {
-                    'id': trans_id,
-                    'borrower': trans.get('borrower', 'N/A'),
-                    'date': trans.get('date', 'N/A'),
-                    'due_date':trans.get('due_date', 'N/A'),
-                    'action': trans.get('action', 'Borrowed'),
-                    'remarks': trans.get('remarks', ''),
-                    'books': [] #list to hold all books in this transactions
-                }
-                #add book to transaction
-            transaction_dict[trans_id]['books'].append({
-                'title': trans.get('book_title', 'N/A'),
-                'quantity':trans.get('quantity', 1) #default to 1 if missing
-            })
-            #convert to list and sot by date (newwest first)
-        all_transactions = sorted (transaction_dict.values(), key=lambda x:datetime.strptime(x['date'], "%Y-%m-%d"), reverse=True)
-        #use filtered transactions if provided, otherwise use all
-        transactions_to_display = filtered_transactions if filtered_transactions is not None else all_transactions
-        #clear exxisting rows
-        self.trans_table.setRowCount(0)
-        self.trans_table.setRowCount(len(transactions_to_display))
-
-        #populate table with transaction data
-        for row, trans in enumerate(transactions_to_display):
-            #determine status if borrowed or overdue
-            status =  "Borrowed"
+        if filtered_transactions is not None: #search results are shown as they are
+            self.trans_model.set_rows(self.add_status(filtered_transactions))
+        else:
+            # borrowed transactions for the current librarian, grouped by id and newest first;
+            # the table asks for the next page when it is scrolled to the bottom
+            self.trans_model.load(self.fetch_active_page, feed_cursor)
+
+    #ONE PAGE OF BORROWED TRANSACTIONS
+    def fetch_active_page(self, after, limit):
+        return self.add_status(self.borrow_books.fetch_transaction_feed(
+            self.librarian_id, status="Borrowed", after=after, limit=limit))
+
+    #DETERMINE STATUS IF BORROWED OR OVERDUE
+    def add_status(self, transactions):
+        for trans in transactions:
+            status = "Borrowed"
             if trans.get('due_date') and trans['due_date'] != 'N/A':
                 try:
                     due_date = datetime.strptime(trans['due_date'], "%Y-%m-%d") #get the due date
@@ -496,142 +517,36 @@ class LibraryTransactionSystem(QMainWindow):
                     status = "Overdue" if due_date < today else "Borrowed"
                 except ValueError as e: #handle error
                     print(f"Invalid due date format for transaction {trans['id']}: {trans['due_date']} - Error: {str(e)}")
-                    status = "Borrowed"
             else:
-                print(f"Missing due_date for transaction {trans_id}")
-                status = "Borrowed"
-            #format  book title with quantities 
-            book_titles = ", ".join([f"{book['title']} (x{book['quantity']})" for book in trans['books']])
-            total_quantity = sum(book['quantity'] for book in trans['books']) #calculate total quantity of all books in transaction
-            #prepare values for each column
-            values = [
-                trans.get('borrower', 'N/A'), #borrower name
-                book_titles, #formatted book list
-                trans.get('date', 'N/A'), #borrow date
-                status, #status (borrowed/overdue)
-                trans.get('due_date', 'N/A'), #due date
-                str(total_quantity), #total wuantity
-                "" #empty colum for action buttons
-            ]
-            #create ans style table items      
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setForeground(QColor("#5C4033")) #default to brown text
-                if col == 3:  # Status column
-                    if status == "Overdue":
-                        item.setForeground(QColor("#c0392b")) #red for overdue
-                    elif status == "Borrowed":
-                        item.setForeground(QColor("#27ae60")) #green for borrowed
-                self.trans_table.setItem(row, col, item)
-
-            # --- Delete button ---
-            delete_btn = QPushButton("Delete")
-            delete_btn.setToolTip("Delete Transaction") #hover text
-            delete_btn.setFont(QFont("Segoe UI Emoji", 10, QFont.Bold))
-            #style delete button
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    border-radius: 12px;
-                    font-size: 10px;
-                    color: #c0392b;
-                    background: white;
-                    font-family: "Segoe UI Emoji", "Times New Roman";
-                    font-weight: bold;
-                    border: 2px solid #c0392b;
-                    padding: 5px 10px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
-            #connect click to delete function with transaction data
-            delete_btn.clicked.connect(partial(self.delete_transaction, trans))
-
-            # Center the button in the cell
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.addStretch()
-            layout.addWidget(delete_btn)
-            layout.addStretch() #add space between buttons
-            layout.setContentsMargins(0, 0, 0, 0) #no margins
-            self.trans_table.setCellWidget(row, 5, container) # add to action column
-            self.trans_table.setRowHeight(row, 40) # set row height
-
-    def search_transactions(self):
-        #get search term from input field and remove whitespace
-        search_term = self.trans_search_edit.text().strip()
-        #if emppty search term, show all transactions
-        if not search_term:
-            self.display_transactions()
-            return
+                print(f"Missing due_date for transaction {trans['id']}")
+            trans['status'] = status
+        return transactions
+
+    #SEARCH TRANSACTIONS IN THE DATABASE (runs on the search controller's worker thread)
+    def query_transactions(self, search_term, status):
         #log search attempt
-        print(f"🔍 Searching transactions for: '{search_term}'")
-        try:
-            # Use database search instead of local search
-            search_results = self.db_seeder.search_records("BookTransaction", search_term, self.librarian_id)
-            
-            # Filter only borrowed transactions for active view
-            borrowed_transactions = [t for t in search_results if t.get('Status') == 'Borrowed']
-            
-            # Group transactions by TransactionID (same format as original)
-            transaction_dict = {}
-            for trans in borrowed_transactions:
-                trans_id = trans.get('TransactionID')
-                if trans_id not in transaction_dict:
-                    #create transaction entry with basic info
-                    transaction_dict[trans_id] = {
-                        'id': trans_id,
-                        'borrower': trans.get('borrower', 'N/A'),
-                        'date': trans.get('BorrowedDate', 'N/A'),
-                        'due_date': trans.get('DueDate', 'N/A'),
-                        'action': trans.get('Status', 'Borrowed'),
-                        'remarks': trans.get('Remarks', ''),
-                        'books': [] #will hold all books in this transction
-                    }
-                transaction_dict[trans_id]['books'].append({
-                    'title': trans.get('BookTitle', 'N/A'),
-                    'quantity': trans.get('Quantity', 1)
-                })
-            #convert to list for display
-            filtered_transactions = list(transaction_dict.values())
-            print(f"✅ Found {len(filtered_transactions)} matching transactions from database")
-            #update display with filtered results
-            self.display_transactions(filtered_transactions)
-            
-        except Exception as e:
-            print(f"❌ Error searching transactions: {e}")
-            # Fallback to local search if database search fails
-            self.perform_local_transaction_search(search_term)
-            
+        print(f"🔍 Searching {status.lower()} transactions for: '{search_term}'")
+        search_results = self.borrow_books.db_seeder.search_records("BookTransaction", search_term, self.librarian_id, fuzzy=True)
+        # Load the matching transactions, grouped by the database
+        matching_ids = {t.get('TransactionID') for t in search_results if t.get('Status') == status}
+        #straight from the seeder: errors reach the search controller (failed -> local search)
+        #instead of a message box on this worker thread
+        filtered_transactions = self.borrow_books.format_transaction_feed(self.borrow_books.db_seeder.get_transaction_feed(
+            self.librarian_id, status=status, transaction_ids=matching_ids)) if matching_ids else []
+        print(f"✅ Found {len(filtered_transactions)} matching transactions from database")
+        return filtered_transactions
+
+    #same fields and word-prefix rule as the TransactionSearch index, to narrow results while typing
+    def transaction_matches(self, trans, search_term):
+        return prefix_match(search_term, [book['title'] for book in trans['books']],
+                            trans.get('borrower'), trans.get('action'), trans.get('remarks'))
+
     def perform_local_transaction_search(self, search_term):
         """Fallback local transaction search method"""
         search_term = search_term.lower()
-        #get only borrowed transactions from cached data
-        active_transactions = [t for t in self.transactions if t.get('action') == 'Borrowed']
-        #group only borrowed transactions b ID (same as display transaction)
-        transaction_dict = {}
-        for trans in self.transactions:
-            if trans.get('action') != 'Borrowed': #skip non borrowed transctions
-                continue
-            trans_id = trans.get('id')
-            if trans_id not in transaction_dict:
-                #creae transaction entry with basic info
-                transaction_dict[trans_id] = {
-                    'id': trans_id,
-                    'borrower': trans.get('borrower', 'N/A'),
-                    'date': trans.get('date', 'N/A'),
-                    'due_date': trans.get('due_date', 'N/A'),
-                    'action': trans.get('action', 'Borrowed'),
-                    'remarks': trans.get('remarks', ''),
-                    'books': [] #holds he books in this transaction
-                }
-            transaction_dict[trans_id]['books'].append({
-                'title': trans.get('book_title', 'N/A'),
-                'quantity': trans.get('quantity', 1) #default quantity 1
-            })
         #filter transactions where search term matches borower name or book tilte
         filtered_transactions = [
-            trans for trans in transaction_dict.values()
+            trans for trans in self.trans_model.rows() #only the pages loaded so far
             if search_term in trans['borrower'].lower() or 
             any(search_term in book['title'].lower() for book in trans['books']) #match any book title
         ]
@@ -641,103 +556,34 @@ class LibraryTransactionSystem(QMainWindow):
 
     #DISPLAY TRANSACTION HISTORY IN THE HISTORY TABLE
     def display_history(self, filtered_history=None):
-        #fetch all transactions for current librarian
-        self.transactions = self.borrow_books.fetch_all_transactions(self.librarian_id) or []
-        print("Transactions (History):", self.transactions)
-        #csort all transactions by borrow date
-        self.transactions.sort(key=lambda x: datetime.strptime(x.get('date', '1970-01-01'), "%Y-%m-%d"), reverse=True)
-        #use filtered history if provided otherwise get all returned transactions
-        history_to_display = filtered_history if filtered_history is not None else [
-            t for t in self.transactions if t.get('action') == 'Returned'
-        ]
-        #sort history by return date (newest)
-        history_to_display.sort(key=lambda x: datetime.strptime(x.get('returned_date', x.get('date', '1970-01-01')), "%Y-%m-%d"),reverse=True)
-
-        self.hist_table.setRowCount(len(history_to_display)) #set table row count to match number of history items
-        #populate tbale with history data
-        for row, trans in enumerate(history_to_display):
-            values = [
-                trans.get('borrower', ''), #member name
-                trans.get('book_title', ''), #book title
-                trans.get('date', 'N/A'), #borrow date
-                trans.get('returned_date', 'N/A'), #date returned
-                trans.get('due_date', 'N/A'), #due date
-                trans.get('action', 'N/A'), # transaction status (Returned)
-            ]
-            # create and tyle table items for each column
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setForeground(QColor("#5C4033")) #deafult dark brown text
-                if col == 4:
-                    if value == "Borrowed": #green text color fo borrowed
-                        item.setForeground(QColor("#27ae60"))
-                    else: #brown for returned
-                        item.setForeground(QColor("#8B4513"))
-                self.hist_table.setItem(row, col, item)
-
-            # Delete button on the Transaction History
-            delete_btn = QPushButton("Delete")
-            delete_btn.setToolTip("Delete Transaction Historty") #hover text
-            delete_btn.setFont(QFont("Times New Roman", 10, QFont.Bold))
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    border-radius: 12px;
-                    font-size: 10px;
-                    color: #c0392b;
-                    background: white;
-                    font-family: "Segoe UI Emoji", "Times New Roman";
-                    font-weight: bold;
-                    border: 2px solid #c0392b;
-                    padding:5px 10px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                    color: white;
-                }
-            """)
-            #connect click to delete function with transaction data
-            delete_btn.clicked.connect(partial(self.delete_transaction, trans))
-
-            # Center the button using layout
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.addStretch() #add space after button
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch() #add space after button
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-
-            #add delete button to last column 
-            self.hist_table.setCellWidget(row, 5, actions_widget)
-            self.hist_table.setRowHeight(row, 40) #set fixed row height 
-
-    #SEARCH TRANSACTION HISTORY BASED ON USER INPUT
-    def search_history(self):
-        #get search term from input field and convert to lowercase
-        search_term = self.hist_search_edit.text().lower()
-        #if search term is emty, show all history
-        if not search_term:
-            self.display_history()
+        if filtered_history is not None: #search results are shown as they are
+            self.hist_model.set_rows(filtered_history)
         else:
-            #filter transactions that match search term in any field
-            filtered_history = [
-        trans for trans in self.transactions
-        if (trans.get('action') == 'Returned' and  # Only returned transactions
-            (search_term in trans.get('book_title', '').lower() or  # Search book title
-             search_term in trans.get('borrower', '').lower() or  # Search borrower name
-             search_term in trans.get('returned_date', '').lower() or  # Search returned date
-             search_term in trans.get('action', '').lower()))  # Search action type
-    ]
-            #displayed filtered results
-            self.display_history(filtered_history)
+            #returned transactions for current librarian, one page at a time
+            self.hist_model.load(
+                lambda after, limit: self.borrow_books.fetch_transaction_feed(
+                    self.librarian_id, status="Returned", after=after, limit=limit),
+                feed_cursor)
+
+    #FALLBACK HISTORY SEARCH OVER THE LOADED ROWS, MATCHING ANY FIELD
+    def perform_local_history_search(self, search_term):
+        search_term = search_term.lower()
+        filtered_history = [
+            trans for trans in self.hist_model.rows()
+            if (search_term in trans.get('book_title', '').lower() or  # Search book title
+                search_term in trans.get('borrower', '').lower() or  # Search borrower name
+                search_term in trans.get('returned_date', '').lower() or  # Search returned date
+                search_term in trans.get('action', '').lower())  # Search action type
+        ]
+        #displayed filtered results
+        self.display_history(filtered_history)
 
     #REFRESH BOTH TRANSACTION AND HISTORY DISPLAYS WITH FRESH DATA
     def refresh_transaction_displays(self):
         """Refresh both transaction and history displays"""
         try:
             print("🔄 Refreshing transaction displays...")
-            # Fetch fresh data from database
-            self.transactions = self.borrow_books.fetch_all_transactions(self.librarian_id)
-            # Update both displays
+            # Update both displays, each fetches fresh data from database
             self.display_transactions()
             self.display_history()
             print("✅ Transaction displays refreshed successfully")
@@ -745,6 +591,15 @@ class LibraryTransactionSystem(QMainWindow):
             print(f"❌ Error refreshing displays: {e}")
             QMessageBox.warning(self, "Refresh Error", f"Failed to refresh transaction displays: {str(e)}")
 
+    #RELOAD BOTH TABLES WHEN NAVIGATION SHOWS THIS PAGE AGAIN AFTER THEIR DATA CHANGED
+    def refresh_page(self, changed_tables):
+        for search, display in ((self.trans_search, self.display_transactions),
+                                (self.hist_search, self.display_history)):
+            if search.text():
+                search.refresh() #keep the search the user left on screen
+            else:
+                display()
+
     #OPEN DIALOG TO ADD NEW TRANSACTION
     def open_add_transaction_form(self):
         #get available books from database
@@ -770,12 +625,10 @@ class LibraryTransactionSystem(QMainWindow):
             QMessageBox.warning(self, "Error", "Invalid transactionID")
             return
         
-        # Aggregate all transaction details for this TransactionID
-        related_transactions = [t for t in self.transactions if t['id'] == transaction_id]
-        #prepare book list for the transaction
+        #prepare book list for the transaction, already aggregated by the feed
         books = [
-            {'title': t['book_title'], 'quantity': t['quantity']}
-            for t in related_transactions
+            {'title': book['title'], 'quantity': book['quantity']}
+            for book in selected_transaction.get('books', [])
         ]
 
         # Create the transaction dictionary for PreviewTransactionForm
@@ -810,7 +663,6 @@ class LibraryTransactionSystem(QMainWindow):
                     )
                     if success:
                         # Refresh transactions and history
-                        self.transactions = self.borrow_books.fetch_all_transactions(self.librarian_id) or []
                         self.display_transactions()
                         self.display_history()
                     else: #error handling
@@ -823,49 +675,13 @@ class LibraryTransactionSystem(QMainWindow):
         if column == 5:  # Skip if clicking on delete button column
             return
         
-        # Get the current filtered transactions (same as display_transactions uses)
-        search_term = self.trans_search_edit.text().lower()
-        transaction_dict = {}
-        for trans in self.transactions:
-            if trans.get('action') != 'Borrowed': #skip returned transactions
-                continue
-
-            #group transactions by id and collect book details
-            trans_id = trans.get('id')
-            if trans_id not in transaction_dict:
-                transaction_dict[trans_id] = {
-                    'id': trans_id,
-                    'borrower': trans.get('borrower', 'N/A'),
-                    'date': trans.get('date', 'N/A'),
-                    'due_date': trans.get('due_date', 'N/A'),
-                    'action': trans.get('action', 'Borrowed'),
-                    'remarks': trans.get('remarks', ''),
-                    'books': [] #list to hold all books in this transactions
-                }
-            #add book details to the transaction
-            transaction_dict[trans_id]['books'].append ({
-                'title': trans.get('book_title', 'N/A'),
-                'quantity': trans.get('quantity', 1)
-            })
-            #conert dictionary values to list
-        active_transactions = list(transaction_dict.values())
-        
-        #apply search filter if search terms exists
-        if search_term:
-            filtered_transactions = [
-                trans for trans in active_transactions
-                if search_term in trans['borrower'].lower() or #match borrower name 
-                    any(search_term in book['title'].lower() for book in trans['books']) #match any book title
-            ]
-        else:
-            filtered_transactions = active_transactions
-            #validate row index
-        if row >= len(filtered_transactions):
+        # Use the row the table model holds
+        selected_transaction = self.trans_model.row_at(row)
+        if selected_transaction is None:
             print("Error: row index out of range")
             QMessageBox.critical(self, "Error", "Invalid transaction selected.")
             return
-        #get the selected transactions and open edit dialog
-        selected_transaction = filtered_transactions[row]
+        #open edit dialog for the selected transaction
         print(f"Open selected transaction:", selected_transaction)
         self.open_edit_transaction(selected_transaction)
 
@@ -889,12 +705,41 @@ class LibraryTransactionSystem(QMainWindow):
                 )
                 if success:
                     #refresh data id update was successful
-                    self.transactions= self.borrow_books.fetch_all_transactions(self.librarian_id)
                     self.display_transactions()
                     self.display_history()
             except Exception as e:#show error message if update fails
                 QMessageBox.critical(self, "Database Error", f"Failed to return transaction: {str(e)}")
 
+    #RETURN SEVERAL TRANSACTIONS IN ONE GO (END-OF-DAY DROP-BOX)
+    def open_return_many_dialog(self):
+        text, ok = QInputDialog.getText(
+            self,
+            "Drop-box Return",
+            "Transaction numbers to mark as returned (separated by commas or spaces):")
+        if not ok or not text.strip():
+            return
+        ids = [part for part in re.split(r"[,\s]+", text.strip().replace("#", "")) if part]
+        if not all(part.isdigit() for part in ids):
+            QMessageBox.warning(self, "Input Error", "Please enter transaction numbers only.")
+            return
+        try:
+            #all returns are saved in one database transaction
+            returned, skipped = self.borrow_books.return_many(ids, self.librarian_id)
+        except Exception as e: #nothing was saved
+            QMessageBox.critical(self, "Database Error", f"Failed to return transactions: {str(e)}")
+            return
+        message = f"{len(returned)} transaction(s) marked as returned."
+        if skipped:
+            message += "\n\nSkipped:\n" + "\n".join(skipped.values())
+        QMessageBox.information(self, "Drop-box Return", message)
+        if returned:
+            self.refresh_transaction_displays()
+
+    #HANDLE CLICKS ON THE DELETE COLUMN OF EITHER TABLE
+    def on_action_clicked(self, model, index):
+        if index.column() == 5 and model.row_at(index.row()) is not None:
+            self.delete_transaction(model.row_at(index.row()))
+
     #PERMANENTLY DELTE A TRANSACTION FROM THE DATABASE
     def delete_transaction(self, transaction):
         #show confirmation dialog
@@ -913,7 +758,6 @@ class LibraryTransactionSystem(QMainWindow):
                 #show success message
                 QMessageBox.information(self, "Success", f"Transaction {transaction} deleted successfully!")
                 #refresh data
-                self.transactions = self.borrow_books.fetch_all_transactions(self.librarian_id)
                 self.display_transactions()
                 self.display_history()
                 
@@ -923,7 +767,7 @@ class LibraryTransactionSystem(QMainWindow):
     # STYLING FOR TABLE WIDGETS
     def setup_table_style(self, table):
         table.setStyleSheet("""
-            QTableWidget { 
+            QTableView { 
                 background-color: white;
                 border: 1px solid #e8d8bd-;
                 border-radius: 8px;
@@ -931,11 +775,11 @@ class LibraryTransactionSystem(QMainWindow):
                 font-family: 'Times New Roman';
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border-bottom: 1px solid #f0f0f0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #f5f3ed;
                 color: #5e3e1f;
             }
@@ -958,32 +802,13 @@ class LibraryTransactionSystem(QMainWindow):
     def on_history_double_click(self, row, column):
         if column == 5:  # Skip if clicking on delete button column
             return
-        # Use the same data as display_history
-        search_term = self.hist_search_edit.text().lower()
-        #filter for returned transactions only
-        history_transactions = [t for t in self.transactions if t.get('action') == 'Returned']
-        #apply search filter if term exists
-        if search_term:
-            history_transactions = [
-                trans for trans in history_transactions
-                if (search_term in trans.get('book_title', '').lower() or #search book title
-                    search_term in trans.get('borrower', '').lower() or #search borrower
-                    search_term in trans.get('returned_date', '').lower() or #search return date
-                    search_term in trans.get('action', '').lower()) #search action type
-            ]
-        # sort transactions by return date (newest first), fallback to borrow date
-        sorted_transactions = sorted(
-            history_transactions,
-            key=lambda x: datetime.strptime(x.get('returned_date', x.get('date', '1970-01-01')), "%Y-%m-%d"),
-            reverse=True
-        )
-        #validate row index
-        if row >= len(sorted_transactions):
+        # Use the row the table model holds
+        transaction = self.hist_model.row_at(row)
+        if transaction is None:
             print("Error: row index out of range")
             QMessageBox.critical(self, "Error", "Invalid transaction selected.")
             return
-        #get selected transaction and open preview dialog
-        transaction = sorted_transactions[row]
+        #open preview dialog for the selected transaction
         print("Transaction passed to HistoryTransactionPreviewForm:", transaction)
         dialog = HistoryTransactionPreviewForm(transaction, self.librarian_id, self)
         dialog.exec()
@@ -1,106 +1,139 @@
 import os
-import sqlite3
+import json
+import threading
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+from db_connection import get_connection_manager
+from catalogue_cache import get_catalogue_cache
+from db_indexes import ensure_indexes
+from db_migrations import SCHEMA, run_migrations
+from search_index import SEARCH_LIMIT, search_books, prefix_matches, fuzzy_matches, table_exists
+
+# Primary key of each table that can be archived (isDeleted set), used to page archives
+ARCHIVE_KEYS = {"Book": "BookCode", "Member": "MemberID", "BookShelf": "ShelfId"}
+
+# Tables behind each cached catalogue read; a committed write to any of them reloads it
+RECORD_TABLES = {
+    "Book": ("Book",),
+    "Member": ("Member",),
+    "BookShelf": ("BookShelf",),
+    "BookAuthor": ("BookAuthor", "Book"),
+    "Book_Genre": ("Book_Genre", "Book"),
+}
+BOOK_DETAIL_TABLES = ("Book", "BookAuthor", "Book_Genre", "BookShelf")
+FEED_TABLES = ("BookTransaction", "TransactionDetails", "Book", "Member")
+COUNT_TABLES = {
+    "Book": ("Book",),
+    "Member": ("Member",),
+    "BookTransaction": ("BookTransaction", "TransactionDetails"),
+}
+
+
+# Group child rows (BookAuthor, Book_Genre, ...) by a key in one pass, so callers can
+# look up a book's authors with a dict lookup instead of scanning the whole list per book.
+def group_by_key(records, key, value):
+    grouped = {}
+    for record in records:
+        item = record.get(value)
+        if item:
+            grouped.setdefault(record.get(key), []).append(item)
+    return grouped
+
+
+def hash_password(password):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
+
+# Insert all rows with one prepared statement and return their generated row IDs in order.
+# The caller must hold the write lock (BEGIN IMMEDIATE, or an earlier write in the same
+# transaction) and let SQLite assign the keys: the new rowids are then consecutive, so
+# last_insert_rowid() and the number of inserted rows give every ID without a lookup.
+def insert_rows(cursor, tableName, columnOrder, rows):
+    columns = ', '.join(columnOrder)
+    placeholders = ', '.join(['?'] * len(columnOrder))
+    cursor.executemany(f"INSERT INTO {tableName} ({columns}) VALUES ({placeholders})", rows)
+    inserted = max(cursor.rowcount, 0)
+    if not inserted:
+        return []
+    last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last_id - inserted + 1, last_id + 1))
+
+
+# Only one DatabaseSeeder runs the startup migrations, even when windows and workers start together
+_initialize_lock = threading.Lock()
+
+
+class CheckoutError(Exception):
+    """A borrow that can't go through (unknown book, not enough copies); nothing was written"""
+
 
 class DatabaseSeeder:
     #initialize the path of the sqlite database
-    def __init__(self, db_path='bjrsLib.db'):
+    def __init__(self, db_path='bjrsLib.db', settings=None):
         self.db_path = db_path
+        #connections are shared per thread, so creating many seeders stays cheap
+        #settings override the WAL/cache tuning in db_connection.DEFAULT_SETTINGS
+        self.connection_manager = get_connection_manager(db_path, settings)
+        #catalogue reads are shared by every window and refreshed by the write methods below
+        self.catalogue = get_catalogue_cache(db_path)
+        #schema migrations run once per process, whichever window is opened first
+        if not self.connection_manager.initialized:
+            self.initialize_database()
 
 # This method returns a connection and cursor to the SQLite database.
+# The connection is reused per thread; calling close() on it only releases it.
     def get_connection_and_cursor(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection_manager.acquire()
         return conn, conn.cursor() 
+
+# This method runs once at startup. It applies the WAL journal and tuned PRAGMAs,
+# runs the schema migrations (PRAGMA user_version) and refreshes the index set.
+# A failure is raised, so the app never runs on a half-migrated schema, and the
+# next DatabaseSeeder tries again.
+    def initialize_database(self):
+        with _initialize_lock:
+            if self.connection_manager.initialized:
+                return None
+            try:
+                applied = self.connection_manager.initialize()
+                conn, cursor = self.get_connection_and_cursor()
+                try:
+                    applied["schema_version"] = run_migrations(conn)
+                    ensure_indexes(conn)
+                finally:
+                    conn.close()
+            except Exception as e:
+                print(f"✗ Error initializing database: {e}")
+                raise
+            self.connection_manager.initialized = True
+            print(f"✓ Database initialized (schema v{applied['schema_version']}, {applied['journal_mode']} journal)")
+            return applied
+
+# This method closes the pooled connections, running PRAGMA optimize first when enabled.
+    def shutdown(self):
+        self.connection_manager.close_all()
+        self.catalogue.close()
+
+# This method returns the open/reuse/close counters of the connection manager.
+    def connection_stats(self):
+        return self.connection_manager.stats()
+
+# This method serves a catalogue read from the shared cache, running loader() on a miss.
+# Commits no write method accounted for (a command-line import) are checked for first.
+    def cached_read(self, librarian_id, key, tables, loader):
+        self.catalogue.check_data_version()
+        return self.catalogue.read(librarian_id, key, tables, loader)
     
-  # This method returns the SQL query to create a table based on the table name provided.  
+  # This method returns the SQL query to create a table based on the table name provided.
+  # The statements live in db_migrations.SCHEMA, which the startup migrations apply.
     def query(self, tableName):
-        conn, cursor = self.get_connection_and_cursor()
-        conn.execute("PRAGMA foreign_keys = ON;")
-        
-        # ----Librarian Table----
-        if tableName == "Librarian":
-            return """CREATE TABLE IF NOT EXISTS Librarian (
-                LibrarianID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                LibUsername VARCHAR(20) NOT NULL,
-                FName VARCHAR(30) NOT NULL,
-                LName VARCHAR(20) NOT NULL,
-                MName VARCHAR(20), 
-                LibPass BLOB NOT NULL
-                )"""      
-
-        # ----Member Table ------
-        elif tableName == "Member":
-            return """CREATE TABLE Member(
-                    MemberID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                    MemberLN VARCHAR(20) NOT NULL,
-                    MemberMI VARCHAR(20),
-                    MemberFN VARCHAR (20) NOT NULL,
-                    MemberContact TEXT(11) NOT NULL,
-                    CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, 
-                    isDeleted TIMESTAMP DEFAULT NULL,
-                    LibrarianID INTEGER,
-                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID)
-                    )"""
-        elif tableName == "Book":
-            book =  """CREATE TABLE Book(
-                    BookCode INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                    BookTitle VARCHAR NOT NULL,
-                    Publisher VARCHAR NOT NULL,
-                    BookDescription VARCHAR NOT NULL,
-                    ISBN INTEGER NOT NULL,
-                    BookTotalCopies INTEGER NOT NULL,
-                    BookAvailableCopies INTEGER NOT NULL,
-                    BookCover BLOB,
-                    isDeleted TIMESTAMP DEFAULT NULL,
-                    LibrarianID INTEGER, 
-                    BookShelf VARCHAR(6),
-                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID),
-                    FOREIGN KEY (BookShelf) REFERENCES BookShelf(ShelfId))"""
-            Author = """CREATE TABLE BookAuthor(
-                    BookCode INTEGER,
-                    bookAuthor VARCHAR NOT NULL,
-                    PRIMARY KEY (BookCode, bookAuthor),
-                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))"""
-            Genre = """CREATE TABLE Book_Genre(
-                    BookCode INTEGER,
-                    Genre VARCHAR,
-                    PRIMARY KEY (BookCode, Genre), 
-                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))"""
-            Shelf = """CREATE TABLE BookShelf(
-                    ShelfId INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                    ShelfName VARCHAR(6) NOT NULL,
-                    LibrarianID INTEGER,
-                    isDeleted TIMESTAMP DEFAULT NULL,
-                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID))"""
-            return book, Author, Genre, Shelf
-        # ----BookTransaction Table ------
-        elif tableName == "BookTransaction":
-            return """CREATE TABLE IF NOT EXISTS BookTransaction(
-                    TransactionID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                    BorrowedDate TIMESTAMP NOT NULL,
-                    ReturnedDate TIMESTAMP DEFAULT NULL,
-                    Status VARCHAR(20) NOT NULL,
-                    Remarks VARCHAR(100) DEFAULT NULL,
-                    LibrarianID INTEGER,
-                    MemberID INTEGER,
-                    FOREIGN KEY (LibrarianID) REFERENCES Librarian (LibrarianID),
-                    FOREIGN KEY (MemberID) REFERENCES Member (MemberID))"""
-        elif tableName == "TransactionDetails":
-            return """CREATE TABLE IF NOT EXISTS TransactionDetails (
-                    DetailsID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                    Quantity INTEGER NOT NULL,
-                    DueDate TIMESTAMP NOT NULL,
-                    TransactionID INTEGER,
-                    BookCode INTEGER,
-                    FOREIGN KEY (TransactionID) REFERENCES BookTransaction (TransactionID),
-                    FOREIGN KEY (BookCode) REFERENCES Book (BookCode))"""
-        else:
-            return
+        if tableName == "Book":
+            return SCHEMA["Book"], SCHEMA["BookAuthor"], SCHEMA["Book_Genre"], SCHEMA["BookShelf"]
+        return SCHEMA.get(tableName)
 
     #create a table if it doest exists in the database
     def create_table(self, tableName):
         conn, cursor = self.get_connection_and_cursor()
-        conn.execute("PRAGMA foreign_keys = ON;")
 
         try:
             if tableName == "Book":
@@ -111,11 +144,13 @@ class DatabaseSeeder:
                 cursor.execute(shelfCreate)
                 conn.commit()
                 print("Book table created")
+                ensure_indexes(conn)
             else:
                 create = self.query(tableName)
                 cursor.execute(create)
                 conn.commit()
                 print("Table created")
+                ensure_indexes(conn)
                 return True
         except Exception as e: 
             print(f"Error creating table: {e}")
@@ -124,43 +159,221 @@ class DatabaseSeeder:
             conn.close()
 
     #insert the data into the database
+    #returns the new TransactionID for BookTransaction, True for other tables and None on error
     def seed_data(self, tableName, data, columnOrder, hashPass=None):
+        row_ids = self.seed_batch(tableName, data, columnOrder, hashPass)
+        if row_ids is None:
+            return None
+        if tableName == "BookTransaction":
+            return row_ids[-1] if row_ids else None
+        return True
+
+    #hash the password column of every row, on several threads when there are many (bcrypt releases the GIL)
+    def _hash_column(self, data, hashPass, hash_workers=None):
+        passwords = [row[hashPass] for row in data]
+        workers = min(hash_workers or os.cpu_count() or 1, len(passwords))
+        if workers <= 1:
+            return [hash_password(password) for password in passwords]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(hash_password, passwords))
+
+    #insert many rows in one transaction with a single prepared statement
+    #returns the generated row IDs in the order of data, or None on error (nothing is inserted then)
+    #inside a transaction the caller opened, the rows go into a savepoint and the caller
+    #commits (or rolls back) them together with the rest of its work
+    def seed_batch(self, tableName, data, columnOrder, hashPass=None, hash_workers=None):
+        data = list(data)
         conn, cursor = self.get_connection_and_cursor()
-        conn.execute("PRAGMA foreign_keys = ON;")
+        owns_transaction = savepoint = False
         try:
-            last_id = None
-            for i in data:
-                values = []
-                for col in columnOrder:
-                    value = i[col]
-                    if col == hashPass:
-                        value = bcrypt.hashpw(value.encode('utf-8'), bcrypt.gensalt())
-                    values.append(value)
-                placeholders = ', '.join(['?'] * len(columnOrder))
-                columns = ', '.join(columnOrder)
-
-                cursor.execute(f"INSERT INTO {tableName} ({columns}) VALUES ({placeholders})", values)
-                if tableName == "BookTransaction":
-                    last_id = cursor.lastrowid  # Capture the TransactionID
-                # If seeding BookTransaction with BookCode, add to TransactionDetails
-                if tableName == "BookTransaction" and "BookCode" in i:
-                    book_code = i["BookCode"]
-                    transaction_id = cursor.lastrowid
-                    due_date = i.get("DueDate", "")
-                    quantity = i.get("Quantity", 1)
-                    cursor.execute(
+            # hash before taking the write lock, it is by far the slowest step
+            hashed = self._hash_column(data, hashPass, hash_workers) if hashPass else None
+            rows = ([hashed[n] if hashed is not None and col == hashPass else row[col] for col in columnOrder]
+                    for n, row in enumerate(data))
+            owns_transaction = not conn.in_transaction
+            cursor.execute("BEGIN IMMEDIATE" if owns_transaction else "SAVEPOINT seed_batch")
+            savepoint = not owns_transaction
+            row_ids = insert_rows(cursor, tableName, columnOrder, rows)
+            # If seeding BookTransaction with BookCode, add to TransactionDetails
+            if tableName == "BookTransaction":
+                details = [(row.get("Quantity", 1), row.get("DueDate", ""), transaction_id, row["BookCode"])
+                           for transaction_id, row in zip(row_ids, data) if "BookCode" in row]
+                if details:
+                    cursor.executemany(
                         "INSERT INTO TransactionDetails (Quantity, DueDate, TransactionID, BookCode) VALUES (?, ?, ?, ?)",
-                        (quantity, due_date, transaction_id, book_code)
-                    )
-            conn.commit()
+                        details)
+            if owns_transaction:
+                conn.commit()
+                self.catalogue.invalidate(tableName)
+            else:
+                # the caller's commit isn't accounted for by invalidate(), so the catalogue
+                # cache notices it through data_version
+                cursor.execute("RELEASE SAVEPOINT seed_batch")
             print(f"✓ Seeded {len(data)} rows into {tableName}")
-            return last_id if tableName == "BookTransaction" else True
+            return row_ids
         except Exception as e:
+            if owns_transaction:
+                conn.rollback()
+            elif savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT seed_batch")
+                cursor.execute("RELEASE SAVEPOINT seed_batch")
             print(f"Error seeding data into {tableName}: {e}")
             return None
         finally:
             conn.close()
 
+    #borrow books in a single transaction: the stock updates, the BookTransaction row and its
+    #TransactionDetails rows commit together or not at all. books is a list of
+    #{"book": title, "quantity": n} as AddTransactionForm.get_books_data returns it.
+    #returns the new TransactionID; raises CheckoutError when a book is unknown or short of copies
+    def checkout(self, member_id, librarian_id, books, borrow_date, due_date, remarks=None):
+        quantities = {}
+        for item in books:
+            quantities[item["book"]] = quantities.get(item["book"], 0) + int(item["quantity"])
+        if not quantities:
+            raise CheckoutError("Please add at least one book.")
+        if min(quantities.values()) < 1:
+            raise CheckoutError("Quantities must be at least 1.")
+
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            # take the write lock up front so the whole borrow is one commit
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("""SELECT BookTitle, BookCode FROM Book
+                              WHERE LibrarianID = ? AND isDeleted IS NULL
+                              AND BookTitle IN (SELECT value FROM json_each(?))""",
+                           (librarian_id, json.dumps(list(quantities))))
+            codes = dict(cursor.fetchall())
+            for title, quantity in quantities.items():
+                if title not in codes:
+                    raise CheckoutError(f"Book '{title}' not found in the library.")
+                # checking and taking the copies is one statement, so the last copy can't be lent twice
+                cursor.execute("""UPDATE Book SET BookAvailableCopies = BookAvailableCopies - ?
+                                  WHERE BookCode = ? AND BookAvailableCopies >= ?""",
+                               (quantity, codes[title], quantity))
+                if cursor.rowcount != 1:
+                    raise CheckoutError(f"Not enough copies of '{title}' available.")
+
+            cursor.execute("""INSERT INTO BookTransaction (BorrowedDate, Status, Remarks, LibrarianID, MemberID)
+                              VALUES (?, 'Borrowed', ?, ?, ?)""",
+                           (borrow_date, remarks, librarian_id, member_id))
+            transaction_id = cursor.lastrowid
+            cursor.executemany("""INSERT INTO TransactionDetails (Quantity, DueDate, TransactionID, BookCode)
+                                  VALUES (?, ?, ?, ?)""",
+                               [(quantity, due_date, transaction_id, codes[title])
+                                for title, quantity in quantities.items()])
+            conn.commit()
+            self.catalogue.invalidate("Book", "BookTransaction", "TransactionDetails")
+            print(f"✓ Checked out {sum(quantities.values())} book(s) in transaction #{transaction_id}")
+            return transaction_id
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    #mark borrowed transactions as returned and put their copies back, in one database transaction.
+    #transactions are read by key and the stock is incremented in SQL, so a borrow committed in
+    #the meantime is never overwritten. returns {TransactionID: reason} for the ids that were
+    #skipped (not found, not borrowed, no details); every other id was returned
+    def return_transactions(self, transaction_ids, librarian_id, returned_date, remarks=None):
+        ids = list(dict.fromkeys(int(transaction_id) for transaction_id in transaction_ids))
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("""SELECT t.TransactionID, t.Status, COUNT(td.DetailsID)
+                              FROM BookTransaction t
+                              LEFT JOIN TransactionDetails td ON td.TransactionID = t.TransactionID
+                              WHERE t.TransactionID IN (SELECT value FROM json_each(?)) AND t.LibrarianID = ?
+                              GROUP BY t.TransactionID""", (json.dumps(ids), librarian_id))
+            found = {transaction_id: (status, details) for transaction_id, status, details in cursor.fetchall()}
+            skipped = {}
+            for transaction_id in ids:
+                if transaction_id not in found:
+                    skipped[transaction_id] = f"Transaction #{transaction_id} not found or already deleted."
+                elif found[transaction_id][0] != "Borrowed":
+                    skipped[transaction_id] = f"Transaction #{transaction_id} is not in 'Borrowed' status."
+                elif not found[transaction_id][1]:
+                    skipped[transaction_id] = f"No valid transaction details found for Transaction #{transaction_id}."
+
+            returning = json.dumps([transaction_id for transaction_id in ids if transaction_id not in skipped])
+            # one relative increment per book, summed over every returned transaction
+            cursor.execute("""UPDATE Book SET BookAvailableCopies = BookAvailableCopies + (
+                                  SELECT SUM(td.Quantity) FROM TransactionDetails td
+                                  WHERE td.BookCode = Book.BookCode
+                                  AND td.TransactionID IN (SELECT value FROM json_each(?)))
+                              WHERE BookCode IN (SELECT td.BookCode FROM TransactionDetails td
+                                                 WHERE td.TransactionID IN (SELECT value FROM json_each(?)))""",
+                           (returning, returning))
+            cursor.execute("""UPDATE BookTransaction SET Status = 'Returned', ReturnedDate = ?, Remarks = COALESCE(?, Remarks)
+                              WHERE TransactionID IN (SELECT value FROM json_each(?))""",
+                           (returned_date, remarks, returning))
+            conn.commit()
+            self.catalogue.invalidate("Book", "BookTransaction")
+            print(f"✓ Returned {len(ids) - len(skipped)} transaction(s), skipped {len(skipped)}")
+            return skipped
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    #one row per transaction with its books aggregated in SQL, newest first. status ("Borrowed",
+    #"Returned") and transaction_ids narrow the feed in the WHERE clause. Books and members that
+    #were archived come back as None names, like the old per-table lookups. limit and after
+    #page through it: pass the (BorrowedDate, TransactionID) of the last row to get the next page.
+    #the first page of a feed is what the transactions page opens with, so it is cached with the catalogue.
+    #errors are raised, so a search worker can report them (BorrowBooks.fetch_transaction_feed shows them)
+    def get_transaction_feed(self, librarian_id, status=None, transaction_ids=None, after=None, limit=None):
+        if after is None and transaction_ids is None and limit is not None:
+            return self.cached_read(librarian_id, ("feed", status, limit), FEED_TABLES,
+                                    lambda: self._load_transaction_feed(librarian_id, status, None, None, limit))
+        return self._load_transaction_feed(librarian_id, status, transaction_ids, after, limit)
+
+    def _load_transaction_feed(self, librarian_id, status, transaction_ids, after, limit):
+        conditions, params = ["t.LibrarianID = ?"], [librarian_id]
+        if status is not None:
+            conditions.append("t.Status = ?")
+            params.append(status)
+        if transaction_ids is not None:
+            conditions.append("t.TransactionID IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([int(transaction_id) for transaction_id in transaction_ids]))
+        if after is not None:
+            #keyset pagination: continue after the (BorrowedDate, TransactionID) of the last row shown
+            conditions.append("(t.BorrowedDate, t.TransactionID) < (?, ?)")
+            params.extend(after)
+        params.append(-1 if limit is None else limit)
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            #transactions are walked newest first along the index and their books are
+            #aggregated per row, so a page costs the same however long the history is
+            cursor.execute(f"""
+                SELECT t.TransactionID, t.BorrowedDate, t.ReturnedDate, t.Status, t.Remarks, t.MemberID,
+                       m.MemberFN, m.MemberMI, m.MemberLN,
+                       (SELECT json_object('DueDate', MIN(td.DueDate), 'Quantity', SUM(td.Quantity),
+                                           'Books', json_group_array(json_object(
+                                               'BookCode', td.BookCode, 'BookTitle', b.BookTitle,
+                                               'Quantity', td.Quantity, 'DueDate', td.DueDate)))
+                        FROM TransactionDetails td
+                        LEFT JOIN Book b ON b.BookCode = td.BookCode AND b.isDeleted IS NULL
+                        WHERE td.TransactionID = t.TransactionID) AS Details
+                FROM BookTransaction t
+                LEFT JOIN Member m ON m.MemberID = t.MemberID AND m.isDeleted IS NULL
+                WHERE {" AND ".join(conditions)}
+                  AND EXISTS (SELECT 1 FROM TransactionDetails td WHERE td.TransactionID = t.TransactionID)
+                ORDER BY t.BorrowedDate DESC, t.TransactionID DESC
+                LIMIT ?
+            """, params)
+            columns = [desc[0] for desc in cursor.description]
+            records = []
+            for row in cursor.fetchall():
+                record = dict(zip(columns, row))
+                record.update(json.loads(record.pop("Details")))
+                records.append(record)
+            return records
+        finally:
+            conn.close()
+
     #get borrowed transaction from joined tables
     def get_borrowed_transactions(self, librarian_id):
         try:
@@ -263,7 +476,18 @@ class DatabaseSeeder:
             conn.close()
     
     #to get all the records/rows inside the certain table
+    #active Book, Member, BookShelf, BookAuthor and Book_Genre rows come from the catalogue cache
     def get_all_records(self, tableName, id):
+        try:
+            if tableName in RECORD_TABLES:
+                return self.cached_read(id, ("records", tableName), RECORD_TABLES[tableName],
+                                        lambda: self._load_records(tableName, id))
+            return self._load_records(tableName, id)
+        except Exception as e:
+            print(f"✗ Error fetching records from {tableName}: {e}")
+            return [] #return empty list if error
+
+    def _load_records(self, tableName, id):
         conn, cursor = self.get_connection_and_cursor()
         try:
             if tableName == "Librarian":
@@ -301,19 +525,78 @@ class DatabaseSeeder:
             columns = [desc[0] for desc in cursor.description]
             records = [dict(zip(columns, row)) for row in rows]
             return records
+        finally:
+            conn.close()
+
+    # This method returns fully assembled active books for a librarian in one query: every Book column
+    # plus "Authors" and "Genres" lists and the "ShelfName". Pass book_codes to load only those books
+    # (returned in the same order); otherwise the whole catalogue is returned by BookCode, from the
+    # catalogue cache when nothing behind it has been written since the last load.
+    def get_books_with_details(self, librarian_id, book_codes=None):
+        try:
+            if book_codes is None:
+                return self.cached_read(librarian_id, ("books_with_details",), BOOK_DETAIL_TABLES,
+                                        lambda: self._load_books_with_details(librarian_id))
+            return self._load_books_with_details(librarian_id, book_codes)
         except Exception as e:
-            print(f"✗ Error fetching records from {tableName}: {e}")
-            return [] #return empty list if error
+            print(f"✗ Error fetching book details: {e}")
+            return []
+
+    def _load_books_with_details(self, librarian_id, book_codes=None):
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            query = """
+                SELECT b.*,
+                    (SELECT json_group_array(ba.bookAuthor) FROM BookAuthor AS ba
+                        WHERE ba.BookCode = b.BookCode) AS Authors,
+                    (SELECT json_group_array(bg.Genre) FROM Book_Genre AS bg
+                        WHERE bg.BookCode = b.BookCode AND bg.Genre IS NOT NULL) AS Genres,
+                    s.ShelfName
+                FROM Book AS b
+                LEFT JOIN BookShelf AS s ON s.ShelfId = b.BookShelf
+                    AND s.isDeleted IS NULL AND s.LibrarianID = b.LibrarianID
+                WHERE b.isDeleted IS NULL AND b.LibrarianID = ?
+            """
+            parameters = [librarian_id]
+            if book_codes is not None:
+                if not book_codes:
+                    return []
+                query += " AND b.BookCode IN (SELECT value FROM json_each(?))"
+                parameters.append(json.dumps(list(book_codes)))
+            else:
+                query += " ORDER BY b.BookCode"
+            cursor.execute(query, parameters)
+            columns = [desc[0] for desc in cursor.description]
+            records = []
+            for row in cursor.fetchall():
+                record = dict(zip(columns, row))
+                record["Authors"] = json.loads(record["Authors"]) if record["Authors"] else []
+                record["Genres"] = json.loads(record["Genres"]) if record["Genres"] else []
+                records.append(record)
+            if book_codes is not None:
+                #keep the order the caller asked for (sorted, ranked search results, ...)
+                by_code = {record["BookCode"]: record for record in records}
+                records = [by_code[code] for code in book_codes if code in by_code]
+            return records
         finally:
             conn.close()
 
+    # This method adds authors, genres and shelf name to Book rows returned by another query
+    # (filterBooks, search_records, ...) while keeping their order.
+    def hydrate_books(self, book_records, librarian_id):
+        book_codes = []
+        seen = set()
+        for book in book_records:
+            code = book.get("BookCode")
+            if code is not None and code not in seen:
+                seen.add(code)
+                book_codes.append(code)
+        return self.get_books_with_details(librarian_id, book_codes)
+
     #update the row of a specific table
     def update_table(self, tableName, updates: dict, column, value):
         conn, cursor = self.get_connection_and_cursor()
         try:
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON;")
-            
             set_clause = ', '.join([f"{col} = ?" for col in updates])
             values = list(updates.values()) + [value]
             #update statement
@@ -325,6 +608,7 @@ class DatabaseSeeder:
             cursor.execute(query, values)
             rows_affected = cursor.rowcount
             conn.commit()
+            self.catalogue.invalidate(tableName)
             
             if rows_affected > 0:
                 print(f"✓ Row in '{tableName}' where {column} = {value} updated successfully. ({rows_affected} row(s) affected)")
@@ -358,6 +642,7 @@ class DatabaseSeeder:
                 #delete the BookTransaction record
                 cursor.execute(f"DELETE FROM BookTransaction WHERE {column} = ?", (value,))
                 conn.commit()
+                self.catalogue.invalidate(tableName)
                 print(f"Successfully deleted from {tableName} and TransactionDetails WHERE {column} ={value}")
                 return True
             
@@ -371,6 +656,7 @@ class DatabaseSeeder:
                 cursor.execute(updateBook, (value, librarian_id))
                 
                 conn.commit()
+                self.catalogue.invalidate(tableName)
                 print(f"✓ Soft deleted shelf from {tableName} where {column} = {value}")
                 print(f"✓ Updated books to set BookShelf = NULL for ShelfId {value} and librarian {librarian_id}")
                 return True
@@ -379,6 +665,7 @@ class DatabaseSeeder:
                 query = f"UPDATE {tableName} SET isDeleted = CURRENT_TIMESTAMP WHERE {column} = ?"
                 cursor.execute(query, (value,))
                 conn.commit()
+                self.catalogue.invalidate(tableName)
                 print(f"✓ Deleted from {tableName} where {column} = {value}")
 
         except Exception as e:
@@ -509,6 +796,7 @@ class DatabaseSeeder:
             hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
             cursor.execute("UPDATE Librarian SET LibPass = ? WHERE LibUsername = ?", (hashed_password, username))
             conn.commit()
+            self.catalogue.invalidate("Librarian")
             if cursor.rowcount > 0:
                 print(f" Password for {username} updated successfully.")
                 return True
@@ -526,10 +814,7 @@ class DatabaseSeeder:
 
  # This method verifies the current password of a librarian.   
     def verify_current_password(self, email, current_password):
-        import sqlite3
-        import bcrypt
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn, cursor = self.get_connection_and_cursor()
         cursor.execute("SELECT LibPass FROM Librarian WHERE LibUsername = ?", (email,))
         row = cursor.fetchone()
         conn.close()
@@ -543,6 +828,14 @@ class DatabaseSeeder:
 
 # This method retrieves archived records from a specific table based on the table name and librarian ID.  
     def archiveTable(self, tableName, id):
+        try:
+            return self.cached_read(id, ("archive", tableName), RECORD_TABLES.get(tableName, ("BookShelf",)),
+                                    lambda: self._load_archive(tableName, id))
+        except Exception as e:
+            print(f"✗ Error fetching archived records from {tableName}: {e}")
+            return []
+
+    def _load_archive(self, tableName, id):
         conn, cursor = self.get_connection_and_cursor()
         try:
             if tableName == "Book":
@@ -573,7 +866,32 @@ class DatabaseSeeder:
             
             print(f"✓ Retrieved {len(records)} archived records from {tableName}")
             return records
+        finally:
+            conn.close()
 
+    # One page of archived rows, newest deletion first. after is the (isDeleted, primary key)
+    # of the last row already shown; archived books come with their authors and genres.
+    def get_archive_page(self, tableName, librarian_id, after=None, limit=100):
+        key = ARCHIVE_KEYS[tableName]
+        columns = "a.*"
+        if tableName == "Book":
+            columns += """,
+                (SELECT group_concat(ba.bookAuthor, ', ') FROM BookAuthor AS ba
+                    WHERE ba.BookCode = a.BookCode) AS Authors,
+                (SELECT group_concat(bg.Genre, ', ') FROM Book_Genre AS bg
+                    WHERE bg.BookCode = a.BookCode AND bg.Genre IS NOT NULL) AS Genres"""
+        query = f"SELECT {columns} FROM {tableName} AS a WHERE a.isDeleted IS NOT NULL AND a.LibrarianID = ?"
+        params = [librarian_id]
+        if after is not None:
+            query += f" AND (a.isDeleted, a.{key}) < (?, ?)"
+            params.extend(after)
+        query += f" ORDER BY a.isDeleted DESC, a.{key} DESC LIMIT ?"
+        params.append(limit)
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            cursor.execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
         except Exception as e:
             print(f"✗ Error fetching archived records from {tableName}: {e}")
             return []
@@ -598,6 +916,7 @@ class DatabaseSeeder:
                 print(f"✓ Restored BookShelf with ShelfId {PKColumn}")
             
             conn.commit()
+            self.catalogue.invalidate(tableName)
             return True
         except Exception as e:
             print(f"✗ Error restoring archive from {tableName}: {e}")
@@ -632,20 +951,30 @@ class DatabaseSeeder:
         finally:
             conn.close()
 
+# This method counts the active (not archived) rows a librarian has in Book, Member
+# or BookShelf, e.g. to size a read before making it.
+    def count_records(self, tableName, id):
+        if tableName not in ARCHIVE_KEYS:
+            raise ValueError(f"Cannot count records of {tableName}")
+        conn, cursor = self.get_connection_and_cursor()
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM {tableName} WHERE isDeleted IS NULL AND LibrarianID = ?", (id,))
+            return cursor.fetchone()[0]
+        finally:
+            conn.close()
+
 # This method counts the number of records in a specific table for the dashboard.
+# The counts are cached with the catalogue until the tables they sum are written.
     def dashboardCount (self, tableName, id):
+        if tableName in COUNT_TABLES:
+            return self.cached_read(id, ("count", tableName), COUNT_TABLES[tableName],
+                                    lambda: self._count(tableName, id))
+        return self._count(tableName, id)
+
+    def _count(self, tableName, id):
         #get databse connecttion and curosr
         conn, cursor = self.get_connection_and_cursor()
         try:
-            #create table after log in entry
-            self.create_table("Book")
-            self.create_table("Member")
-            self.create_table("BookTransaction")
-            self.create_table("BookShelf")
-            self.create_table("BookAuthor")
-            self.create_table("Book_Genre")
-            self.create_table("TransactionDetails")
-
             if tableName == "Book": 
                 #query to get total boo copies (dont innclude deleted ones)
                 query = "SELECT SUM(BookTotalCopies) FROM Book WHERE isDeleted is NULL AND LibrarianID = ?" 
@@ -735,18 +1064,40 @@ class DatabaseSeeder:
             conn.close()
 
 # This method searches for active records in a specific table based on search text.
-    def search_records(self, tableName, search_text, librarian_id):
+# Books are looked up in their FTS5 index; substring=True asks for a (slower) LIKE
+# search that also matches inside words. Members and transactions are looked up in
+# their FTS5 indexes (word prefixes); with fuzzy=True a trigram match also tolerates
+# typos. They fall back to LIKE only where SQLite lacks FTS5 or the trigram tokenizer.
+    def search_records(self, tableName, search_text, librarian_id, fuzzy=False, substring=False):
         """Search active records based on search text"""
         conn, cursor = self.get_connection_and_cursor()
         try:
             search_pattern = f"%{search_text}%"
+            matched_ids = None  # None: the index can't answer, search with LIKE
+            if tableName in ("Member", "BookTransaction"):
+                index = "MemberSearch" if tableName == "Member" else "TransactionSearch"
+                matched_ids = prefix_matches(conn, index, search_text, librarian_id)
+                if matched_ids == [] and fuzzy:
+                    trigram_index = "MemberTrigram" if tableName == "Member" else "TransactionTrigram"
+                    if table_exists(conn, trigram_index):
+                        matched_ids = fuzzy_matches(conn, trigram_index, search_text, librarian_id) or []
+                    else:
+                        matched_ids = None  # no trigram tokenizer, LIKE stands in for typo tolerance
+                if matched_ids == []:
+                    print(f"✓ Found 0 {tableName} records matching '{search_text}'")
+                    return []
             
             if tableName == "Book":
-                # Search in Book table with author and genre joins
+                # Ranked full-text search (every word a prefix), top SEARCH_LIMIT books.
+                # LIKE runs only for an explicit mid-word search or when the index can't answer.
+                records = None if substring else search_books(conn, search_text, librarian_id)
+                if records is not None:
+                    print(f"✓ Found {len(records)} {tableName} records matching '{search_text}'")
+                    return records
+                # Walk the books in title order, checking authors and genres per book,
+                # and stop at SEARCH_LIMIT matches
                 query = """
-                    SELECT DISTINCT b.* FROM Book b
-                    LEFT JOIN BookAuthor ba ON b.BookCode = ba.BookCode
-                    LEFT JOIN Book_Genre bg ON b.BookCode = bg.BookCode
+                    SELECT b.* FROM Book b
                     WHERE b.isDeleted IS NULL 
                     AND b.LibrarianID = ? 
                     AND (
@@ -754,13 +1105,24 @@ class DatabaseSeeder:
                         b.ISBN LIKE ? OR 
                         b.Publisher LIKE ? OR
                         b.BookDescription LIKE ? OR
-                        ba.bookAuthor LIKE ? OR
-                        bg.Genre LIKE ?
+                        EXISTS (SELECT 1 FROM BookAuthor ba WHERE ba.BookCode = b.BookCode AND ba.bookAuthor LIKE ?) OR
+                        EXISTS (SELECT 1 FROM Book_Genre bg WHERE bg.BookCode = b.BookCode AND bg.Genre LIKE ?)
                     )
                     ORDER BY b.BookTitle ASC
+                    LIMIT ?
                 """
-                cursor.execute(query, (librarian_id, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern))
+                cursor.execute(query, (librarian_id, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, SEARCH_LIMIT))
                 
+            elif tableName == "Member" and matched_ids:
+                query = """
+                    SELECT * FROM Member 
+                    WHERE isDeleted IS NULL 
+                    AND LibrarianID = ? 
+                    AND MemberID IN (SELECT value FROM json_each(?))
+                    ORDER BY MemberLN ASC, MemberFN ASC
+                """
+                cursor.execute(query, (librarian_id, json.dumps(matched_ids)))
+
             elif tableName == "Member":
                 query = """
                     SELECT * FROM Member 
@@ -776,6 +1138,24 @@ class DatabaseSeeder:
                 """
                 cursor.execute(query, (librarian_id, search_pattern, search_pattern, search_pattern, search_pattern))
                 
+            elif tableName == "BookTransaction" and matched_ids:
+                # Transactions found by the full-text index, with related book and member data
+                query = """
+                    SELECT t.TransactionID, t.BorrowedDate, t.Status, t.ReturnedDate, t.Remarks,
+                           m.MemberID, m.MemberFN || ' ' || m.MemberLN AS borrower,
+                           b.BookCode, b.BookTitle, td.Quantity, td.DueDate
+                    FROM BookTransaction t
+                    JOIN TransactionDetails td ON t.TransactionID = td.TransactionID
+                    JOIN Member m ON t.MemberID = m.MemberID
+                    JOIN Book b ON td.BookCode = b.BookCode
+                    WHERE b.isDeleted IS NULL
+                    AND m.isDeleted IS NULL
+                    AND t.LibrarianID = ?
+                    AND t.TransactionID IN (SELECT value FROM json_each(?))
+                    ORDER BY t.BorrowedDate DESC
+                """
+                cursor.execute(query, (librarian_id, json.dumps(matched_ids)))
+
             elif tableName == "BookTransaction":
                 # Search in transactions with related book and member data
                 query = """
@@ -798,7 +1178,7 @@ class DatabaseSeeder:
                     )
                     ORDER BY t.BorrowedDate DESC
                 """
-                cursor.execute(query, (librarian_id, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern))
+                cursor.execute(query, (librarian_id, search_pattern, search_pattern, search_pattern, search_pattern, search_pattern))
                 
             elif tableName == "BookShelf":
                 query = """
@@ -832,5 +1212,70 @@ class DatabaseSeeder:
         finally:
             conn.close()
 
+# Time loading a whole catalogue with get_books_with_details() at growing sizes.
+# The time per book should stay flat; the old per-book list scans are timed
+# next to it (up to scan_limit books) for comparison.
+def benchmark_book_details(sizes=(1000, 2000, 4000, 8000, 16000, 32000), scan_limit=8000):
+    import time
+    import tempfile
+
+    results = []
+    for size in sizes:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        seeder = DatabaseSeeder(path, settings={"optimize_on_close": False})
+        try:
+            conn, cursor = seeder.get_connection_and_cursor()
+            try:
+                cursor.execute("INSERT INTO Librarian (LibrarianID, LibUsername, FName, LName, LibPass) "
+                               "VALUES (1, 'bench', 'Bench', 'Mark', 'x')")
+                cursor.executemany("INSERT INTO BookShelf (ShelfName, LibrarianID) VALUES (?, 1)",
+                                   ((f"S{i}",) for i in range(50)))
+                cursor.executemany(
+                    "INSERT INTO Book (BookTitle, Publisher, BookDescription, ISBN, BookTotalCopies, "
+                    "BookAvailableCopies, LibrarianID, BookShelf) VALUES (?, 'Publisher', '', ?, 1, 1, 1, ?)",
+                    ((f"Title {i}", 9780000000000 + i, str(i % 50 + 1)) for i in range(size)))
+                cursor.executemany("INSERT INTO BookAuthor (BookCode, bookAuthor) VALUES (?, ?)",
+                                   ((i + 1, f"Author {i % 997}") for i in range(size)))
+                cursor.executemany("INSERT INTO Book_Genre (BookCode, Genre) VALUES (?, ?)",
+                                   ((i + 1, f"Genre {i % 20}") for i in range(size)))
+                conn.commit()
+            finally:
+                conn.close()
+
+            start = time.perf_counter()
+            books = seeder.get_books_with_details(1)
+            batched = time.perf_counter() - start
+
+            scanned = None
+            if size <= scan_limit:
+                start = time.perf_counter()
+                rows = seeder.get_all_records("Book", 1)
+                authors = seeder.get_all_records("BookAuthor", 1)
+                genres = seeder.get_all_records("Book_Genre", 1)
+                for book in rows:
+                    [a["bookAuthor"] for a in authors if a.get("BookCode") == book["BookCode"]]
+                    [g["Genre"] for g in genres if g.get("BookCode") == book["BookCode"]]
+                scanned = time.perf_counter() - start
+            results.append((size, len(books), batched, scanned))
+        finally:
+            seeder.shutdown()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+    return results
+
+
 if __name__ == "__main__":
-    seeder = DatabaseSeeder()
\ No newline at end of file
+    import sys
+
+    if sys.argv[1:2] == ["bench"]:
+        # python tryDatabase.py bench [size ...] -> time per book should stay flat as the catalogue grows
+        sizes = tuple(int(arg) for arg in sys.argv[2:]) or (1000, 2000, 4000, 8000, 16000, 32000)
+        for size, loaded, batched, scanned in benchmark_book_details(sizes):
+            line = f"{size:7d} books  batched {batched * 1000:9.1f} ms ({batched / loaded * 1e6:6.1f} us/book)"
+            if scanned is not None:
+                line += f"  per-book scans {scanned * 1000:9.1f} ms ({scanned / loaded * 1e6:8.1f} us/book)"
+            print(line)
+    else:
+        seeder = DatabaseSeeder()